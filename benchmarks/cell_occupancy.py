@@ -0,0 +1,53 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity
+from fizgrid.utils import Shape
+import time
+
+# Measures route planning cost as the number of reservations in each cell along the route grows.
+# The "dict" store keeps a sorted interval index per cell while the "array" store scans every reservation in a cell.
+
+ITERATIONS = 50
+START_TIME = 10000
+
+
+def time_planning(cell_store, occupancy):
+    grid = Grid(
+        name="bench_grid",
+        x_size=50,
+        y_size=10,
+        max_time=100000,
+        add_exterior_walls=False,
+        cell_store=cell_store,
+    )
+    amr = grid.add_entity(
+        Entity(
+            name="AMR",
+            shape=Shape.rectangle(x_len=1, y_len=1),
+            x_coord=5,
+            y_coord=5,
+        )
+    )
+    # Fill the cells along the route with reservations that have already finished
+    # Note: The array store only holds integer entity ids
+    cells = grid.__cells__
+    for x_cell in range(50):
+        for y_cell in range(3, 7):
+            for idx in range(occupancy):
+                t_start = idx * START_TIME / occupancy
+                cells.add(x_cell, y_cell, t_start, t_start + 1, -1)
+    # Move the grid forward in time so planning happens after the existing reservations
+    grid.add_event(time=START_TIME, object=amr, method="get_time")
+    grid.resolve_next_state()
+
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        amr.check_route(waypoints=[(45, 5, 40)])
+    return (time.perf_counter() - start) / ITERATIONS * 1000
+
+
+print("cell_occupancy.py")
+print(f"{'reservations/cell':>18} {'dict (ms)':>10} {'array (ms)':>11}")
+for occupancy in [1, 10, 100, 1000]:
+    dict_ms = time_planning("dict", occupancy)
+    array_ms = time_planning("array", occupancy)
+    print(f"{occupancy:>18} {dict_ms:>10.3f} {array_ms:>11.3f}")
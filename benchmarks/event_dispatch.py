@@ -0,0 +1,98 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity
+from fizgrid.utils import Shape
+import random, time
+
+# Measures event dispatch throughput (events per second).
+# The ticker workload isolates dispatch overhead: each event only schedules the next one.
+# The AMR workload drives random walking AMRs through the full route planning stack.
+
+
+class Ticker:
+    def __init__(self, grid, ticks):
+        self.grid = grid
+        self.ticks = ticks
+
+    def tick(self, step):
+        if step < self.ticks:
+            self.grid.add_event(
+                time=self.grid.get_time() + random.randint(1, 10),
+                object=self,
+                method="tick",
+                kwargs={"step": step + 1},
+            )
+
+
+class AMR(Entity):
+    def __init__(self, *args, legs, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.legs = legs
+        self.last_route_time = None
+
+    def on_realize(self, **kwargs):
+        # Multiple collisions at the same time realize this AMR more than once
+        if self.legs > 0 and self.last_route_time != self.get_time():
+            self.legs -= 1
+            self.last_route_time = self.get_time()
+            self.add_route(
+                waypoints=[
+                    (
+                        min(max(self.x_coord + random.uniform(-3, 3), 2), 98),
+                        min(max(self.y_coord + random.uniform(-3, 3), 2), 98),
+                        random.uniform(1, 3),
+                    )
+                ]
+            )
+
+
+def build_ticker_grid():
+    grid = Grid(name="ticker", x_size=10, y_size=10, add_exterior_walls=False)
+    for _ in range(100):
+        ticker = Ticker(grid, ticks=500)
+        grid.add_event(time=0, object=ticker, method="tick", kwargs={"step": 0})
+    return grid
+
+
+def build_amr_grid():
+    grid = Grid(name="amrs", x_size=100, y_size=100, max_time=100000)
+    for idx in range(40):
+        # Placing each AMR realizes it, which starts its random walk
+        grid.add_entity(
+            AMR(
+                name=f"AMR{idx}",
+                shape=Shape.rectangle(x_len=1, y_len=1, round_to=2),
+                x_coord=5 + (idx % 8) * 12,
+                y_coord=5 + (idx // 8) * 18,
+                legs=50,
+            )
+        )
+    return grid
+
+
+def run_resolve_next_state(grid):
+    while grid.resolve_next_state():
+        pass
+
+
+def run_simulate(grid):
+    grid.simulate()
+
+
+print("event_dispatch.py")
+print(f"{'workload':>9} {'loop':>19} {'events':>8} {'events/s':>10}")
+for workload, build_grid in [
+    ("ticker", build_ticker_grid),
+    ("amr", build_amr_grid),
+]:
+    for loop, run in [
+        ("resolve_next_state", run_resolve_next_state),
+        ("simulate", run_simulate),
+    ]:
+        random.seed(42)
+        grid = build_grid()
+        start = time.perf_counter()
+        run(grid)
+        elapsed = time.perf_counter() - start
+        # Both loops process the same events, so count every event that was scheduled
+        events = grid.__queue__.__next_id__
+        print(f"{workload:>9} {loop:>19} {events:>8} {events / elapsed:>10.0f}")
@@ -0,0 +1,81 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity
+from fizgrid.utils import Shape
+import random, time
+
+# Compares bounding box and exact rasterization on AMRs with round (hexagonal) footprints
+# that random walk diagonally around a shared floor.
+# Reports the number of cell reservations made and the number of collisions that interrupted a route.
+
+
+class AMR(Entity):
+    def __init__(self, *args, legs, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.legs = legs
+        self.last_route_time = None
+
+    def on_realize(self, **kwargs):
+        # Multiple collisions at the same time realize this AMR more than once
+        if self.legs > 0 and self.last_route_time != self.get_time():
+            self.legs -= 1
+            self.last_route_time = self.get_time()
+            self.add_route(
+                waypoints=[
+                    (
+                        min(max(self.x_coord + random.uniform(-6, 6), 3), 57),
+                        min(max(self.y_coord + random.uniform(-6, 6), 3), 57),
+                        random.uniform(2, 4),
+                    )
+                ]
+            )
+
+
+def run(rasterization):
+    random.seed(42)
+    grid = Grid(
+        name="floor",
+        x_size=60,
+        y_size=60,
+        max_time=100000,
+        cell_density=2,
+        rasterization=rasterization,
+    )
+    reservations = 0
+    add_reservation = grid.__cells__.add
+
+    def counting_add(*args, **kwargs):
+        nonlocal reservations
+        reservations += 1
+        return add_reservation(*args, **kwargs)
+
+    grid.__cells__.add = counting_add
+    amrs = [
+        grid.add_entity(
+            AMR(
+                name=f"AMR{idx}",
+                shape=Shape.circle(radius=0.9, num_points=6),
+                x_coord=6 + (idx % 8) * 6.5,
+                y_coord=6 + (idx // 8) * 12,
+                legs=10,
+            )
+        )
+        for idx in range(32)
+    ]
+    start = time.perf_counter()
+    grid.simulate()
+    elapsed = time.perf_counter() - start
+    collisions = sum(
+        1 for amr in amrs for state in amr.history if state["c"] is True
+    )
+    return reservations, collisions, elapsed
+
+
+print("exact_rasterization.py")
+print(
+    f"{'rasterization':>14} {'reservations':>13} {'collisions':>11} {'time (s)':>9}"
+)
+for rasterization in ["bounding_box", "exact"]:
+    reservations, collisions, elapsed = run(rasterization)
+    print(
+        f"{rasterization:>14} {reservations:>13} {collisions:>11} {elapsed:>9.3f}"
+    )
@@ -0,0 +1,43 @@
+from fizgrid.utils import FootprintCache, ShapeMoverUtils, Shape
+import time
+
+# Compares calculating stationary footprints from scratch against looking them up in a FootprintCache.
+# AMRs park on a regular layout of spots, so many of them share the same offset within their cells.
+
+shape = Shape.circle(radius=0.9, num_points=8)
+spots = [(2 + x * 2.5, 2 + y * 2.5) for x in range(100) for y in range(40)]
+
+print("footprint_cache.py")
+print(
+    f"{'density':>8} {'spots':>6} {'direct (us)':>12} {'cached (us)':>12} {'hit rate':>9}"
+)
+for cell_density in [1, 4]:
+    start = time.perf_counter()
+    for x_coord, y_coord in spots:
+        ShapeMoverUtils.moving_shape_overlap_intervals(
+            x_coord=x_coord,
+            y_coord=y_coord,
+            x_shift=0,
+            y_shift=0,
+            t_start=0,
+            t_end=100,
+            shape=shape,
+            cell_density=cell_density,
+        )
+    direct_us = (time.perf_counter() - start) / len(spots) * 1e6
+    cache = FootprintCache()
+    start = time.perf_counter()
+    for x_coord, y_coord in spots:
+        cache.get_overlap_intervals(
+            x_coord=x_coord,
+            y_coord=y_coord,
+            t_start=0,
+            t_end=100,
+            shape=shape,
+            cell_density=cell_density,
+        )
+    cached_us = (time.perf_counter() - start) / len(spots) * 1e6
+    hit_rate = cache.hits / (cache.hits + cache.misses)
+    print(
+        f"{cell_density:>8} {len(spots):>6} {direct_us:>12.2f} {cached_us:>12.2f} {hit_rate:>9.3f}"
+    )
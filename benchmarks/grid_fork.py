@@ -0,0 +1,77 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity
+from fizgrid.utils import Shape
+import random, time
+
+# Measures the latency of a what-if rollout for a dispatcher with Grid.fork.
+# Each AMR drives up and down its own aisle, then the dispatcher tries a new assignment for one AMR
+# and looks 5 minutes (300 time units) ahead.
+# "rebuild" is the alternative without forks: build a new grid and re-add every entity and route.
+
+LOOKAHEAD = 300
+
+
+def build(amrs, cell_store):
+    random.seed(4)
+    columns = 100
+    grid = Grid(
+        name="floor",
+        x_size=columns * 4 + 4,
+        y_size=(amrs // columns) * 12 + 12,
+        max_time=100000,
+        cell_store=cell_store,
+    )
+    fleet = []
+    for idx in range(amrs):
+        x_coord = 4 + (idx % columns) * 4
+        y_coord = 6 + (idx // columns) * 12
+        amr = grid.add_entity(
+            Entity(
+                name=f"AMR{idx}",
+                shape=Shape.rectangle(x_len=1, y_len=1),
+                x_coord=x_coord,
+                y_coord=y_coord,
+            )
+        )
+        amr.add_route(
+            waypoints=[
+                (x_coord, y_coord + 4, random.uniform(50, 150)),
+                (x_coord, y_coord - 4, random.uniform(50, 150)),
+                (x_coord, y_coord, random.uniform(50, 150)),
+            ]
+        )
+        fleet.append(amr)
+    grid.simulate(until=60)
+    return grid, fleet
+
+
+def rollout(grid, amr_id):
+    amr = grid.get_entity(amr_id)
+    amr.cancel_route()
+    grid.simulate(until=grid.get_time())
+    amr.add_route(waypoints=[(amr.x_coord, amr.y_coord + 2, 20)])
+    grid.simulate(until=grid.get_time() + LOOKAHEAD)
+
+
+print("grid_fork.py")
+print(
+    f"{'amrs':>5} {'cell_store':>10} {'rebuild (s)':>12} {'fork (s)':>9} {'fork + rollout (s)':>19} {'rollout only (s)':>17}"
+)
+for amrs in [500, 5000]:
+    for cell_store in ["dict", "array"]:
+        start = time.perf_counter()
+        grid, fleet = build(amrs, cell_store)
+        rebuild_s = time.perf_counter() - start
+        # Best of 3 rollouts from the same grid to reduce noise
+        fork_s, fork_rollout_s, rollout_s = [], [], []
+        for _ in range(3):
+            amr_id = random.choice(fleet).id
+            start = time.perf_counter()
+            forked = grid.fork()
+            fork_s.append(time.perf_counter() - start)
+            rollout(forked, amr_id)
+            fork_rollout_s.append(time.perf_counter() - start)
+            rollout_s.append(fork_rollout_s[-1] - fork_s[-1])
+        print(
+            f"{amrs:>5} {cell_store:>10} {rebuild_s:>12.3f} {min(fork_s):>9.4f} {min(fork_rollout_s):>19.3f} {min(rollout_s):>17.3f}"
+        )
@@ -0,0 +1,58 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity
+from fizgrid.utils import Shape
+import multiprocessing, resource, time
+
+# Measures Grid startup time and process memory (max RSS) for a 2km x 2km yard at a cell density of 2.
+# Each configuration runs in a fresh process so the RSS of one run does not leak into the next.
+
+
+def run_config(cell_store, add_exterior_walls, amrs, output):
+    start_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    grid = Grid(
+        name="yard",
+        x_size=2000,
+        y_size=2000,
+        max_time=100000,
+        cell_density=2,
+        add_exterior_walls=add_exterior_walls,
+        cell_store=cell_store,
+    )
+    startup_s = time.perf_counter() - start
+    # Drive some AMRs down a single aisle so only a few cells are in use
+    for idx in range(amrs):
+        amr = grid.add_entity(
+            Entity(
+                name=f"AMR{idx}",
+                shape=Shape.rectangle(x_len=1, y_len=1),
+                x_coord=10 + idx * 2,
+                y_coord=1000,
+            )
+        )
+        amr.add_route(waypoints=[(10 + idx * 2, 1100, 100)])
+    grid.simulate()
+    end_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    output.put((startup_s, (end_rss - start_rss) / 1024))
+
+
+if __name__ == "__main__":
+    print("grid_startup.py")
+    print(
+        f"{'cell_store':>10} {'walls':>6} {'amrs':>5} {'startup (s)':>12} {'added rss (MB)':>15}"
+    )
+    context = multiprocessing.get_context("spawn")
+    for cell_store in ["dict", "array"]:
+        for add_exterior_walls in [False, True]:
+            for amrs in [0, 50]:
+                output = context.Queue()
+                process = context.Process(
+                    target=run_config,
+                    args=(cell_store, add_exterior_walls, amrs, output),
+                )
+                process.start()
+                startup_s, rss_mb = output.get()
+                process.join()
+                print(
+                    f"{cell_store:>10} {str(add_exterior_walls):>6} {amrs:>5} {startup_s:>12.3f} {rss_mb:>15.1f}"
+                )
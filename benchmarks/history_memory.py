@@ -0,0 +1,47 @@
+from fizgrid.history import EntityHistory
+import sys, time
+
+# Compares the memory and build time of the old list of dictionaries history against the columnar EntityHistory.
+# Each entry is a float location and time with a collision flag, as recorded by a moving entity.
+
+
+def dict_history_bytes(history):
+    return (
+        sys.getsizeof(history)
+        + sum(sys.getsizeof(entry) for entry in history)
+        # Floats created for each entry are unique objects
+        + sum(3 * sys.getsizeof(1.0) for _ in history)
+    )
+
+
+def columnar_history_bytes(history):
+    return sum(
+        sys.getsizeof(column)
+        for column in (history.x, history.y, history.t, history.c)
+    )
+
+
+print("history_memory.py")
+print(
+    f"{'entries':>10} {'dicts (MB)':>11} {'columns (MB)':>13} {'ratio':>6} {'dicts (s)':>10} {'columns (s)':>12}"
+)
+for entries in [10000, 100000, 1000000]:
+    start = time.perf_counter()
+    dicts = []
+    for idx in range(entries):
+        dicts.append(
+            {"x": idx * 0.5, "y": idx * 0.25, "t": idx * 1.0, "c": False}
+        )
+    dicts_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    columns = EntityHistory()
+    for idx in range(entries):
+        columns.record(x=idx * 0.5, y=idx * 0.25, t=idx * 1.0)
+    columns_s = time.perf_counter() - start
+
+    dicts_mb = dict_history_bytes(dicts) / 1024**2
+    columns_mb = columnar_history_bytes(columns) / 1024**2
+    print(
+        f"{entries:>10} {dicts_mb:>11.1f} {columns_mb:>13.1f} {dicts_mb / columns_mb:>6.1f} {dicts_s:>10.3f} {columns_s:>12.3f}"
+    )
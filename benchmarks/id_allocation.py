@@ -0,0 +1,72 @@
+from fizgrid.cells import CellStore
+from fizgrid.utils import IDAllocator
+import random, time
+
+# Measures reservation churn in the dict backed cell store with different block ids.
+# "str" replays the previous process wide string ids, "int" uses the per grid integer ids
+# and "int recycled" also reuses the ids of removed reservations.
+# Each round adds a short route worth of reservations and removes the oldest route, like a replanning fleet.
+
+ROUNDS = 20000
+CELLS_PER_ROUTE = 12
+LIVE_ROUTES = 200
+
+
+class StringIDs:
+    def __init__(self):
+        self.__id__ = 0
+
+    def __call__(self):
+        self.__id__ += 1
+        return str(self.__id__)
+
+    def release(self, id):
+        pass
+
+    def get_capacity(self):
+        return self.__id__
+
+
+def run(block_ids):
+    random.seed(3)
+    store = CellStore(x_cells=200, y_cells=200)
+    store.__block_ids__ = block_ids
+    routes = []
+    start = time.perf_counter()
+    for idx in range(ROUNDS):
+        x_cell = random.randrange(0, 188)
+        y_cell = random.randrange(0, 200)
+        routes.append(
+            [
+                (
+                    x_cell + offset,
+                    y_cell,
+                    store.add(
+                        x_cell + offset,
+                        y_cell,
+                        idx + offset,
+                        idx + offset + 2,
+                        idx,
+                    ),
+                )
+                for offset in range(CELLS_PER_ROUTE)
+            ]
+        )
+        if len(routes) > LIVE_ROUTES:
+            for x_cell, y_cell, block_id in routes.pop(0):
+                store.remove(x_cell, y_cell, block_id)
+    return time.perf_counter() - start, block_ids.get_capacity()
+
+
+print("id_allocation.py")
+print(f"{'block ids':>13} {'time (s)':>9} {'distinct ids':>13}")
+for name, make_block_ids in [
+    ("str", StringIDs),
+    ("int", IDAllocator),
+    ("int recycled", lambda: IDAllocator(recycle=True)),
+]:
+    # Best of 5 runs to reduce noise
+    results = [run(make_block_ids()) for _ in range(5)]
+    print(
+        f"{name:>13} {min(result[0] for result in results):>9.3f} {results[0][1]:>13}"
+    )
@@ -0,0 +1,58 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity
+from fizgrid.utils import Shape
+import time, tracemalloc
+
+# Measures the planning time and memory held by a mostly idle fleet.
+# Idle AMRs are parked in rows while a few AMRs drive back and forth through the aisles, realizing their routes often.
+
+print("idle_fleet.py")
+print(
+    f"{'idle amrs':>10} {'place (s)':>10} {'memory (MB)':>12} {'simulate (s)':>13}"
+)
+for idle_amrs in [500, 2000]:
+    tracemalloc.start()
+    grid = Grid(
+        name="yard",
+        x_size=200,
+        y_size=200,
+        max_time=100000,
+        cell_density=2,
+        add_exterior_walls=False,
+    )
+    start = time.perf_counter()
+    for idx in range(idle_amrs):
+        grid.add_entity(
+            Entity(
+                name=f"Idle{idx}",
+                shape=Shape.rectangle(x_len=1, y_len=1),
+                x_coord=3 + (idx % 50) * 4,
+                y_coord=3 + (idx // 50) * 4,
+            )
+        )
+    place_s = time.perf_counter() - start
+    memory_mb = tracemalloc.get_traced_memory()[0] / 1024**2
+    tracemalloc.stop()
+    movers = [
+        grid.add_entity(
+            Entity(
+                name=f"Mover{idx}",
+                shape=Shape.rectangle(x_len=1, y_len=1),
+                x_coord=5 + idx * 4,
+                y_coord=1,
+            )
+        )
+        for idx in range(20)
+    ]
+    for mover in movers:
+        for leg in range(10):
+            mover.add_route(
+                waypoints=[(mover.x_coord, 199 if leg % 2 == 0 else 1, 50)],
+                time=leg * 60,
+            )
+    start = time.perf_counter()
+    grid.simulate()
+    simulate_s = time.perf_counter() - start
+    print(
+        f"{idle_amrs:>10} {place_s:>10.3f} {memory_mb:>12.1f} {simulate_s:>13.3f}"
+    )
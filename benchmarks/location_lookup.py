@@ -0,0 +1,51 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity
+from fizgrid.utils import Shape
+import time
+
+# Measures the cost of polling entity locations as the number of planned waypoints grows.
+# Each AMR gets one long route and its location is polled at evenly spaced times along it.
+
+POLLS = 2000
+
+print("location_lookup.py")
+print(f"{'waypoints':>10} {'location (us)':>14} {'grid poll of 100 (ms)':>22}")
+for num_waypoints in [10, 100, 1000]:
+    grid = Grid(
+        name="floor",
+        x_size=200,
+        y_size=200,
+        max_time=100000,
+        add_exterior_walls=False,
+    )
+    amrs = [
+        grid.add_entity(
+            Entity(
+                name=f"AMR{idx}",
+                shape=Shape.rectangle(x_len=1, y_len=1),
+                x_coord=1 + idx * 2,
+                y_coord=1,
+            )
+        )
+        for idx in range(100)
+    ]
+    for amr in amrs:
+        amr.add_route(
+            waypoints=[
+                (amr.x_coord + (step % 2) * 0.5, 1 + step * 0.1, 0.1)
+                for step in range(1, num_waypoints + 1)
+            ]
+        )
+    # Start the routes
+    grid.resolve_next_state()
+    route_time = num_waypoints * 0.1
+    amr = amrs[0]
+    start = time.perf_counter()
+    for poll in range(POLLS):
+        amr.__get_planned_location__(poll * route_time / POLLS)
+    location_us = (time.perf_counter() - start) / POLLS * 1e6
+    start = time.perf_counter()
+    for _ in range(100):
+        grid.get_entity_locations()
+    poll_ms = (time.perf_counter() - start) / 100 * 1000
+    print(f"{num_waypoints:>10} {location_us:>14.2f} {poll_ms:>22.3f}")
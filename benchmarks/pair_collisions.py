@@ -0,0 +1,129 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity
+from fizgrid.utils import Shape
+import random, time
+
+# Measures queue traffic in a dense fleet where AMRs keep colliding and replanning.
+# "paired" replays the previous scheme where each collision pushed one linked event per entity,
+# "single" uses the current grid level event that resolves both entities at once.
+# Times are in seconds, so queue operations are reported per simulated hour.
+
+HOURS = 1
+
+
+class AMR(Entity):
+    last_route_time = None
+
+    def on_realize(self, **kwargs):
+        # Only plan one new route per point in time, even if several collisions are resolved at once
+        if (
+            self.get_time() < HOURS * 3600
+            and self.last_route_time != self.get_time()
+        ):
+            self.last_route_time = self.get_time()
+            self.add_route(
+                waypoints=[
+                    (
+                        min(max(self.x_coord + random.uniform(-4, 4), 2), 48),
+                        min(max(self.y_coord + random.uniform(-4, 4), 2), 48),
+                        random.uniform(10, 30),
+                    )
+                ]
+            )
+
+
+class PairedAMR(AMR):
+    def __add_collision_events__(self, collisions: dict) -> None:
+        for other_entity_id, collision_time in collisions.items():
+            other_entity = self.__grid__.__entities__[other_entity_id]
+            kwargs = {
+                "is_result_of_collision": True,
+                "clear_event_types": ["system", "user"],
+            }
+            event_id = self.__grid__.add_event(
+                time=collision_time,
+                object=self,
+                method="__realize_route__",
+                kwargs=kwargs,
+                priority=3,
+            )
+            other_event_id = self.__grid__.add_event(
+                time=collision_time,
+                object=other_entity,
+                method="__realize_route__",
+                kwargs=kwargs,
+                priority=3,
+            )
+            self.__future_event_ids__["system"][event_id] = other_event_id
+            other_entity.__future_event_ids__["system"][
+                other_event_id
+            ] = event_id
+
+    def __clear_future_events__(self, clear_event_types=["system"]) -> None:
+        for event_type in clear_event_types:
+            for (
+                this_event_id,
+                related_event_id,
+            ) in self.__future_event_ids__[event_type].items():
+                event_obj = self.__grid__.__queue__.remove_event(this_event_id)
+                if related_event_id is not None and event_obj is not None:
+                    self.__grid__.__queue__.remove_event(related_event_id)
+            self.__future_event_ids__[event_type] = {}
+
+
+def run(amr_class):
+    random.seed(5)
+    grid = Grid(
+        name="floor",
+        x_size=50,
+        y_size=50,
+        max_time=100000,
+    )
+    queue = grid.__queue__
+    counts = {"removed": 0, "processed": 0}
+    remove_event = queue.remove_event
+    pop_next_events = queue.pop_next_events
+
+    def counted_remove_event(id):
+        event = remove_event(id)
+        if event is not None:
+            counts["removed"] += 1
+        return event
+
+    def counted_pop_next_events():
+        events = pop_next_events()
+        counts["processed"] += len(events)
+        return events
+
+    queue.remove_event = counted_remove_event
+    queue.pop_next_events = counted_pop_next_events
+    amrs = [
+        grid.add_entity(
+            amr_class(
+                name=f"AMR{idx}",
+                shape=Shape.rectangle(x_len=1, y_len=1, round_to=2),
+                x_coord=3 + (idx % 15) * 3,
+                y_coord=3 + (idx // 15) * 4.5,
+            )
+        )
+        for idx in range(150)
+    ]
+    for amr in amrs:
+        amr.on_realize()
+    start = time.perf_counter()
+    grid.simulate()
+    elapsed = time.perf_counter() - start
+    collisions = sum(entry["c"] for amr in amrs for entry in amr.history)
+    return queue.__next_id__, counts, collisions, elapsed
+
+
+print("pair_collisions.py")
+print(
+    f"{'events':>7} {'added/h':>8} {'removed/h':>10} {'processed/h':>12} {'total ops/h':>12} {'collisions':>11} {'sim (s)':>8}"
+)
+for name, amr_class in [("paired", PairedAMR), ("single", AMR)]:
+    added, counts, collisions, elapsed = run(amr_class)
+    total = added + counts["removed"] + counts["processed"]
+    print(
+        f"{name:>7} {added / HOURS:>8.0f} {counts['removed'] / HOURS:>10.0f} {counts['processed'] / HOURS:>12.0f} {total / HOURS:>12.0f} {collisions:>11} {elapsed:>8.2f}"
+    )
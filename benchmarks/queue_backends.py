@@ -0,0 +1,55 @@
+from fizgrid.queue import TimeQueue, HeapBackend, CalendarBackend
+import random, time
+
+# Compares the heap and calendar queue backends on a hold model workload.
+# The queue holds a fixed number of pending events whose times are clustered on a tick grid.
+# Each operation dequeues the next event and schedules a new one a random number of ticks later.
+
+TICK = 0.5
+OPERATIONS = 100000
+
+
+def hold_model(queue_size, push, pop):
+    random.seed(42)
+    now = 0
+    for idx in range(queue_size):
+        push((random.randint(0, 1000) * TICK, -random.randint(0, 5), idx))
+    start = time.perf_counter()
+    for idx in range(queue_size, queue_size + OPERATIONS):
+        now = pop()[0]
+        push((now + random.randint(0, 1000) * TICK, -random.randint(0, 5), idx))
+    return (time.perf_counter() - start) / OPERATIONS * 1e6
+
+
+def time_queue_hold_model(queue_size, backend):
+    random.seed(42)
+    queue = TimeQueue(backend=backend, bucket_width=TICK)
+    for _ in range(queue_size):
+        queue.add_event(
+            time=random.randint(0, 1000) * TICK,
+            priority=random.randint(0, 5),
+        )
+    start = time.perf_counter()
+    for _ in range(OPERATIONS // 10):
+        event = queue.get_next_event()
+        queue.add_event(
+            time=event["time"] + random.randint(0, 1000) * TICK,
+            priority=random.randint(0, 5),
+        )
+    return (time.perf_counter() - start) / (OPERATIONS // 10) * 1e6
+
+
+print("queue_backends.py")
+print(
+    f"{'pending':>9} {'heap (us/op)':>13} {'calendar (us/op)':>17} {'TimeQueue heap':>15} {'TimeQueue calendar':>19}"
+)
+for queue_size in [1000, 10000, 100000, 1000000]:
+    heap = HeapBackend()
+    calendar = CalendarBackend(bucket_width=TICK)
+    heap_us = hold_model(queue_size, heap.push, heap.pop)
+    calendar_us = hold_model(queue_size, calendar.push, calendar.pop)
+    heap_queue_us = time_queue_hold_model(queue_size, "heap")
+    calendar_queue_us = time_queue_hold_model(queue_size, "calendar")
+    print(
+        f"{queue_size:>9} {heap_us:>13.3f} {calendar_us:>17.3f} {heap_queue_us:>15.3f} {calendar_queue_us:>19.3f}"
+    )
@@ -0,0 +1,73 @@
+from fizgrid.utils import ShapeMoverUtils, Shape
+import time
+
+# Compares rasterizing a diagonal move through the full bounding box of the move (then filtering it)
+# against only visiting the band of cells swept by the shape.
+
+REPEATS = 20
+
+
+def bounding_box(absolute_shape, x_shift, y_shift, t_start, t_end):
+    return ShapeMoverUtils.remove_untouched_intervals(
+        intervals=ShapeMoverUtils.moving_rectangle_overlap_intervals(
+            x_start=min(x for x, y in absolute_shape),
+            x_end=max(x for x, y in absolute_shape),
+            y_start=min(y for x, y in absolute_shape),
+            y_end=max(y for x, y in absolute_shape),
+            x_shift=x_shift,
+            y_shift=y_shift,
+            t_start=t_start,
+            t_end=t_end,
+        ),
+        slope=y_shift / x_shift,
+        absolute_shape=absolute_shape,
+    )
+
+
+def swept_band(absolute_shape, x_shift, y_shift, t_start, t_end):
+    return ShapeMoverUtils.moving_band_overlap_intervals(
+        x_intervals=ShapeMoverUtils.moving_segment_overlap_intervals(
+            seg_start=min(x for x, y in absolute_shape),
+            seg_end=max(x for x, y in absolute_shape),
+            t_start=t_start,
+            t_end=t_end,
+            shift=x_shift,
+        ),
+        y_intervals=ShapeMoverUtils.moving_segment_overlap_intervals(
+            seg_start=min(y for x, y in absolute_shape),
+            seg_end=max(y for x, y in absolute_shape),
+            t_start=t_start,
+            t_end=t_end,
+            shift=y_shift,
+        ),
+        slope=y_shift / x_shift,
+        absolute_shape=absolute_shape,
+    )
+
+
+print("rasterization.py")
+print(
+    f"{'density':>8} {'distance':>9} {'cells':>7} {'bounding box (ms)':>18} {'swept band (ms)':>16}"
+)
+shape = Shape.rectangle(x_len=1, y_len=1)
+for cell_density in [1, 4]:
+    for distance in [10, 50, 200]:
+        absolute_shape = [
+            [(10 + x) * cell_density, (10 + y) * cell_density] for x, y in shape
+        ]
+        args = (
+            absolute_shape,
+            distance * 0.8 * cell_density,
+            distance * 0.6 * cell_density,
+            0,
+            distance,
+        )
+        timings = []
+        for rasterize in [bounding_box, swept_band]:
+            start = time.perf_counter()
+            for _ in range(REPEATS):
+                cells = rasterize(*args)
+            timings.append((time.perf_counter() - start) / REPEATS * 1000)
+        print(
+            f"{cell_density:>8} {distance:>9} {len(cells):>7} {timings[0]:>18.3f} {timings[1]:>16.3f}"
+        )
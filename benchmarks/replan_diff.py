@@ -0,0 +1,66 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity
+from fizgrid.utils import Shape
+import random, time
+
+# Measures how many cell reservations are kept instead of rewritten when entities replan.
+# Each AMR random walks and parks at the end of every leg, so the parking reservations planned with a leg
+# are kept when the leg is realized and only the reservations of the finished move are removed.
+
+
+class AMR(Entity):
+    def __init__(self, *args, legs, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.legs = legs
+        self.last_route_time = None
+
+    def on_realize(self, **kwargs):
+        # Multiple collisions at the same time realize this AMR more than once
+        if self.legs > 0 and self.last_route_time != self.get_time():
+            self.legs -= 1
+            self.last_route_time = self.get_time()
+            self.add_route(
+                waypoints=[
+                    (
+                        min(max(self.x_coord + random.uniform(-3, 3), 2), 98),
+                        min(max(self.y_coord + random.uniform(-3, 3), 2), 98),
+                        random.uniform(1, 3),
+                    )
+                ]
+            )
+
+
+print("replan_diff.py")
+print(
+    f"{'cell_store':>10} {'amr size':>9} {'density':>8} {'kept':>8} {'added':>8} {'removed':>8} {'time (s)':>9}"
+)
+for cell_store in ["dict", "array"]:
+    for amr_size, cell_density in [(1, 1), (3, 4)]:
+        random.seed(7)
+        grid = Grid(
+            name="floor",
+            x_size=100,
+            y_size=100,
+            max_time=100000,
+            cell_density=cell_density,
+            cell_store=cell_store,
+        )
+        for idx in range(40):
+            grid.add_entity(
+                AMR(
+                    name=f"AMR{idx}",
+                    shape=Shape.rectangle(
+                        x_len=amr_size, y_len=amr_size, round_to=2
+                    ),
+                    x_coord=5 + (idx % 8) * 12,
+                    y_coord=5 + (idx // 8) * 18,
+                    legs=20,
+                )
+            )
+        start = time.perf_counter()
+        grid.simulate()
+        elapsed = time.perf_counter() - start
+        stats = grid.get_reservation_stats()
+        print(
+            f"{cell_store:>10} {amr_size:>9} {cell_density:>8} {stats['kept']:>8} {stats['added']:>8} {stats['removed']:>8} {elapsed:>9.3f}"
+        )
@@ -0,0 +1,68 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity
+from fizgrid.utils import Shape
+from fizgrid.helpers.replication import run_replications
+import os, random, time
+
+# Measures replication throughput of run_replications for different numbers of worker processes.
+# Each replication is a fleet of AMRs driving to random locations on a shared floor.
+# Throughput should scale with the number of workers up to the number of available processors.
+
+REPLICATIONS = 8
+
+
+class AMR(Entity):
+    def __init__(self, *args, legs, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.legs = legs
+        self.last_route_time = None
+
+    def on_realize(self, **kwargs):
+        if self.legs > 0 and self.last_route_time != self.get_time():
+            self.legs -= 1
+            self.last_route_time = self.get_time()
+            self.add_route(
+                waypoints=[
+                    (
+                        random.uniform(2, 58),
+                        random.uniform(2, 58),
+                        random.uniform(5, 20),
+                    )
+                ]
+            )
+
+
+def scenario():
+    grid = Grid(name="floor", x_size=60, y_size=60, max_time=100000)
+    for idx in range(20):
+        grid.add_entity(
+            AMR(
+                name=f"AMR{idx}",
+                shape=Shape.rectangle(x_len=1, y_len=1),
+                x_coord=5 + (idx % 5) * 10,
+                y_coord=5 + (idx // 5) * 10,
+                legs=40,
+            )
+        ).on_realize()
+    return grid
+
+
+if __name__ == "__main__":
+    print("replications.py")
+    print(f"available processors: {os.cpu_count()}")
+    print(f"{'workers':>7} {'time (s)':>9} {'replications/s':>15}")
+    for max_workers in [1, 2, 4]:
+        # Best of 3 runs to reduce noise
+        times = []
+        for _ in range(3):
+            start = time.perf_counter()
+            run_replications(
+                scenario=scenario,
+                replications=REPLICATIONS,
+                seed=1,
+                max_workers=max_workers,
+            )
+            times.append(time.perf_counter() - start)
+        print(
+            f"{max_workers:>7} {min(times):>9.3f} {REPLICATIONS / min(times):>15.2f}"
+        )
@@ -0,0 +1,69 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity
+from fizgrid.utils import Shape
+import random, time
+
+# Measures the cost of evaluating candidate routes for a dispatch decision.
+# Each decision checks 20 candidate routes that share a first leg out of the AMR's parking spot,
+# one at a time with check_route and all at once with check_routes.
+
+DECISIONS = 50
+CANDIDATES = 20
+
+random.seed(11)
+grid = Grid(
+    name="floor",
+    x_size=100,
+    y_size=100,
+    max_time=100000,
+    cell_density=2,
+)
+amrs = []
+for idx in range(200):
+    amr = grid.add_entity(
+        Entity(
+            name=f"AMR{idx}",
+            shape=Shape.rectangle(x_len=1, y_len=1),
+            x_coord=3 + (idx % 20) * 4.5,
+            y_coord=3 + (idx // 20) * 9,
+        )
+    )
+    amrs.append(amr)
+# Send some AMRs on long routes so candidate routes are checked against moving reservations too
+for amr in amrs[::4]:
+    amr.add_route(waypoints=[(amr.x_coord, 97 - amr.y_coord, 200)])
+grid.resolve_next_state()
+
+candidates = []
+for _ in range(DECISIONS):
+    amr = random.choice(amrs[1::4])
+    first_leg = (amr.x_coord, amr.y_coord + 2, 4)
+    candidates.append(
+        (
+            amr,
+            [
+                [
+                    first_leg,
+                    (random.uniform(2, 98), amr.y_coord + 2, 20),
+                    (random.uniform(2, 98), random.uniform(2, 98), 40),
+                ]
+                for _ in range(CANDIDATES)
+            ],
+        )
+    )
+
+print("route_checks.py")
+print(f"{'method':>13} {'per decision (ms)':>18} {'queue events added':>19}")
+for method in ["check_route", "check_routes"]:
+    next_event_id = grid.__queue__.__next_id__
+    start = time.perf_counter()
+    for amr, waypoints_list in candidates:
+        if method == "check_route":
+            for waypoints in waypoints_list:
+                amr.check_route(waypoints=waypoints)
+        else:
+            amr.check_routes(waypoints_list=waypoints_list)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{method:>13} {elapsed / DECISIONS * 1000:>18.2f} {grid.__queue__.__next_id__ - next_event_id:>19}"
+    )
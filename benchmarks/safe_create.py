@@ -0,0 +1,86 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity
+from fizgrid.cells import SafeIntervalIndex
+from fizgrid.utils import Shape
+import random, time
+
+# Measures safe creation at a busy induction point.
+# Totes are requested at the start of a conveyor at random intervals of up to max_gap time units.
+# The conveyor clears a tote about every 1.1 time units, so totes often wait to be placed and queue up when max_gap is 2.
+# Once placed, each tote is inducted onto the conveyor, rides it to its end and leaves the grid.
+# "polling" emulates the previous behavior that retried every safe_create_increment time units.
+# "earliest" retries at the earliest time the footprint is free from the reservations on the grid.
+
+
+class PollingIndex(SafeIntervalIndex):
+    def get_earliest_safe_time(self, cells, time):
+        return None
+
+
+class Tote(Entity):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.placed_at = None
+
+    def on_realize(self, **kwargs):
+        if self.placed_at is None:
+            self.placed_at = self.get_time()
+            # Totes are inducted slowly and then sped up, which opens a gap to the next tote
+            self.add_route(waypoints=[(6, 5, 1), (55, 5, 7)])
+        else:
+            self.__grid__.remove_entity(self, time=self.get_time())
+
+
+def run(mode, increment, totes, max_gap):
+    random.seed(7)
+    grid = Grid(name="induction", x_size=60, y_size=10, max_time=100000)
+    if mode == "polling":
+        grid.__safe_intervals__ = PollingIndex(
+            cells=grid.__cells__, static_layer=grid.__static_layer__
+        )
+    requested = 0
+    entities = []
+    for idx in range(totes):
+        requested += random.uniform(0, max_gap)
+        entities.append(
+            grid.add_entity(
+                Tote(
+                    name=f"Tote{idx}",
+                    shape=Shape.rectangle(x_len=1, y_len=1),
+                    x_coord=5,
+                    y_coord=5,
+                ),
+                time=requested,
+                safe_create=True,
+                safe_create_increment=increment,
+                safe_create_attempts=100000,
+            )
+        )
+        entities[-1].requested_at = requested
+    start = time.perf_counter()
+    events = grid.simulate()
+    wall_s = time.perf_counter() - start
+    waits = [tote.placed_at - tote.requested_at for tote in entities]
+    collisions = sum(
+        record["c"] for tote in entities for record in tote.history
+    )
+    return events, sum(waits) / len(waits), grid.get_time(), collisions, wall_s
+
+
+print("safe_create.py")
+print(
+    f"{'totes':>6} {'max_gap':>7} {'mode':>9} {'increment':>9} {'events':>8} {'mean wait':>10} {'makespan':>9} {'collisions':>10} {'time (s)':>9}"
+)
+for totes, max_gap in [(200, 3), (2000, 3), (200, 2), (2000, 2)]:
+    for mode, increment in [
+        ("polling", 5),
+        ("polling", 1),
+        ("earliest", 5),
+    ]:
+        # Best of 3 to reduce noise
+        results = [run(mode, increment, totes, max_gap) for _ in range(3)]
+        events, wait, makespan, collisions, _ = results[0]
+        wall_s = min(result[-1] for result in results)
+        print(
+            f"{totes:>6} {max_gap:>7} {mode:>9} {increment:>9} {events:>8} {wait:>10.2f} {makespan:>9.1f} {collisions:>10} {wall_s:>9.3f}"
+        )
@@ -0,0 +1,102 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity
+from fizgrid.cells import SafeIntervalIndex
+from fizgrid.utils import Shape
+import random, time
+
+# Measures safe interval queries in a dense aisle where AMRs keep shuttling back and forth.
+# "raw" merges the reservations of a cell again for every query, "index" uses the grid's safe interval index.
+# Between query rounds the simulation advances, so the index has to keep its cached cells up to date.
+# "maintenance" compares the simulation time with the index against an index that ignores all changes.
+
+AMRS = 40
+ROUNDS = 20
+QUERIES_PER_ROUND = 5000
+
+
+class Shuttle(Entity):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.last_route_time = None
+
+    def on_realize(self, **kwargs):
+        if self.last_route_time != self.get_time():
+            self.last_route_time = self.get_time()
+            self.add_route(
+                waypoints=[
+                    (self.x_coord, 8 if self.y_coord < 5 else 2, 6),
+                    (self.x_coord, 8 if self.y_coord < 5 else 2, 1),
+                ]
+            )
+
+
+class UnmaintainedIndex(SafeIntervalIndex):
+    def add(self, x_cell, y_cell, t_start, t_end):
+        pass
+
+    def remove(self, x_cell, y_cell):
+        pass
+
+
+def build(index_class=SafeIntervalIndex):
+    grid = Grid(name="aisle", x_size=AMRS * 2 + 4, y_size=10, max_time=100000)
+    grid.__safe_intervals__ = index_class(
+        cells=grid.__cells__, static_layer=grid.__static_layer__
+    )
+    for idx in range(AMRS):
+        grid.add_entity(
+            Shuttle(
+                name=f"AMR{idx}",
+                shape=Shape.rectangle(x_len=1, y_len=1),
+                x_coord=3 + idx * 2,
+                y_coord=2 if idx % 2 == 0 else 8,
+            )
+        ).on_realize()
+    return grid
+
+
+def run_queries(mode):
+    random.seed(5)
+    grid = build()
+    query_time = 0
+    for round_idx in range(ROUNDS):
+        grid.simulate(until=(round_idx + 1) * 10)
+        cells = [
+            (random.randrange(2, AMRS * 2 + 2), random.randrange(1, 9))
+            for _ in range(QUERIES_PER_ROUND)
+        ]
+        start = time.perf_counter()
+        if mode == "raw":
+            for x_cell, y_cell in cells:
+                SafeIntervalIndex(
+                    cells=grid.__cells__, static_layer=grid.__static_layer__
+                ).get_safe_intervals(x_cell, y_cell)
+        else:
+            for x_cell, y_cell in cells:
+                grid.get_safe_intervals(x_cell, y_cell)
+        query_time += time.perf_counter() - start
+    return query_time
+
+
+def run_simulation(index_class):
+    grid = build(index_class)
+    start = time.perf_counter()
+    grid.simulate(until=ROUNDS * 10)
+    return time.perf_counter() - start
+
+
+print("safe_intervals.py")
+print(f"{'queries':>11} {'time (s)':>9} {'per query (us)':>15}")
+for mode in ["raw", "index"]:
+    # Best of 3 runs to reduce noise
+    best = min(run_queries(mode) for _ in range(3))
+    print(
+        f"{mode:>11} {best:>9.3f} {best / (ROUNDS * QUERIES_PER_ROUND) * 1e6:>15.2f}"
+    )
+print(f"{'maintenance':>11} {'time (s)':>9}")
+for name, index_class in [
+    ("off", UnmaintainedIndex),
+    ("on", SafeIntervalIndex),
+]:
+    best = min(run_simulation(index_class) for _ in range(5))
+    print(f"{name:>11} {best:>9.3f}")
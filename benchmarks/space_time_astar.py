@@ -0,0 +1,148 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity
+from fizgrid.utils import Shape
+from fizgrid.helpers.planning import space_time_astar
+import random, math, time
+
+# Compares a random walk dispatcher (like the AssignedOrderHandler in test/test_08.py) with one that plans
+# collision free routes with space_time_astar.
+# Each AMR picks up and delivers orders one at a time. Replans are the number of routes added.
+
+AMRS = 6
+ORDERS = 30
+
+
+class AMR(Entity):
+    def __init__(self, *args, dispatcher, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.dispatcher = dispatcher
+        self.goals = []
+        self.last_route_time = None
+
+    def on_realize(self, **kwargs):
+        # Collisions on both sides of a pair can realize an entity twice at the same time
+        if self.last_route_time == self.get_time():
+            return
+        self.last_route_time = self.get_time()
+        self.dispatcher.next_step(self)
+
+
+class Dispatcher:
+    def __init__(self, grid, mode):
+        self.grid = grid
+        self.mode = mode
+        self.orders = []
+        self.idle_amrs = []
+        self.replans = 0
+        self.delivered = 0
+
+    def receive_order(self, pickup, dropoff):
+        self.orders.append([pickup, dropoff])
+        self.assign()
+
+    def assign(self):
+        while self.orders and self.idle_amrs:
+            amr = self.idle_amrs.pop(0)
+            amr.goals = self.orders.pop(0)
+            self.next_step(amr)
+
+    def next_step(self, amr):
+        if not amr.goals:
+            return
+        goal_x, goal_y = amr.goals[0]
+        distance = (
+            (goal_x - amr.x_coord) ** 2 + (goal_y - amr.y_coord) ** 2
+        ) ** 0.5
+        if distance < 1:
+            amr.goals.pop(0)
+            if not amr.goals:
+                self.delivered += 1
+                self.idle_amrs.append(amr)
+                self.assign()
+                return
+            goal_x, goal_y = amr.goals[0]
+        self.replans += 1
+        if self.mode == "random walk":
+            goal_angle = math.atan2(goal_y - amr.y_coord, goal_x - amr.x_coord)
+            angle = random.normalvariate(goal_angle, math.pi / 2)
+            step = random.uniform(0, min(distance, 5))
+            # Back off for a moment after a collision so both AMRs do not immediately collide again
+            amr.add_route(
+                waypoints=[
+                    (
+                        min(max(amr.x_coord + step * math.cos(angle), 2), 38),
+                        min(max(amr.y_coord + step * math.sin(angle), 2), 38),
+                        step,
+                    )
+                ],
+                time=amr.get_time() + (1 if amr.history.c[-1] else 0),
+            )
+        else:
+            waypoints = space_time_astar(
+                entity=amr,
+                x_coord=goal_x,
+                y_coord=goal_y,
+                speed=1,
+                horizon=amr.get_time() + 200,
+                max_expansions=5000,
+            )
+            # Wait and try again if the goal is blocked
+            amr.add_route(
+                waypoints=(
+                    waypoints
+                    if waypoints is not None
+                    else [(amr.x_coord, amr.y_coord, 5)]
+                )
+            )
+
+
+def run(mode):
+    random.seed(2)
+    grid = Grid(name="floor", x_size=40, y_size=40, max_time=100000)
+    dispatcher = Dispatcher(grid, mode)
+    for idx in range(AMRS):
+        amr = grid.add_entity(
+            AMR(
+                name=f"AMR{idx}",
+                shape=Shape.rectangle(x_len=1, y_len=1),
+                x_coord=5 + idx * 6,
+                y_coord=2,
+                dispatcher=dispatcher,
+            )
+        )
+        dispatcher.idle_amrs.append(amr)
+    for idx in range(ORDERS):
+        grid.add_event(
+            time=idx * 5,
+            object=dispatcher,
+            method="receive_order",
+            kwargs={
+                "pickup": (random.randint(4, 36), random.randint(6, 36)),
+                "dropoff": (random.randint(4, 36), random.randint(6, 36)),
+            },
+        )
+    start = time.perf_counter()
+    grid.simulate()
+    wall_time = time.perf_counter() - start
+    collisions = sum(
+        sum(entity.history.c) for entity in grid.__entities__.values()
+    )
+    return {
+        "delivered": dispatcher.delivered,
+        "replans": dispatcher.replans,
+        "events": grid.get_simulation_stats()["events"],
+        "collisions": collisions,
+        "sim_time": grid.get_time(),
+        "wall_time": wall_time,
+    }
+
+
+print("space_time_astar.py")
+print(
+    f"{'mode':>12} {'delivered':>9} {'replans/order':>13} {'events/order':>12} {'collisions':>10} {'time (s)':>9}"
+)
+for mode in ["random walk", "astar"]:
+    stats = run(mode)
+    print(
+        f"{mode:>12} {stats['delivered']:>9} {stats['replans'] / stats['delivered']:>13.2f} {stats['events'] / stats['delivered']:>12.2f} {stats['collisions']:>10} {stats['wall_time']:>9.3f}"
+    )
@@ -15,7 +15,7 @@ Events are scheduled into a priority queue, ordered by their occurrence time. Th
 
 Entity movements are planned in advance but only realized when an associated event is triggered. When a route is assigned to an entity, each grid cell along its path is reserved for the time the entity is expected to occupy it. During this reservation process, the system checks for potential conflicts. For example, whether another entity is scheduled to occupy the same cell at the same time.
 
-If a conflict is detected, a collision event is added to the queue for both entities. Only the first potential collision between any pair of entities is added to avoid redundancy. Additionally, an end-of-route event is queued for the entity to signal the completion of its movement.
+If a conflict is detected, a single collision event is added to the queue for the pair of entities. Only the first potential collision between any pair of entities is added to avoid redundancy. Additionally, an end-of-route event is queued for the entity to signal the completion of its movement.
 
 ### Event Handling
 
@@ -26,12 +26,12 @@ When an end-of-route event is processed:
 - A placeholder (blank) route is assigned to the entity to occupy its current position until a new route is defined.
     - This may trigger new collisions, which will be resolved in their own time.
 
-When a collision event is processed:
+When a collision event is processed, each of the two entities (first the one that planned the colliding route, then the other one) is handled as follows:
 
 - The entity is moved to its calculated position at the collision time.
 - All future events tied to its current route are removed.
 - Collision events for other entities that would have involved this entity are also removed.
-    - The counterpart entity in the current collision still processes its corresponding event.
+    - If either entity in a pair cancels its route before the collision, the shared collision event is removed for both.
 - A blank route is assigned to the entity to mark its occupancy of the current cell until reassigned.
     - This may trigger new collisions will be resolved in their own time.
 
@@ -111,14 +111,14 @@ grid.simulate()
 
 # Show the history of the robot
 print(robot.history)
-# [{'x': 5, 'y': 2, 't': 0, 'c': False}, {'x': 5.0, 'y': 4.5, 't': 5.0, 'c': True}]
+# [{'x': 5.0, 'y': 2.0, 't': 0.0, 'c': False}, {'x': 5.0, 'y': 4.5, 't': 5.0, 'c': True}]
 # This means that the robot started at (5,2) at time=0 and moved to (5,4.5) at time=5 where it collided with the sofa
 # Since there is no additional logic to handle the collision, the robot just stopped moving at time 5 and waited for the end of the simulation
 
 
 # Show the history of the ghost
 print(ghost.history)
-# [{'x': 5, 'y': 2, 't': 0, 'c': False}, {'x': 5, 'y': 8, 't': 12, 'c': False}]
+# [{'x': 5.0, 'y': 2.0, 't': 0.0, 'c': False}, {'x': 5.0, 'y': 8.0, 't': 12.0, 'c': False}]
 # This means that the ghost started at (5,2) at time=0 and moved to (5,8) at time=12 without any collisions
 ```
 
@@ -268,6 +268,17 @@ Fizgrid provides a number of utils and helper functions to streamline your workf
 You should take special note of the following:
 - `fizgrid.utils.Shape`: A class to help define the shape of an entity. (See: [Shape](https://connor-makowski.github.io/fizgrid/fizgrid/utils.html#Shape))
 - `fizgrid.helpers.waypoint_timing`: A function to help calculate the timing of waypoints. (See: [waypoint_timing](https://connor-makowski.github.io/fizgrid/fizgrid/helpers/waypoint_timing.html))
+- `fizgrid.helpers.replication`: Functions to run seeded replications of a scenario in parallel and aggregate their statistics. (See: [replication](https://connor-makowski.github.io/fizgrid/fizgrid/helpers/replication.html))
+- `fizgrid.helpers.planning`: A space-time A* planner that finds collision free routes around the reservations on a grid. (See: [planning](https://connor-makowski.github.io/fizgrid/fizgrid/helpers/planning.html))
+
+
+## Upgrade Notes
+
+- Entity ids are integers that are allocated by the grid an entity is added to.
+    - `Entity.id` is `None` until the entity is added to a grid with `grid.add_entity`.
+    - Ids start at 0 on each grid and are not unique across grids, so two grids can both have an entity with id 0.
+    - Previously, ids were strings that were unique across all grids and were assigned when an entity was created.
+    - Use `grid.get_entity(entity_id)` to look up an entity by its id.
 
 
 # Development
@@ -279,9 +290,12 @@ Make sure Docker is installed and running on a Unix system (Linux, MacOS, WSL2).
     - `./run.sh`
 - Run all tests (see ./utils/test.sh)
     - `./run.sh test`
+- Run all benchmarks (see ./utils/benchmark.sh)
+    - `./run.sh benchmark`
 - Prettify the code (see ./utils/prettify.sh)
     - `./run.sh prettify`
 - Update the docs (see ./utils/docs.sh)
     - `./run.sh docs`
 
-- Note: You can and should modify the `Dockerfile` to test different python versions."""
+- Note: You can and should modify the `Dockerfile` to test different python versions.
+"""
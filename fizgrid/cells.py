@@ -0,0 +1,959 @@
+import copy
+from array import array
+from bisect import bisect_left, bisect_right
+from fizgrid.utils import IDAllocator
+
+
+class IntervalIndex:
+    """
+    A sorted index of the reservations in a single cell.
+
+    Start and end times are kept in two sorted lists (with matching block id lists) so that
+    overlap queries can bisect for the reservations that start before the end of the query
+    and the reservations that end after the start of the query and only scan the smaller
+    of the two candidate sets.
+    """
+
+    __slots__ = (
+        "reservations",
+        "start_times",
+        "start_ids",
+        "end_times",
+        "end_ids",
+    )
+
+    def __init__(self):
+        self.reservations = {}
+        self.start_times = []
+        self.start_ids = []
+        self.end_times = []
+        self.end_ids = []
+
+    def __len__(self):
+        return len(self.reservations)
+
+    def copy(self):
+        """
+        Returns a copy of this index that can be changed independently.
+
+        Returns:
+
+        - IntervalIndex: The copied index.
+        """
+        index = IntervalIndex()
+        index.reservations = self.reservations.copy()
+        index.start_times = self.start_times.copy()
+        index.start_ids = self.start_ids.copy()
+        index.end_times = self.end_times.copy()
+        index.end_ids = self.end_ids.copy()
+        return index
+
+    def add(self, block_id, t_start, t_end, entity_id) -> None:
+        """
+        Adds a reservation to the index.
+
+        Args:
+
+        - block_id: The unique block id of the reservation.
+        - t_start (int|float): The start time of the reservation.
+        - t_end (int|float): The end time of the reservation.
+        - entity_id: The ID of the entity that holds the reservation.
+        """
+        self.reservations[block_id] = (t_start, t_end, entity_id)
+        idx = bisect_right(self.start_times, t_start)
+        self.start_times.insert(idx, t_start)
+        self.start_ids.insert(idx, block_id)
+        idx = bisect_right(self.end_times, t_end)
+        self.end_times.insert(idx, t_end)
+        self.end_ids.insert(idx, block_id)
+
+    def remove(self, block_id) -> bool:
+        """
+        Removes a reservation from the index.
+
+        Args:
+
+        - block_id: The unique block id of the reservation.
+
+        Returns:
+
+        - bool: True if the reservation was removed, False if it was not in the index.
+        """
+        reservation = self.reservations.pop(block_id, None)
+        if reservation is None:
+            return False
+        idx = bisect_left(self.start_times, reservation[0])
+        while self.start_ids[idx] != block_id:
+            idx += 1
+        del self.start_times[idx]
+        del self.start_ids[idx]
+        idx = bisect_left(self.end_times, reservation[1])
+        while self.end_ids[idx] != block_id:
+            idx += 1
+        del self.end_times[idx]
+        del self.end_ids[idx]
+        return True
+
+    def get_overlaps(self, t_start, t_end) -> list[tuple]:
+        """
+        Returns all reservations that overlap the interval [t_start, t_end).
+
+        Args:
+
+        - t_start (int|float): The start time of the interval.
+        - t_end (int|float): The end time of the interval.
+
+        Returns:
+
+        - list[tuple]: A list of overlapping (t_start, t_end, entity_id) tuples in the order they were added.
+        """
+        reservations = self.reservations
+        # Reservations starting before t_end are start_ids[:start_idx]
+        start_idx = bisect_left(self.start_times, t_end)
+        # Reservations ending after t_start are end_ids[end_idx:]
+        end_idx = bisect_right(self.end_times, t_start)
+        output = []
+        if start_idx <= len(self.end_times) - end_idx:
+            for block_id in self.start_ids[:start_idx]:
+                reservation = reservations[block_id]
+                if reservation[1] > t_start:
+                    output.append(reservation)
+        else:
+            for block_id in self.end_ids[end_idx:]:
+                reservation = reservations[block_id]
+                if reservation[0] < t_end:
+                    output.append(reservation)
+        if len(output) > 1:
+            # Return multiple overlaps in the order they were added as this sets the order of collision events
+            return [
+                reservation
+                for reservation in reservations.values()
+                if reservation[1] > t_start and reservation[0] < t_end
+            ]
+        return output
+
+    def is_occupied(self, time) -> bool:
+        """
+        Checks if any reservation covers a point in time.
+
+        Args:
+
+        - time (int|float): The point in time to check.
+
+        Returns:
+
+        - bool: True if a reservation covers the time, False otherwise.
+        """
+        reservations = self.reservations
+        # Reservations starting at or before time are start_ids[:start_idx]
+        start_idx = bisect_right(self.start_times, time)
+        # Reservations ending after time are end_ids[end_idx:]
+        end_idx = bisect_right(self.end_times, time)
+        if start_idx <= len(self.end_times) - end_idx:
+            for block_id in self.start_ids[:start_idx]:
+                if reservations[block_id][1] > time:
+                    return True
+            return False
+        for block_id in self.end_ids[end_idx:]:
+            if reservations[block_id][0] <= time:
+                return True
+        return False
+
+
+TILE_BITS = 4
+TILE_MASK = (1 << TILE_BITS) - 1
+
+
+class CellStore:
+    def __init__(
+        self, x_cells: int, y_cells: int, recycle_block_ids: bool = True
+    ):
+        """
+        Initializes a dictionary backed reservation store for the cells of a grid.
+
+        Each cell holds an IntervalIndex of reservations keyed by a unique block id.
+        Each reservation is a tuple of (t_start, t_end, entity_id).
+
+        Cells are grouped into square tiles of 16x16 cells. A tile is only allocated when one
+        of its cells receives a reservation and is freed again once all of its reservations
+        are removed. This keeps memory proportional to the cells in use so very large and
+        mostly empty grids are cheap to create.
+
+        Args:
+
+        - x_cells (int): The number of cells along the x-axis.
+        - y_cells (int): The number of cells along the y-axis.
+        - recycle_block_ids (bool): Whether the block ids of removed reservations are reused.
+            - Default: True
+        """
+        self.x_cells = x_cells
+        self.y_cells = y_cells
+        self.__block_ids__ = IDAllocator(recycle=recycle_block_ids)
+        self.__x_tiles__ = (x_cells >> TILE_BITS) + 1
+        # Allocated tiles keyed by tile index
+        # Each tile is a list of cell indexes (or None for empty cells)
+        self.__tiles__ = {}
+        # The number of reservations in each allocated tile
+        self.__tile_counts__ = {}
+        # Tiles shared with a fork of this store that must be copied before they are changed
+        self.__shared_tiles__ = None
+
+    def fork(self):
+        """
+        Returns a copy of this store that shares its tiles with this store until either one changes them (copy-on-write).
+        The cost of a fork is proportional to the number of allocated tiles rather than the number of reservations.
+
+        Returns:
+
+        - CellStore: The forked store.
+        """
+        forked = copy.copy(self)
+        forked.__tiles__ = self.__tiles__.copy()
+        forked.__tile_counts__ = self.__tile_counts__.copy()
+        forked.__block_ids__ = self.__block_ids__.copy()
+        self.__shared_tiles__ = set(self.__tiles__)
+        forked.__shared_tiles__ = set(self.__tiles__)
+        return forked
+
+    def __copy_tile__(self, tile_idx: int) -> list:
+        """
+        Replaces a shared tile with a copy that is owned by this store and returns it.
+        """
+        tile = [
+            None if cell is None else cell.copy()
+            for cell in self.__tiles__[tile_idx]
+        ]
+        self.__tiles__[tile_idx] = tile
+        self.__shared_tiles__.discard(tile_idx)
+        return tile
+
+    def __get_cell__(self, x_cell: int, y_cell: int):
+        """
+        Returns the IntervalIndex for a cell or None if the cell has no reservations.
+        """
+        # Cells outside of the grid have no reservations (and must not alias into other tiles)
+        if not (0 <= x_cell < self.x_cells and 0 <= y_cell < self.y_cells):
+            return None
+        tile = self.__tiles__.get(
+            (y_cell >> TILE_BITS) * self.__x_tiles__ + (x_cell >> TILE_BITS)
+        )
+        if tile is None:
+            return None
+        return tile[((y_cell & TILE_MASK) << TILE_BITS) | (x_cell & TILE_MASK)]
+
+    def add(
+        self,
+        x_cell: int,
+        y_cell: int,
+        t_start: int | float,
+        t_end: int | float,
+        entity_id,
+    ):
+        """
+        Adds a reservation to a cell.
+
+        Args:
+
+        - x_cell (int): The x index of the cell.
+        - y_cell (int): The y index of the cell.
+        - t_start (int|float): The start time of the reservation.
+        - t_end (int|float): The end time of the reservation.
+        - entity_id: The ID of the entity that holds the reservation.
+
+        Returns:
+
+        - The block id of the reservation.
+            - This is used to remove the reservation later.
+        """
+        block_id = self.__block_ids__()
+        tile_idx = (y_cell >> TILE_BITS) * self.__x_tiles__ + (
+            x_cell >> TILE_BITS
+        )
+        tile = self.__tiles__.get(tile_idx)
+        if tile is None:
+            tile = [None] * (1 << (2 * TILE_BITS))
+            self.__tiles__[tile_idx] = tile
+            self.__tile_counts__[tile_idx] = 0
+        elif (
+            self.__shared_tiles__ is not None
+            and tile_idx in self.__shared_tiles__
+        ):
+            tile = self.__copy_tile__(tile_idx)
+        cell_idx = ((y_cell & TILE_MASK) << TILE_BITS) | (x_cell & TILE_MASK)
+        cell = tile[cell_idx]
+        if cell is None:
+            cell = IntervalIndex()
+            tile[cell_idx] = cell
+        cell.add(block_id, t_start, t_end, entity_id)
+        self.__tile_counts__[tile_idx] += 1
+        return block_id
+
+    def remove(self, x_cell: int, y_cell: int, block_id) -> None:
+        """
+        Removes a reservation from a cell.
+
+        Args:
+
+        - x_cell (int): The x index of the cell.
+        - y_cell (int): The y index of the cell.
+        - block_id: The block id returned by `add`.
+        """
+        tile_idx = (y_cell >> TILE_BITS) * self.__x_tiles__ + (
+            x_cell >> TILE_BITS
+        )
+        tile = self.__tiles__.get(tile_idx)
+        if tile is None:
+            return
+        if (
+            self.__shared_tiles__ is not None
+            and tile_idx in self.__shared_tiles__
+        ):
+            tile = self.__copy_tile__(tile_idx)
+        cell_idx = ((y_cell & TILE_MASK) << TILE_BITS) | (x_cell & TILE_MASK)
+        cell = tile[cell_idx]
+        if cell is None or not cell.remove(block_id):
+            return
+        self.__block_ids__.release(block_id)
+        if len(cell) == 0:
+            tile[cell_idx] = None
+        self.__tile_counts__[tile_idx] -= 1
+        if self.__tile_counts__[tile_idx] == 0:
+            del self.__tiles__[tile_idx]
+            del self.__tile_counts__[tile_idx]
+
+    def get_reservations(self, x_cell: int, y_cell: int) -> list[tuple]:
+        """
+        Returns all reservations in a cell.
+
+        Args:
+
+        - x_cell (int): The x index of the cell.
+        - y_cell (int): The y index of the cell.
+
+        Returns:
+
+        - list[tuple]: A list of (t_start, t_end, entity_id) tuples.
+        """
+        cell = self.__get_cell__(x_cell, y_cell)
+        if cell is None:
+            return []
+        return list(cell.reservations.values())
+
+    def get_overlaps(
+        self,
+        x_cell: int,
+        y_cell: int,
+        t_start: int | float,
+        t_end: int | float,
+    ) -> list[tuple]:
+        """
+        Returns all reservations in a cell that overlap the interval [t_start, t_end).
+
+        Args:
+
+        - x_cell (int): The x index of the cell.
+        - y_cell (int): The y index of the cell.
+        - t_start (int|float): The start time of the interval.
+        - t_end (int|float): The end time of the interval.
+
+        Returns:
+
+        - list[tuple]: A list of overlapping (t_start, t_end, entity_id) tuples.
+        """
+        cell = self.__get_cell__(x_cell, y_cell)
+        if cell is None:
+            return []
+        return cell.get_overlaps(t_start, t_end)
+
+    def is_occupied(self, x_cell: int, y_cell: int, time: int | float) -> bool:
+        """
+        Checks if any reservation in a cell covers a point in time.
+
+        Args:
+
+        - x_cell (int): The x index of the cell.
+        - y_cell (int): The y index of the cell.
+        - time (int|float): The point in time to check.
+
+        Returns:
+
+        - bool: True if a reservation covers the time, False otherwise.
+        """
+        cell = self.__get_cell__(x_cell, y_cell)
+        if cell is None:
+            return False
+        return cell.is_occupied(time)
+
+
+class ArrayCellStore(CellStore):
+    def __init__(
+        self, x_cells: int, y_cells: int, recycle_block_ids: bool = True
+    ):
+        """
+        Initializes an array backed reservation store for the cells of a grid.
+
+        Reservations are stored as a struct of arrays where each slot holds a start time,
+        end time, (integer) entity id and the index of its cell. Slots in the same cell are chained together as a doubly
+        linked list starting from a per cell head index. Removed slots are recycled through
+        a free list so the arrays only grow to the peak number of live reservations.
+
+        This uses a fixed 8 bytes per cell rather than a dictionary per cell and is
+        recommended for large grids.
+
+        Args:
+
+        - x_cells (int): The number of cells along the x-axis.
+        - y_cells (int): The number of cells along the y-axis.
+        - recycle_block_ids (bool): Unused as slots (which are the block ids) are always recycled.
+            - This is accepted for compatibility with `CellStore`.
+        """
+        self.x_cells = x_cells
+        self.y_cells = y_cells
+        # Head slot index for each cell (-1 when the cell is empty)
+        self.__heads__ = array("q", [-1]) * (x_cells * y_cells)
+        # Slot arrays
+        self.__t_starts__ = array("d")
+        self.__t_ends__ = array("d")
+        self.__entity_ids__ = array("q")
+        self.__next_slots__ = array("q")
+        self.__prev_slots__ = array("q")
+        # Cell index of each slot (-1 when the slot is free) so removals can be checked
+        self.__slot_cells__ = array("q")
+        self.__free_slot__ = -1
+        # Whether the arrays are shared with a fork of this store and must be copied before they are changed
+        self.__shared__ = False
+
+    def fork(self):
+        """
+        Returns a copy of this store that shares its arrays with this store until either one changes them (copy-on-write).
+
+        Note: The arrays are copied as a whole on the first change, so a fork that is changed costs a copy of every array.
+
+        Returns:
+
+        - ArrayCellStore: The forked store.
+        """
+        forked = copy.copy(self)
+        self.__shared__ = True
+        forked.__shared__ = True
+        return forked
+
+    def __unshare__(self) -> None:
+        """
+        Replaces shared arrays with copies that are owned by this store.
+        """
+        self.__heads__ = self.__heads__[:]
+        self.__t_starts__ = self.__t_starts__[:]
+        self.__t_ends__ = self.__t_ends__[:]
+        self.__entity_ids__ = self.__entity_ids__[:]
+        self.__next_slots__ = self.__next_slots__[:]
+        self.__prev_slots__ = self.__prev_slots__[:]
+        self.__slot_cells__ = self.__slot_cells__[:]
+        self.__shared__ = False
+
+    def add(
+        self,
+        x_cell: int,
+        y_cell: int,
+        t_start: int | float,
+        t_end: int | float,
+        entity_id: int,
+    ) -> int:
+        if self.__shared__:
+            self.__unshare__()
+        cell_idx = y_cell * self.x_cells + x_cell
+        head = self.__heads__[cell_idx]
+        slot = self.__free_slot__
+        if slot == -1:
+            slot = len(self.__t_starts__)
+            self.__t_starts__.append(t_start)
+            self.__t_ends__.append(t_end)
+            self.__entity_ids__.append(entity_id)
+            self.__next_slots__.append(head)
+            self.__prev_slots__.append(-1)
+            self.__slot_cells__.append(cell_idx)
+        else:
+            self.__free_slot__ = self.__next_slots__[slot]
+            self.__t_starts__[slot] = t_start
+            self.__t_ends__[slot] = t_end
+            self.__entity_ids__[slot] = entity_id
+            self.__next_slots__[slot] = head
+            self.__prev_slots__[slot] = -1
+            self.__slot_cells__[slot] = cell_idx
+        if head != -1:
+            self.__prev_slots__[head] = slot
+        self.__heads__[cell_idx] = slot
+        return slot
+
+    def remove(self, x_cell: int, y_cell: int, block_id: int) -> None:
+        cell_idx = y_cell * self.x_cells + x_cell
+        # Like CellStore, ignore blocks that are not live in this cell (eg: already removed)
+        if (
+            block_id < 0
+            or block_id >= len(self.__slot_cells__)
+            or self.__slot_cells__[block_id] != cell_idx
+        ):
+            return
+        if self.__shared__:
+            self.__unshare__()
+        next_slot = self.__next_slots__[block_id]
+        prev_slot = self.__prev_slots__[block_id]
+        if prev_slot == -1:
+            self.__heads__[cell_idx] = next_slot
+        else:
+            self.__next_slots__[prev_slot] = next_slot
+        if next_slot != -1:
+            self.__prev_slots__[next_slot] = prev_slot
+        # Push the slot on to the free list
+        self.__slot_cells__[block_id] = -1
+        self.__next_slots__[block_id] = self.__free_slot__
+        self.__free_slot__ = block_id
+
+    def get_reservations(self, x_cell: int, y_cell: int) -> list[tuple]:
+        # Cells outside of the grid have no reservations (and must not alias onto the neighboring row)
+        if not (0 <= x_cell < self.x_cells and 0 <= y_cell < self.y_cells):
+            return []
+        t_starts = self.__t_starts__
+        t_ends = self.__t_ends__
+        entity_ids = self.__entity_ids__
+        next_slots = self.__next_slots__
+        output = []
+        slot = self.__heads__[y_cell * self.x_cells + x_cell]
+        while slot != -1:
+            output.append((t_starts[slot], t_ends[slot], entity_ids[slot]))
+            slot = next_slots[slot]
+        # Slots are pushed on to the head of the cell, so reverse to return them in the order they were added
+        output.reverse()
+        return output
+
+    def get_overlaps(
+        self,
+        x_cell: int,
+        y_cell: int,
+        t_start: int | float,
+        t_end: int | float,
+    ) -> list[tuple]:
+        if not (0 <= x_cell < self.x_cells and 0 <= y_cell < self.y_cells):
+            return []
+        t_starts = self.__t_starts__
+        t_ends = self.__t_ends__
+        next_slots = self.__next_slots__
+        output = []
+        slot = self.__heads__[y_cell * self.x_cells + x_cell]
+        while slot != -1:
+            if t_start < t_ends[slot] and t_end > t_starts[slot]:
+                output.append(
+                    (
+                        t_starts[slot],
+                        t_ends[slot],
+                        self.__entity_ids__[slot],
+                    )
+                )
+            slot = next_slots[slot]
+        # Return overlaps in the order they were added like CellStore
+        output.reverse()
+        return output
+
+    def is_occupied(self, x_cell: int, y_cell: int, time: int | float) -> bool:
+        if not (0 <= x_cell < self.x_cells and 0 <= y_cell < self.y_cells):
+            return False
+        t_starts = self.__t_starts__
+        t_ends = self.__t_ends__
+        next_slots = self.__next_slots__
+        slot = self.__heads__[y_cell * self.x_cells + x_cell]
+        while slot != -1:
+            if time < t_ends[slot] and time >= t_starts[slot]:
+                return True
+            slot = next_slots[slot]
+        return False
+
+
+class StaticLayer:
+    def __init__(self, x_cells: int, y_cells: int, max_time: int | float):
+        """
+        Initializes a raster of cells blocked by static and parked entities.
+
+        Static entities block their cells from the time they are placed until the end of the simulation.
+        Entities that have finished their routes block their cells from the time they park until the end of the
+        simulation (or until they move again).
+        Rather than storing these open-ended blocks as reservations in the cell store, each blocked cell is flagged in a
+        bytearray raster so route planning can reject it with a single lookup.
+
+        The raster is split into the same 16x16 cell tiles as the CellStore and tiles are only
+        allocated once a static entity blocks one of their cells.
+
+        Args:
+
+        - x_cells (int): The number of cells along the x-axis.
+        - y_cells (int): The number of cells along the y-axis.
+        - max_time (int|float): The maximum time for the grid simulation.
+        """
+        self.x_cells = x_cells
+        self.y_cells = y_cells
+        self.max_time = max_time
+        self.__x_tiles__ = (x_cells >> TILE_BITS) + 1
+        # Allocated raster tiles keyed by tile index
+        self.__raster_tiles__ = {}
+        # The static and parked entities (and the time they were placed or parked) blocking each flagged cell
+        # Note: These dictionaries are replaced rather than changed so they can be shared with forks of this layer
+        self.__owners__ = {}
+        # Raster tiles shared with a fork of this layer that must be copied before they are changed
+        self.__shared_tiles__ = None
+
+    def fork(self):
+        """
+        Returns a copy of this layer that shares its raster tiles with this layer until either one changes them (copy-on-write).
+
+        Returns:
+
+        - StaticLayer: The forked layer.
+        """
+        forked = copy.copy(self)
+        forked.__raster_tiles__ = self.__raster_tiles__.copy()
+        forked.__owners__ = self.__owners__.copy()
+        self.__shared_tiles__ = set(self.__raster_tiles__)
+        forked.__shared_tiles__ = set(self.__raster_tiles__)
+        return forked
+
+    def __get_writable_tile__(self, tile_idx: int) -> bytearray | None:
+        """
+        Returns a raster tile that can be changed by this layer (or None if the tile is not allocated).
+        """
+        tile = self.__raster_tiles__.get(tile_idx)
+        if (
+            tile is not None
+            and self.__shared_tiles__ is not None
+            and tile_idx in self.__shared_tiles__
+        ):
+            tile = bytearray(tile)
+            self.__raster_tiles__[tile_idx] = tile
+            self.__shared_tiles__.discard(tile_idx)
+        return tile
+
+    def add(
+        self, x_cell: int, y_cell: int, t_start: int | float, entity_id
+    ) -> None:
+        """
+        Blocks a cell for a static or parked entity.
+
+        Args:
+
+        - x_cell (int): The x index of the cell.
+        - y_cell (int): The y index of the cell.
+        - t_start (int|float): The time the static entity was placed or the entity parked.
+        - entity_id: The ID of the entity.
+        """
+        tile_idx = (y_cell >> TILE_BITS) * self.__x_tiles__ + (
+            x_cell >> TILE_BITS
+        )
+        tile = self.__get_writable_tile__(tile_idx)
+        if tile is None:
+            tile = bytearray(1 << (2 * TILE_BITS))
+            self.__raster_tiles__[tile_idx] = tile
+        tile[((y_cell & TILE_MASK) << TILE_BITS) | (x_cell & TILE_MASK)] = 1
+        cell_idx = y_cell * self.x_cells + x_cell
+        owners = self.__owners__.get(cell_idx)
+        if owners is None:
+            self.__owners__[cell_idx] = {entity_id: t_start}
+        else:
+            self.__owners__[cell_idx] = {**owners, entity_id: t_start}
+
+    def remove(self, x_cell: int, y_cell: int, entity_id) -> None:
+        """
+        Unblocks a cell for a static or parked entity.
+
+        Args:
+
+        - x_cell (int): The x index of the cell.
+        - y_cell (int): The y index of the cell.
+        - entity_id: The ID of the entity.
+        """
+        cell_idx = y_cell * self.x_cells + x_cell
+        owners = self.__owners__.get(cell_idx)
+        if owners is None or entity_id not in owners:
+            return
+        if len(owners) > 1:
+            self.__owners__[cell_idx] = {
+                owner_id: t_start
+                for owner_id, t_start in owners.items()
+                if owner_id != entity_id
+            }
+        else:
+            del self.__owners__[cell_idx]
+            tile_idx = (y_cell >> TILE_BITS) * self.__x_tiles__ + (
+                x_cell >> TILE_BITS
+            )
+            tile = self.__get_writable_tile__(tile_idx)
+            tile[((y_cell & TILE_MASK) << TILE_BITS) | (x_cell & TILE_MASK)] = 0
+            if not any(tile):
+                del self.__raster_tiles__[tile_idx]
+
+    def is_blocked(self, x_cell: int, y_cell: int) -> bool:
+        """
+        Checks if a cell is blocked by any static or parked entity.
+
+        Args:
+
+        - x_cell (int): The x index of the cell.
+        - y_cell (int): The y index of the cell.
+
+        Returns:
+
+        - bool: True if the cell is blocked, False otherwise.
+        """
+        tile = self.__raster_tiles__.get(
+            (y_cell >> TILE_BITS) * self.__x_tiles__ + (x_cell >> TILE_BITS)
+        )
+        if tile is None:
+            return False
+        return (
+            tile[((y_cell & TILE_MASK) << TILE_BITS) | (x_cell & TILE_MASK)]
+            == 1
+        )
+
+    def get_overlaps(
+        self,
+        x_cell: int,
+        y_cell: int,
+        t_start: int | float,
+        t_end: int | float,
+    ) -> list[tuple]:
+        """
+        Returns the static blocks in a cell that overlap the interval [t_start, t_end).
+
+        Args:
+
+        - x_cell (int): The x index of the cell.
+        - y_cell (int): The y index of the cell.
+        - t_start (int|float): The start time of the interval.
+        - t_end (int|float): The end time of the interval.
+
+        Returns:
+
+        - list[tuple]: A list of overlapping (t_start, t_end, entity_id) tuples.
+            - The t_end of a static block is always the max_time of the grid.
+        """
+        if t_start >= self.max_time or not self.is_blocked(x_cell, y_cell):
+            return []
+        return [
+            (other_t_start, self.max_time, entity_id)
+            for entity_id, other_t_start in self.__owners__[
+                y_cell * self.x_cells + x_cell
+            ].items()
+            if other_t_start < t_end
+        ]
+
+    def is_occupied(self, x_cell: int, y_cell: int, time: int | float) -> bool:
+        """
+        Checks if any static block in a cell covers a point in time.
+
+        Args:
+
+        - x_cell (int): The x index of the cell.
+        - y_cell (int): The y index of the cell.
+        - time (int|float): The point in time to check.
+
+        Returns:
+
+        - bool: True if a static block covers the time, False otherwise.
+        """
+        if time >= self.max_time or not self.is_blocked(x_cell, y_cell):
+            return False
+        for other_t_start in self.__owners__[
+            y_cell * self.x_cells + x_cell
+        ].values():
+            if time >= other_t_start:
+                return True
+        return False
+
+
+class SafeIntervalIndex:
+    def __init__(self, cells, static_layer: StaticLayer):
+        """
+        Initializes an index of the free (safe) time intervals of each cell for planners.
+
+        The safe intervals of a cell are the gaps between the reservations in the cell store and the static layer
+        over [0, max_time). They are computed the first time a cell is queried and kept up to date as reservations change:
+
+        - Adding a reservation splits the cached safe intervals of its cell in place.
+        - Removing a reservation drops the cached safe intervals of its cell so they are computed again on the next query.
+
+        Cells that are never queried are never computed, so keeping the index up to date costs a dictionary lookup per change.
+
+        Note: Reservations of every entity are included. Planners for an entity that already holds reservations must
+        account for its own reservations themselves.
+
+        Args:
+
+        - cells (CellStore|ArrayCellStore): The cell store with the reservations.
+        - static_layer (StaticLayer): The static layer with the static and parked entities.
+        """
+        self.__cells__ = cells
+        self.__static_layer__ = static_layer
+        self.x_cells = static_layer.x_cells
+        self.max_time = static_layer.max_time
+        # The cached safe intervals of each queried cell keyed by cell index
+        # Note: These lists are replaced rather than changed so they can be shared with forks of this index
+        self.__intervals__ = {}
+
+    def fork(self, cells, static_layer: StaticLayer):
+        """
+        Returns a copy of this index for a forked grid that shares the cached safe intervals with this index.
+
+        Args:
+
+        - cells (CellStore|ArrayCellStore): The cell store of the forked grid.
+        - static_layer (StaticLayer): The static layer of the forked grid.
+
+        Returns:
+
+        - SafeIntervalIndex: The forked index.
+        """
+        forked = copy.copy(self)
+        forked.__cells__ = cells
+        forked.__static_layer__ = static_layer
+        forked.__intervals__ = self.__intervals__.copy()
+        return forked
+
+    def add(
+        self, x_cell: int, y_cell: int, t_start: int | float, t_end: int | float
+    ) -> None:
+        """
+        Updates the cached safe intervals of a cell for a reservation that was added to it.
+
+        Args:
+
+        - x_cell (int): The x index of the cell.
+        - y_cell (int): The y index of the cell.
+        - t_start (int|float): The start time of the reservation.
+        - t_end (int|float): The end time of the reservation.
+        """
+        cell_idx = y_cell * self.x_cells + x_cell
+        intervals = self.__intervals__.get(cell_idx)
+        if intervals is None or t_end <= t_start:
+            return
+        updated = []
+        for safe_t_start, safe_t_end in intervals:
+            if safe_t_end <= t_start or safe_t_start >= t_end:
+                updated.append((safe_t_start, safe_t_end))
+                continue
+            if safe_t_start < t_start:
+                updated.append((safe_t_start, t_start))
+            if t_end < safe_t_end:
+                updated.append((t_end, safe_t_end))
+        self.__intervals__[cell_idx] = updated
+
+    def remove(self, x_cell: int, y_cell: int) -> None:
+        """
+        Drops the cached safe intervals of a cell after a reservation was removed from it.
+
+        Args:
+
+        - x_cell (int): The x index of the cell.
+        - y_cell (int): The y index of the cell.
+        """
+        self.__intervals__.pop(y_cell * self.x_cells + x_cell, None)
+
+    def get_safe_intervals(self, x_cell: int, y_cell: int) -> list[tuple]:
+        """
+        Returns the safe intervals of a cell.
+
+        Args:
+
+        - x_cell (int): The x index of the cell.
+        - y_cell (int): The y index of the cell.
+
+        Returns:
+
+        - list[tuple]: A sorted list of (t_start, t_end) tuples where the cell is free for t_start <= t < t_end.
+            - The returned list must not be changed.
+        """
+        cell_idx = y_cell * self.x_cells + x_cell
+        intervals = self.__intervals__.get(cell_idx)
+        if intervals is None:
+            max_time = self.max_time
+            blocks = [
+                (t_start, t_end)
+                for t_start, t_end, _ in self.__cells__.get_reservations(
+                    x_cell, y_cell
+                )
+            ]
+            if self.__static_layer__.is_blocked(x_cell, y_cell):
+                blocks += [
+                    (t_start, t_end)
+                    for t_start, t_end, _ in self.__static_layer__.get_overlaps(
+                        x_cell, y_cell, 0, max_time
+                    )
+                ]
+            blocks.sort()
+            intervals = []
+            safe_t_start = 0
+            for t_start, t_end in blocks:
+                if t_end <= t_start:
+                    continue
+                if t_start > safe_t_start:
+                    intervals.append((safe_t_start, t_start))
+                if t_end > safe_t_start:
+                    safe_t_start = t_end
+            if safe_t_start < max_time:
+                intervals.append((safe_t_start, max_time))
+            self.__intervals__[cell_idx] = intervals
+        return intervals
+
+    def get_safe_interval(
+        self, x_cell: int, y_cell: int, time: int | float
+    ) -> tuple | None:
+        """
+        Returns the safe interval of a cell that contains a point in time.
+
+        Args:
+
+        - x_cell (int): The x index of the cell.
+        - y_cell (int): The y index of the cell.
+        - time (int|float): The point in time.
+
+        Returns:
+
+        - tuple|None: The (t_start, t_end) safe interval that contains the time or None if the cell is reserved at that time.
+        """
+        intervals = self.get_safe_intervals(x_cell, y_cell)
+        idx = bisect_right(intervals, (time, float("inf"))) - 1
+        if idx >= 0 and intervals[idx][1] > time:
+            return intervals[idx]
+        return None
+
+    def get_earliest_safe_time(
+        self, cells: list[tuple], time: int | float
+    ) -> int | float | None:
+        """
+        Returns the earliest point in time at or after `time` at which all of the given cells are free.
+
+        Args:
+
+        - cells (list[tuple]): A list of (x_cell, y_cell) tuples.
+        - time (int|float): The earliest time to consider.
+
+        Returns:
+
+        - int|float|None: The earliest time at which all cells are free or None if they are not all free before the end of the simulation.
+        """
+        while True:
+            is_free = True
+            for x_cell, y_cell in cells:
+                intervals = self.get_safe_intervals(x_cell, y_cell)
+                idx = bisect_right(intervals, (time, float("inf"))) - 1
+                if idx >= 0 and intervals[idx][1] > time:
+                    continue
+                # Skip ahead to the next safe interval of this cell and check all cells again
+                if idx + 1 >= len(intervals):
+                    return None
+                time = intervals[idx + 1][0]
+                is_free = False
+            if is_free:
+                return time
+
+
+cell_stores = {
+    "dict": CellStore,
+    "array": ArrayCellStore,
+}
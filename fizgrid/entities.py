@@ -1,8 +1,31 @@
-import type_enforced
-from fizgrid.utils import unique_id, ShapeMoverUtils, Shape
+import type_enforced, bisect, copy
+from fizgrid.utils import (
+    ShapeMoverUtils,
+    keep_unchecked,
+    bind_unchecked_methods,
+    unbind_unchecked_methods,
+)
+from fizgrid.history import EntityHistory
 
 
 @type_enforced.Enforcer(enabled=True)
+@keep_unchecked(
+    "__place_on_grid__",
+    "__dissoc_grid__",
+    "__clear_blocked_grid_cells__",
+    "__clear_future_events__",
+    "__waypoint_check__",
+    "__plan_route__",
+    "__get_waypoint_shape__",
+    "__get_segment_blocks__",
+    "__get_parking_cells__",
+    "__get_route_collisions__",
+    "__get_segment_collisions__",
+    "__add_collision_events__",
+    "__realize_route__",
+    "__set_planned_route__",
+    "__get_planned_location__",
+)
 class Entity:
     def __init__(
         self,
@@ -12,6 +35,7 @@ class Entity:
         y_coord: int | float,
         auto_rotate: bool = False,
         location_precision: int | None = 4,
+        history_mode: str = "full",
     ):
         """
         Initializes an entity with a given shape and location in the grid.
@@ -29,9 +53,19 @@ class Entity:
             - Note: The default assumption is that the shape is facing right (0 radians).
         - location_precision (int|None): The precision of the location coordinates. This is used to round the coordinates to a specific number of decimal places.
             - If None, no rounding is performed.
+        - history_mode (str): Which locations to record in the entity's history.
+            - Default: "full"
+            - Options:
+                - "full": Record the start of each route and every waypoint reached along it.
+                - "endpoints": Record only the start of each route and the location where it was realized.
+                - "off": Do not record any history.
+        """
+        self.id = None
+        """
+        The ID of the entity.
+
+        - Note: This is an integer assigned by the grid when the entity is added to it and is None before that.
         """
-        self.id = unique_id()
-        """The ID of the entity."""
         self.name = name
         """The name of the entity."""
         self.shape = shape
@@ -50,10 +84,11 @@ class Entity:
         - Note: This is only updated when events realize the route. This means that a route in progress would not have the correct
             location until the route is realized (either completed or interrupted by a cancellation or collision).
         """
-        self.history = []
+        self.history = EntityHistory(mode=history_mode)
         """
         The history of the entity's location and collision status. 
-        This is a list of dictionaries containing the x, y, t, and c values.
+        This is an `EntityHistory` that can be used like a list of dictionaries containing the x, y, t, and c values.
+        Use `history.to_numpy()` to get each value as a NumPy array instead.
 
         - x (int|float): The x-coordinate of the entity in the grid.
         - y (int|float): The y-coordinate of the entity in the grid.
@@ -68,8 +103,11 @@ class Entity:
         self.__grid__ = None
         self.__on_grid__ = False
         self.__route_start_time__ = None
-        self.__blocked_grid_cells__ = []
+        self.__blocked_grid_cells__ = {}
+        self.__parking_cells__ = []
+        self.__parking_start_time__ = None
         self.__planned_waypoints__ = []
+        self.__planned_end_times__ = []
         self.__future_event_ids__ = {"system": {}, "user": {}}
         self.__shape_current__ = shape
         self.__auto_rotate__ = auto_rotate
@@ -93,6 +131,46 @@ class Entity:
                 f"Entity {self.name} is already associated with a grid. Cannot associate with a new grid."
             )
         self.__grid__ = grid
+        self.id = grid.__id_allocator__()
+        # In fast mode, internal methods skip runtime type checking
+        if grid.__fast_mode__:
+            bind_unchecked_methods(self)
+        # With exact rasterization, stationary shapes must overlap a cell by more than the location rounding error to reserve it
+        self.__rasterization_tolerance__ = (
+            0
+            if self.__location_precision__ is None
+            else 10**-self.__location_precision__ * grid.__cell_density__
+        )
+
+    def __fork__(self, grid):
+        """
+        Returns a copy of this entity for a fork of its grid.
+        The copy shares state that is only ever replaced (eg: its shape and planned route) with this entity and copies
+        the state that is changed in place while simulating. The history is forked with copy-on-write.
+
+        Note: Other attributes (eg: those added by subclasses) are shallow copied, so the objects they reference are shared with this entity.
+
+        Args:
+
+        - grid (Grid): The forked grid that the copy belongs to.
+
+        Returns:
+
+        - Entity: The copied entity.
+        """
+        forked = copy.copy(self)
+        forked.__grid__ = grid
+        forked.history = self.history.fork()
+        forked.__blocked_grid_cells__ = self.__blocked_grid_cells__.copy()
+        forked.__future_event_ids__ = {
+            event_type: event_ids.copy()
+            for event_type, event_ids in self.__future_event_ids__.items()
+        }
+        # Methods bound to this entity in fast mode must be bound to the copy instead
+        unbind_unchecked_methods(forked)
+        if grid.__fast_mode__:
+            bind_unchecked_methods(forked)
+        return forked
 
     def __place_on_grid__(
         self,
@@ -113,11 +191,15 @@ class Entity:
 
         - safe_create: A boolean indicating whether to attempt safe creation of the obstruction.
             - If True, the method will attempt to create the obstruction without overlapping existing obstructions.
+                - If there is an overlap, placement is retried at the earliest time all cells of the footprint are free
+                  based on the reservations on the grid.
             - If False, it may raise an error if there is an overlap between obstructions / other entities.
             - Default is False.
-        - safe_create_increment: The incremental time to wait to use when attempting safe creation if an overlap is detected.
+        - safe_create_increment: The time to wait before retrying safe creation if the footprint is blocked until the end of the simulation.
+            - This happens when a parked or static entity blocks the footprint, since it is not known when (or if) it will move.
             - Default is 5 time units.
         - safe_create_attempts: The maximum number of attempts to try creating the obstruction safely before logging an error.
+            - Retries are only needed again if new reservations block the footprint before the computed time.
             - Default is 10 attempts.
         - safe_create_on_error: The action to take if safe creation fails after the maximum attempts.
             - Options are "print_error" to log an error message, or "raise_exception" to raise an exception.
@@ -141,34 +223,27 @@ class Entity:
 
         if safe_create or raise_on_immediate_collision:
             current_time = self.get_time()
-            blocks = ShapeMoverUtils.moving_shape_overlap_intervals(
+            blocks = self.__grid__.__footprint_cache__.get_overlap_intervals(
                 x_coord=self.x_coord,
                 y_coord=self.y_coord,
-                x_shift=0,
-                y_shift=0,
                 t_start=current_time,
                 t_end=current_time + 1,
                 shape=self.__shape_current__,
                 cell_density=self.__grid__.__cell_density__,
+                exact=self.__grid__.__exact_rasterization__,
+                tolerance=self.__rasterization_tolerance__,
             )
             has_immediate_collision = False
-            for (x_cell, y_cell), (t_start, t_end) in blocks.items():
-                cell = self.__grid__.__cells__[y_cell][x_cell]
+            cells = self.__grid__.__cells__
+            static_layer = self.__grid__.__static_layer__
+            for x_cell, y_cell in blocks.keys():
                 # Check for collisions with other entities in the cell
-                for (
-                    other_t_start,
-                    other_t_end,
-                    other_entity_id,
-                ) in cell.values():
-                    # Note: This does not use t_start and t_end as we only check for the current point in time,
-                    # but ShapeMoverUtils requires a non zero time interval to calculate the blocks
-                    if (
-                        current_time < other_t_end
-                        and current_time >= other_t_start
-                    ):
-                        has_immediate_collision = True
-                        break
-                if has_immediate_collision:
+                # Note: This does not use t_start and t_end as we only check for the current point in time,
+                # but ShapeMoverUtils requires a non zero time interval to calculate the blocks
+                if static_layer.is_occupied(
+                    x_cell, y_cell, current_time
+                ) or cells.is_occupied(x_cell, y_cell, current_time):
+                    has_immediate_collision = True
                     break
             if not safe_create and has_immediate_collision:
                 raise Exception(
@@ -187,9 +262,23 @@ class Entity:
                         )
                         return
                 else:
-                    # Try again after incrementing the time
+                    # Try again at the earliest time that the footprint is free
+                    placement_time = (
+                        self.__grid__.__safe_intervals__.get_earliest_safe_time(
+                            cells=[
+                                (x_cell, y_cell)
+                                for x_cell, y_cell in blocks.keys()
+                                if 0 <= x_cell < static_layer.x_cells
+                                and 0 <= y_cell < static_layer.y_cells
+                            ],
+                            time=current_time,
+                        )
+                    )
+                    if placement_time is None:
+                        # The footprint is blocked until the end of the simulation (eg: by a parked entity)
+                        placement_time = current_time + safe_create_increment
                     self.__grid__.add_event(
-                        time=current_time + safe_create_increment,
+                        time=placement_time,
                         object=self,
                         method="__place_on_grid__",
                         kwargs={
@@ -205,15 +294,11 @@ class Entity:
                     return
 
         self.__on_grid__ = True
-        self.__route_start_time__ = self.get_time()
-        self.history.append(
-            {
-                "x": self.x_coord,
-                "y": self.y_coord,
-                "t": self.get_time(),
-                "c": False,
-            }
+        self.__set_planned_route__(
+            waypoints=self.__planned_waypoints__,
+            route_start_time=self.get_time(),
         )
+        self.history.record(x=self.x_coord, y=self.y_coord, t=self.get_time())
         self.__realize_route__(
             is_result_of_collision=False,
             raise_on_future_collision=raise_on_future_collision,
@@ -242,32 +327,40 @@ class Entity:
         self.__route_start_time__ = None
         self.__grid__ = None
         self.__on_grid__ = False
+        unbind_unchecked_methods(self)
 
     def __clear_blocked_grid_cells__(self) -> None:
         """
-        Clears the blocked grid cells for this entity.
+        Clears the blocked grid cells and parking for this entity.
         """
-        for x_cell, y_cell, block_id in self.__blocked_grid_cells__:
-            cell = self.__grid__.__cells__[y_cell][x_cell]
-            cell.pop(block_id, None)
-        self.__blocked_grid_cells__ = []
+        cells = self.__grid__.__cells__
+        safe_intervals = self.__grid__.__safe_intervals__
+        for (
+            x_cell,
+            y_cell,
+            _,
+            _,
+        ), block_id in self.__blocked_grid_cells__.items():
+            cells.remove(x_cell, y_cell, block_id)
+            safe_intervals.remove(x_cell, y_cell)
+        self.__blocked_grid_cells__ = {}
+        static_layer = self.__grid__.__static_layer__
+        for x_cell, y_cell in self.__parking_cells__:
+            static_layer.remove(x_cell, y_cell, self.id)
+            safe_intervals.remove(x_cell, y_cell)
+        self.__parking_cells__ = []
+        self.__parking_start_time__ = None
 
     def __clear_future_events__(self, clear_event_types=["system"]) -> None:
         """
         Clears the future events for this entity.
         """
+        remove_event = self.__grid__.__queue__.remove_event
         for event_type in clear_event_types:
-            for (
-                this_event_id,
-                related_event_id,
-            ) in self.__future_event_ids__[event_type].items():
-                # Remove the event from the queue
-                event_obj = self.__grid__.__queue__.remove_event(this_event_id)
-                # If this event is a standard route_end event, it will not have an related event, so we can be done here
-                # If the event_obj is None, it has already been processed or removed so we can skip any further processing
-                # If this event is a collision event, it will have an associated event and should be removed too
-                if related_event_id != None and event_obj != None:
-                    self.__grid__.__queue__.remove_event(related_event_id)
+            # Collision events are shared with the colliding entity, so removing one here cancels it for both entities
+            # If an event has already been processed or removed, this is a no-op
+            for event_id in self.__future_event_ids__[event_type]:
+                remove_event(event_id)
             self.__future_event_ids__[event_type] = {}
 
     def __waypoint_check__(self, waypoints) -> None:
@@ -363,12 +456,25 @@ class Entity:
         )  # Make a copy of the waypoints to avoid modifying the original list
 
         # Setup util attributes
-        self.__clear_blocked_grid_cells__()
         self.__clear_future_events__(clear_event_types=["system"])
 
         x_tmp = self.x_coord
         y_tmp = self.y_coord
         t_tmp = self.get_time()
+        current_time = t_tmp
+
+        # Reservations from the previous plan are diffed against the new plan instead of being cleared up front
+        # Reservations are keyed by (x_cell, y_cell, t_start, t_end) so unchanged reservations can be kept in place
+        cells = self.__grid__.__cells__
+        previous_blocks = self.__blocked_grid_cells__
+        previous_block_count = len(previous_blocks)
+        # Reservations already in progress only matter from now on, so they can match new reservations starting now
+        started_blocks = {}
+        for key in previous_blocks:
+            if key[2] < current_time < key[3]:
+                started_blocks[(key[0], key[1], key[3])] = key
+        blocked_grid_cells = {}
+        reservations_kept = 0
 
         collisions = {}
         total_route_time_shift = sum([waypoint[2] for waypoint in waypoints])
@@ -406,28 +512,27 @@ class Entity:
             )
 
         # Store the route waypoints and start time for later use to determine the entity's position at a given time
-        self.__planned_waypoints__ = waypoints
-        self.__route_start_time__ = self.get_time()
+        self.__set_planned_route__(
+            waypoints=waypoints, route_start_time=self.get_time()
+        )
         route_end_time = min(
             self.__grid__.__max_time__,
             self.__route_start_time__ + total_route_time_shift,
         )
 
         # For each route waypoint, calculate the blocks and collisions and add them to the grid
-        for waypoint in waypoints:
+        # The final (parking) waypoint is handled separately below
+        static_layer = self.__grid__.__static_layer__
+        for waypoint in waypoints[:-1]:
             x_shift = waypoint[0] - x_tmp
             y_shift = waypoint[1] - y_tmp
-            if len(waypoint) == 4:
-                orientation = waypoint[3]
-                self.__shape_current__ = Shape.rotate(
-                    radians=orientation, shape=self.shape
-                )
-            elif self.__auto_rotate__:
-                if x_shift != 0 or y_shift != 0:
-                    self.__shape_current__ = Shape.get_rotated_shape(
-                        shape=self.shape, x_shift=x_shift, y_shift=y_shift
-                    )
-            blocks = ShapeMoverUtils.moving_shape_overlap_intervals(
+            self.__shape_current__ = self.__get_waypoint_shape__(
+                waypoint=waypoint,
+                x_shift=x_shift,
+                y_shift=y_shift,
+                shape=self.__shape_current__,
+            )
+            blocks = self.__get_segment_blocks__(
                 x_coord=x_tmp,
                 y_coord=y_tmp,
                 x_shift=x_shift,
@@ -435,7 +540,6 @@ class Entity:
                 t_start=t_tmp,
                 t_end=t_tmp + waypoint[2],
                 shape=self.__shape_current__,
-                cell_density=self.__grid__.__cell_density__,
             )
             x_tmp = waypoint[0]
             y_tmp = waypoint[1]
@@ -455,63 +559,139 @@ class Entity:
                     # TODO: Determine if this should be an exception or just a warning
                     # print(f"Warning: Entity {self.name} is outside of the grid bounds is outside of the grid bounds based on its shape.")
                     continue
-                # Store a unique block_id to allow for removal of the block later
-                block_id = unique_id()
-                # Get the relevant cell in the grid
-                cell = self.__grid__.__cells__[y_cell][x_cell]
-                # Check for collisions with other entities in the cell
+                key = (x_cell, y_cell, t_start, t_end)
+                if key in blocked_grid_cells:
+                    # An identical reservation is already part of this route
+                    continue
+                # Keep the matching reservation from the previous plan if there is one
+                block_id = previous_blocks.pop(key, None)
+                if block_id is None and t_start == current_time:
+                    started_key = started_blocks.pop(
+                        (x_cell, y_cell, t_end), None
+                    )
+                    if started_key is not None:
+                        block_id = previous_blocks.pop(started_key)
+                if block_id is not None:
+                    reservations_kept += 1
+                blocked_grid_cells[key] = block_id
+
+        # Park the entity where its route ends until the end of the simulation
+        # Parking is stored as open-ended blocks in the grid's static layer instead of as cell reservations
+        if waypoints[-1][2] > 0:
+            parking_start_time = t_tmp
+            parking_cells = self.__get_parking_cells__(
+                x_coord=x_tmp, y_coord=y_tmp, shape=self.__shape_current__
+            )
+        else:
+            parking_start_time = None
+            parking_cells = []
+        # Only the part of the previous parking after now still matters, so staying parked in place keeps it as is
+        keep_parking = (
+            parking_start_time is not None
+            and parking_cells == self.__parking_cells__
+            and max(self.__parking_start_time__, current_time)
+            == parking_start_time
+        )
+
+        # Remove the reservations and parking from the previous plan that are no longer needed
+        safe_intervals = self.__grid__.__safe_intervals__
+        for (x_cell, y_cell, _, _), block_id in previous_blocks.items():
+            cells.remove(x_cell, y_cell, block_id)
+            safe_intervals.remove(x_cell, y_cell)
+        if not keep_parking:
+            for x_cell, y_cell in self.__parking_cells__:
+                static_layer.remove(x_cell, y_cell, self.id)
+                safe_intervals.remove(x_cell, y_cell)
+        for key, block_id in blocked_grid_cells.items():
+            x_cell, y_cell, t_start, t_end = key
+            # Check for collisions with static entities and other entities in the cell
+            # Static and parked entities come first as their blocks were added to the cell before any later reservations
+            overlaps = cells.get_overlaps(x_cell, y_cell, t_start, t_end)
+            if static_layer.is_blocked(x_cell, y_cell):
+                overlaps = (
+                    static_layer.get_overlaps(x_cell, y_cell, t_start, t_end)
+                    + overlaps
+                )
+            for (
+                other_t_start,
+                other_t_end,
+                other_entity_id,
+            ) in overlaps:
+                # Skip the kept reservation or parking of this entity in this cell
+                if other_entity_id == self.id:
+                    continue
+                # Determine the time of the collision and store the most recent collision time with each colliding entity
+                collision_time = max(t_start, other_t_start)
+                previous_collision_time = collisions.get(other_entity_id)
+                if (
+                    previous_collision_time is None
+                    or collision_time < previous_collision_time
+                ):
+                    collisions[other_entity_id] = collision_time
+            if block_id is None:
+                # Block the grid cell for the entity
+                # Store the returned block_id to allow for removal of the block later
+                blocked_grid_cells[key] = cells.add(
+                    x_cell, y_cell, t_start, t_end, self.id
+                )
+                safe_intervals.add(x_cell, y_cell, t_start, t_end)
+        self.__blocked_grid_cells__ = blocked_grid_cells
+
+        # Check for collisions where the entity parks and block its parking cells
+        if parking_start_time is not None:
+            max_time = self.__grid__.__max_time__
+            for x_cell, y_cell in parking_cells:
+                overlaps = cells.get_overlaps(
+                    x_cell, y_cell, parking_start_time, max_time
+                )
+                if static_layer.is_blocked(x_cell, y_cell):
+                    overlaps = (
+                        static_layer.get_overlaps(
+                            x_cell, y_cell, parking_start_time, max_time
+                        )
+                        + overlaps
+                    )
                 for (
                     other_t_start,
                     other_t_end,
                     other_entity_id,
-                ) in cell.values():
-                    if t_start < other_t_end and t_end > other_t_start:
-                        # Determine the time of the collision and store the most recent collision time with each colliding entity
-                        collision_time = max(t_start, other_t_start)
-                        previous_collision_time = collisions.get(
-                            other_entity_id
-                        )
-                        if (
-                            previous_collision_time is None
-                            or collision_time < previous_collision_time
-                        ):
-                            collisions[other_entity_id] = collision_time
-                # Block the grid cell for the entity
-                cell[block_id] = (t_start, t_end, self.id)
-                # Store the blocked grid cell for later removal
-                self.__blocked_grid_cells__.append((x_cell, y_cell, block_id))
+                ) in overlaps:
+                    # Skip the route or kept parking of this entity in this cell
+                    if other_entity_id == self.id:
+                        continue
+                    collision_time = max(parking_start_time, other_t_start)
+                    previous_collision_time = collisions.get(other_entity_id)
+                    if (
+                        previous_collision_time is None
+                        or collision_time < previous_collision_time
+                    ):
+                        collisions[other_entity_id] = collision_time
+        previous_parking_count = len(self.__parking_cells__)
+        if not keep_parking:
+            for x_cell, y_cell in parking_cells:
+                static_layer.add(x_cell, y_cell, parking_start_time, self.id)
+                safe_intervals.add(
+                    x_cell, y_cell, parking_start_time, static_layer.max_time
+                )
+            self.__parking_cells__ = parking_cells
+            self.__parking_start_time__ = parking_start_time
+
+        reservation_stats = self.__grid__.__reservation_stats__
+        reservation_stats["kept"] += reservations_kept
+        reservation_stats["added"] += (
+            len(blocked_grid_cells) - reservations_kept
+        )
+        reservation_stats["removed"] += previous_block_count - reservations_kept
+        if keep_parking:
+            reservation_stats["kept"] += len(parking_cells)
+        else:
+            reservation_stats["added"] += len(parking_cells)
+            reservation_stats["removed"] += previous_parking_count
         if raise_on_future_collision and len(collisions) > 0:
             raise Exception(
                 f"{self.__repr__()} collides with other entities now or in the future. "
             )
-        # Create collision events for the first collision with each colliding entity
-        for other_entity_id, collision_time in collisions.items():
-            other_entity = self.__grid__.__entities__[other_entity_id]
-            event_id = self.__grid__.add_event(
-                time=collision_time,
-                object=self,
-                method="__realize_route__",
-                kwargs={
-                    "is_result_of_collision": True,
-                    "clear_event_types": ["system", "user"],
-                },
-                priority=3,
-            )
-            other_event_id = self.__grid__.add_event(
-                time=collision_time,
-                object=other_entity,
-                method="__realize_route__",
-                kwargs={
-                    "is_result_of_collision": True,
-                    "clear_event_types": ["system", "user"],
-                },
-                priority=3,
-            )
-            # Store the event_id for each entity involved in the collision
-            self.__future_event_ids__["system"][event_id] = other_event_id
-            other_entity.__future_event_ids__["system"][
-                other_event_id
-            ] = event_id
+        self.__add_collision_events__(collisions)
 
         if route_end_time > self.get_time():
             # Add a route_end event for this entity at the timing of the end of the route
@@ -533,6 +713,312 @@ class Entity:
             output["collisions"] = collisions
         return output
 
+    def __get_waypoint_shape__(
+        self,
+        waypoint: tuple[int | float, ...],
+        x_shift: int | float,
+        y_shift: int | float,
+        shape: list[list[int | float]],
+    ) -> list[list[int | float]]:
+        """
+        Returns the shape of this entity while it moves to a waypoint.
+
+        Args:
+
+        - waypoint (tuple[int|float, ...]): The waypoint the entity is moving to.
+        - x_shift (int|float): The change in x-coordinate to reach the waypoint.
+        - y_shift (int|float): The change in y-coordinate to reach the waypoint.
+        - shape (list[list[int|float]]): The shape of the entity before moving to the waypoint.
+
+        Returns:
+
+        - list[list[int|float]]: The shape of the entity while moving to the waypoint.
+        """
+        if len(waypoint) == 4:
+            return self.__grid__.__shape_utils__.rotate(
+                radians=waypoint[3], shape=self.shape
+            )
+        if self.__auto_rotate__ and (x_shift != 0 or y_shift != 0):
+            return self.__grid__.__shape_utils__.get_rotated_shape(
+                shape=self.shape, x_shift=x_shift, y_shift=y_shift
+            )
+        return shape
+
+    def __get_segment_blocks__(
+        self,
+        x_coord: int | float,
+        y_coord: int | float,
+        x_shift: int | float,
+        y_shift: int | float,
+        t_start: int | float,
+        t_end: int | float,
+        shape: list[list[int | float]],
+    ) -> dict:
+        """
+        Returns the cells (and the time intervals) that this entity blocks while moving (or waiting) over one route segment.
+
+        Args:
+
+        - x_coord (int|float): The x-coordinate at the start of the segment.
+        - y_coord (int|float): The y-coordinate at the start of the segment.
+        - x_shift (int|float): The change in x-coordinate over the segment.
+        - y_shift (int|float): The change in y-coordinate over the segment.
+        - t_start (int|float): The start time of the segment.
+        - t_end (int|float): The end time of the segment.
+        - shape (list[list[int|float]]): The shape of the entity over the segment.
+
+        Returns:
+
+        - dict[tuple(int,int),tuple(int|float,int|float)]: A dictionary mapping each blocked cell to (t_start, t_end).
+            - Note: This can include cells outside of the grid bounds.
+        """
+        grid = self.__grid__
+        if x_shift == 0 and y_shift == 0:
+            # Waiting footprints are looked up from the grid's footprint cache
+            return grid.__footprint_cache__.get_overlap_intervals(
+                x_coord=x_coord,
+                y_coord=y_coord,
+                t_start=t_start,
+                t_end=t_end,
+                shape=shape,
+                cell_density=grid.__cell_density__,
+                exact=grid.__exact_rasterization__,
+                tolerance=self.__rasterization_tolerance__,
+            )
+        return ShapeMoverUtils.moving_shape_overlap_intervals(
+            x_coord=x_coord,
+            y_coord=y_coord,
+            x_shift=x_shift,
+            y_shift=y_shift,
+            t_start=t_start,
+            t_end=t_end,
+            shape=shape,
+            cell_density=grid.__cell_density__,
+            exact=grid.__exact_rasterization__,
+            tolerance=self.__rasterization_tolerance__,
+        )
+
+    def __get_parking_cells__(
+        self,
+        x_coord: int | float,
+        y_coord: int | float,
+        shape: list[list[int | float]],
+    ) -> list[tuple[int, int]]:
+        """
+        Returns the cells within the grid bounds that this entity blocks while parked.
+
+        Args:
+
+        - x_coord (int|float): The x-coordinate where the entity parks.
+        - y_coord (int|float): The y-coordinate where the entity parks.
+        - shape (list[list[int|float]]): The shape of the entity while parked.
+
+        Returns:
+
+        - list[tuple(int,int)]: The (x_cell, y_cell) coordinates of each blocked cell.
+        """
+        grid = self.__grid__
+        static_layer = grid.__static_layer__
+        return [
+            (x_cell, y_cell)
+            for x_cell, y_cell in grid.__footprint_cache__.get_footprint(
+                x_coord=x_coord,
+                y_coord=y_coord,
+                shape=shape,
+                cell_density=grid.__cell_density__,
+                exact=grid.__exact_rasterization__,
+                tolerance=self.__rasterization_tolerance__,
+            )
+            if 0 <= x_cell < static_layer.x_cells
+            and 0 <= y_cell < static_layer.y_cells
+        ]
+
+    def __get_route_collisions__(
+        self,
+        waypoints: list[tuple[int | float, ...]],
+        segment_cache: dict | None = None,
+    ) -> dict:
+        """
+        Returns the collisions this entity would have if it planned a route now, without changing the grid or its queue.
+
+        Collisions are found the same way as when the route is planned. This entity's own reservations are ignored.
+
+        Args:
+
+        - waypoints (list[tuple[int|float, ...]]): The waypoints of the route (without the final parking waypoint).
+        - segment_cache (dict|None): A dictionary to store the collisions of each route segment in.
+            - Default: None
+            - Pass the same dictionary when checking multiple routes at the same time and grid state to share work
+              between routes that have segments in common.
+
+        Returns:
+
+        - dict: A dictionary of colliding entity ids (keys) and their first collision times (values).
+        """
+        max_time = self.__grid__.__max_time__
+        if segment_cache is None:
+            segment_cache = {}
+        x_tmp = self.x_coord
+        y_tmp = self.y_coord
+        t_tmp = self.get_time()
+        shape = self.__shape_current__
+        total_route_time_shift = sum([waypoint[2] for waypoint in waypoints])
+        parking_time_shift = max(max_time - t_tmp - total_route_time_shift, 0)
+        # Each segment is checked as (x_coord, y_coord, x_end, y_end, t_start, t_end, shape)
+        # Parking is checked as a segment with no end time
+        segments = []
+        for waypoint in waypoints:
+            shape = self.__get_waypoint_shape__(
+                waypoint=waypoint,
+                x_shift=waypoint[0] - x_tmp,
+                y_shift=waypoint[1] - y_tmp,
+                shape=shape,
+            )
+            segments.append(
+                (
+                    x_tmp,
+                    y_tmp,
+                    waypoint[0],
+                    waypoint[1],
+                    t_tmp,
+                    t_tmp + waypoint[2],
+                    shape,
+                )
+            )
+            x_tmp = waypoint[0]
+            y_tmp = waypoint[1]
+            t_tmp = t_tmp + waypoint[2]
+        if parking_time_shift > 0:
+            segments.append((x_tmp, y_tmp, x_tmp, y_tmp, t_tmp, None, shape))
+
+        collisions = {}
+        for segment in segments:
+            segment_key = segment[:6] + (
+                tuple(tuple(coord) for coord in segment[6]),
+            )
+            segment_collisions = segment_cache.get(segment_key)
+            if segment_collisions is None:
+                segment_collisions = self.__get_segment_collisions__(*segment)
+                segment_cache[segment_key] = segment_collisions
+            for other_entity_id, collision_time in segment_collisions.items():
+                previous_collision_time = collisions.get(other_entity_id)
+                if (
+                    previous_collision_time is None
+                    or collision_time < previous_collision_time
+                ):
+                    collisions[other_entity_id] = collision_time
+        return collisions
+
+    def __get_segment_collisions__(
+        self,
+        x_start: int | float,
+        y_start: int | float,
+        x_end: int | float,
+        y_end: int | float,
+        t_start: int | float,
+        t_end: int | float | None,
+        shape: list[list[int | float]],
+    ) -> dict:
+        """
+        Returns the collisions this entity would have while moving (or waiting) over one route segment, without changing the grid.
+
+        This entity's own reservations are ignored.
+
+        Args:
+
+        - x_start (int|float): The x-coordinate at the start of the segment.
+        - y_start (int|float): The y-coordinate at the start of the segment.
+        - x_end (int|float): The x-coordinate at the end of the segment.
+        - y_end (int|float): The y-coordinate at the end of the segment.
+        - t_start (int|float): The start time of the segment.
+        - t_end (int|float|None): The end time of the segment.
+            - If None, the entity parks at (x_start, y_start) from t_start until the end of the simulation.
+        - shape (list[list[int|float]]): The shape of the entity over the segment.
+
+        Returns:
+
+        - dict: A dictionary of colliding entity ids (keys) and their first collision times (values).
+        """
+        grid = self.__grid__
+        cells = grid.__cells__
+        static_layer = grid.__static_layer__
+        x_cells = static_layer.x_cells
+        y_cells = static_layer.y_cells
+        if t_end is None:
+            blocks = [
+                (x_cell, y_cell, t_start, grid.__max_time__)
+                for x_cell, y_cell in self.__get_parking_cells__(
+                    x_coord=x_start, y_coord=y_start, shape=shape
+                )
+            ]
+        else:
+            blocks = [
+                (x_cell, y_cell, block_t_start, block_t_end)
+                for (x_cell, y_cell), (
+                    block_t_start,
+                    block_t_end,
+                ) in self.__get_segment_blocks__(
+                    x_coord=x_start,
+                    y_coord=y_start,
+                    x_shift=x_end - x_start,
+                    y_shift=y_end - y_start,
+                    t_start=t_start,
+                    t_end=t_end,
+                    shape=shape,
+                ).items()
+                if 0 <= x_cell < x_cells and 0 <= y_cell < y_cells
+            ]
+        collisions = {}
+        for x_cell, y_cell, block_t_start, block_t_end in blocks:
+            overlaps = cells.get_overlaps(
+                x_cell, y_cell, block_t_start, block_t_end
+            )
+            if static_layer.is_blocked(x_cell, y_cell):
+                overlaps = (
+                    static_layer.get_overlaps(
+                        x_cell, y_cell, block_t_start, block_t_end
+                    )
+                    + overlaps
+                )
+            for other_t_start, other_t_end, other_entity_id in overlaps:
+                # Skip this entity's own reservations and parking
+                if other_entity_id == self.id:
+                    continue
+                collision_time = max(block_t_start, other_t_start)
+                previous_collision_time = collisions.get(other_entity_id)
+                if (
+                    previous_collision_time is None
+                    or collision_time < previous_collision_time
+                ):
+                    collisions[other_entity_id] = collision_time
+        return collisions
+
+    def __add_collision_events__(self, collisions: dict) -> None:
+        """
+        Adds a collision event to the queue for each colliding entity.
+
+        Each event resolves both this entity and the colliding entity, so a single queue entry is used per collision.
+
+        Args:
+
+        - collisions (dict): A dictionary of colliding entity ids (keys) and their first collision times (values).
+        """
+        for other_entity_id, collision_time in collisions.items():
+            other_entity = self.__grid__.__entities__[other_entity_id]
+            event_id = self.__grid__.add_event(
+                time=collision_time,
+                object=self.__grid__,
+                method="__resolve_collision__",
+                kwargs={
+                    "entity": self,
+                    "other_entity": other_entity,
+                },
+                priority=3,
+            )
+            # Store the event_id for both entities so that either one can cancel the collision
+            self.__future_event_ids__["system"][event_id] = None
+            other_entity.__future_event_ids__["system"][event_id] = None
+
     def __realize_route__(
         self,
         is_result_of_collision: bool = False,
@@ -563,7 +1049,7 @@ class Entity:
         x_coord, y_coord = self.get_current_location(update_history=True)
         # If the entity is in a collision, update the last history entry to reflect that
         if is_result_of_collision:
-            self.history[-1]["c"] = True
+            self.history.set_collision()
 
         # Set the entity's position to where they are at this point in time
         self.x_coord = x_coord
@@ -599,6 +1085,7 @@ class Entity:
         This method is used to check if the route is valid and does not cause any collisions with other entities.
         - Note: The entity must be available for this check to work and this does not change the entity's availability.
         - Note: This does not update the entity's position or history.
+        - Note: This does not change the grid's reservations or event queue.
 
         Args:
 
@@ -609,18 +1096,50 @@ class Entity:
             - has_collision (bool): Whether the route has a collision with another entity.
             - collisions (dict): A dictionary of colliding entity ids (keys) and their collision times (values).
 
+        """
+        return self.check_routes(waypoints_list=[waypoints])[0]
+
+    def check_routes(
+        self,
+        waypoints_list: list[
+            list[tuple[int | float, int | float, int | float]]
+        ],
+    ) -> list[dict]:
+        """
+        Checks multiple candidate routes for this entity at the current simulation time without actually planning any of them.
+        This is equivalent to calling `check_route` for each route, but routes that have segments in common
+        (for example the same first leg) only rasterize and check those segments once.
+        - Note: The entity must be available for this check to work and this does not change the entity's availability.
+        - Note: This does not change the grid's reservations or event queue.
+
+        Args:
+
+        - waypoints_list (list[list[tuple[int | float, int | float, int | float]]]): A list of routes to check.
+            - Each route is a list of waypoints as passed to `check_route`.
+
+        Returns:
+
+        - list[dict]: The result of `check_route` for each route in the same order as waypoints_list.
         """
         if not self.__is_available__:
             raise Exception("Only available entities can check routes.")
-        output = self.__plan_route__(
-            waypoints=waypoints,
-            return_collisions=True,
-        )
-        self.__clear_future_events__(clear_event_types=["system", "user"])
-        self.__is_available__ = True
-        self.__plan_route__(
-            waypoints=[],
-        )
+        if not self.__on_grid__:
+            raise Exception(
+                "Entity is not on this grid yet, but is attempting to check a route."
+            )
+        segment_cache = {}
+        output = []
+        for waypoints in waypoints_list:
+            self.__waypoint_check__(waypoints)
+            collisions = self.__get_route_collisions__(
+                waypoints=waypoints, segment_cache=segment_cache
+            )
+            output.append(
+                {
+                    "has_collision": len(collisions) > 0,
+                    "collisions": collisions,
+                }
+            )
         return output
 
     def add_route(
@@ -675,6 +1194,28 @@ class Entity:
         )
         self.__future_event_ids__["user"][event_id] = None
 
+    def __set_planned_route__(
+        self, waypoints: list, route_start_time: int | float
+    ) -> None:
+        """
+        Stores the planned route waypoints and start time for later use to determine the entity's position at a given time.
+
+        Args:
+
+        - waypoints (list[tuple[int|float,int|float,int|float]]): The planned waypoints including the final parking waypoint.
+        - route_start_time (int|float): The time at which the route starts.
+        """
+        self.__planned_waypoints__ = waypoints
+        self.__route_start_time__ = route_start_time
+        # Store the time each waypoint is reached so the current waypoint can be found with a bisect
+        # Note: These are accumulated in order so they exactly match the times used when walking the waypoints
+        planned_end_times = []
+        t_loc = route_start_time
+        for waypoint in waypoints:
+            t_loc = t_loc + waypoint[2]
+            planned_end_times.append(t_loc)
+        self.__planned_end_times__ = planned_end_times
+
     def get_current_location(
         self, update_history: bool = False
     ) -> tuple[int | float, int | float]:
@@ -692,24 +1233,17 @@ class Entity:
 
         - tuple[int | float, int | float]: The current coordinates of the entity.
         """
+        history_mode = self.history.mode
+        if not update_history or history_mode == "off":
+            return self.__get_planned_location__(self.get_time())
         x_loc = self.x_coord
         y_loc = self.y_coord
         t_loc = self.__route_start_time__
         current_time = self.get_time()
         # Add the initial location to the history to signify when the route started
-        if (
-            update_history
-            and len(self.__planned_waypoints__) > 0
-            and current_time >= t_loc
-        ):
-            self.history.append(
-                {
-                    "x": x_loc,
-                    "y": y_loc,
-                    "t": t_loc,
-                    "c": False,
-                }
-            )
+        if len(self.__planned_waypoints__) > 0 and current_time >= t_loc:
+            self.history.record(x=x_loc, y=y_loc, t=t_loc)
+        reached_waypoint = False
         for waypoint in self.__planned_waypoints__:
             # End the route realization if the time is greater than the current time
             if t_loc >= current_time:
@@ -725,24 +1259,70 @@ class Entity:
                 x_loc = waypoint[0]
                 y_loc = waypoint[1]
                 t_loc = t_loc + waypoint[2]
+            reached_waypoint = True
 
             # This rounding is needed to ensure that rounding errors in python do not create a permanent collisions between entities
             if self.__location_precision__ is not None:
                 x_loc = round(x_loc, self.__location_precision__)
                 y_loc = round(y_loc, self.__location_precision__)
-            if update_history:
+            if history_mode == "full":
                 # Update the history with the current location
-                # Note: This is only done if update_history is True, which is used to update the history when the entity is moved
-                #       or when the route is realized.
-                self.history.append(
-                    {
-                        "x": x_loc,
-                        "y": y_loc,
-                        "t": t_loc,
-                        "c": False,  # This is updated to True in the realize_route method if the entity is in a collision
-                    }
-                )
+                # Note: c is updated to True in the realize_route method if the entity is in a collision
+                self.history.record(x=x_loc, y=y_loc, t=t_loc)
+        # Only record where the route was realized if recording endpoints
+        if history_mode == "endpoints" and reached_waypoint:
+            self.history.record(x=x_loc, y=y_loc, t=t_loc)
+
+        return (x_loc, y_loc)
+
+    def __get_planned_location__(
+        self, time: int | float
+    ) -> tuple[int | float, int | float]:
+        """
+        Returns the location of the entity at a given time along its planned route.
 
+        This finds the waypoint in progress with a bisect over the waypoint end times and interpolates within it.
+        It returns the same location as walking the planned waypoints in `get_current_location`.
+
+        Args:
+
+        - time (int|float): The time at which to get the location.
+            - This should not be earlier than the route start time.
+
+        Returns:
+
+        - tuple[int | float, int | float]: The (x_coord, y_coord) of the entity at the given time.
+        """
+        waypoints = self.__planned_waypoints__
+        planned_end_times = self.__planned_end_times__
+        if len(waypoints) == 0 or self.__route_start_time__ >= time:
+            return (self.x_coord, self.y_coord)
+        # The last waypoint that started before the given time is the first one that ends at or after it (or the last one)
+        idx = bisect.bisect_left(planned_end_times, time, 0, len(waypoints) - 1)
+        # Start from the previous waypoint (or the current location for the first waypoint)
+        if idx == 0:
+            x_loc = self.x_coord
+            y_loc = self.y_coord
+            t_loc = self.__route_start_time__
+        else:
+            x_loc = waypoints[idx - 1][0]
+            y_loc = waypoints[idx - 1][1]
+            t_loc = planned_end_times[idx - 1]
+            if self.__location_precision__ is not None:
+                x_loc = round(x_loc, self.__location_precision__)
+                y_loc = round(y_loc, self.__location_precision__)
+        waypoint = waypoints[idx]
+        # Get partial location if interrupted by the given time
+        if planned_end_times[idx] > time:
+            pct_complete = (time - t_loc) / waypoint[2]
+            x_loc = (waypoint[0] - x_loc) * pct_complete + x_loc
+            y_loc = (waypoint[1] - y_loc) * pct_complete + y_loc
+        else:
+            x_loc = waypoint[0]
+            y_loc = waypoint[1]
+        if self.__location_precision__ is not None:
+            x_loc = round(x_loc, self.__location_precision__)
+            y_loc = round(y_loc, self.__location_precision__)
         return (x_loc, y_loc)
 
     def cancel_route(
@@ -836,6 +1416,125 @@ class StaticEntity(Entity):
             waypoints=[], raise_on_future_collision=raise_on_future_collision
         )
 
+    def __plan_route__(
+        self,
+        waypoints: list[tuple[int | float, ...]],
+        raise_on_future_collision: bool = False,
+        bypass_availability_check: bool = False,
+        return_collisions: bool = False,
+    ) -> dict:
+        """
+        Overrides the __plan_route__ method to block the cells of this static entity in the grid's static layer.
+
+        The cells are written to the static layer once when the entity is placed and are not stored as reservations in the grid cells.
+        Each call checks for collisions with reservations of other entities in the blocked cells.
+
+        Args:
+
+        - waypoints (list[tuple[int|float,int|float,int|float]]): Ignored as static entities do not move.
+        - raise_on_future_collision (bool): Whether to raise an exception if the entity has any future plans that result in a collision.
+        - bypass_availability_check (bool): Ignored as static entities are always available.
+        - return_collisions (bool): Whether to return the collisions dictionary when finished planning the route.
+
+        Returns:
+
+        - dict: A dictionary containing the following keys:
+            - has_collision (bool): Whether the static entity has a collision with another entity.
+            - collisions (dict): A dictionary of colliding entity ids (keys) and their collision times (values).
+                - Only returned if return_collisions is True.
+        """
+        if not self.__on_grid__:
+            raise Exception(
+                "Entity is not on this grid yet, but is attempting to plan a route. Either it has not been assigned to this grid, or the time it will be placed on the grid is in the future."
+            )
+        self.__clear_future_events__(clear_event_types=["system"])
+
+        cells = self.__grid__.__cells__
+        static_layer = self.__grid__.__static_layer__
+        t_start = self.get_time()
+        t_end = self.__grid__.__max_time__
+        self.__set_planned_route__(
+            waypoints=[(self.x_coord, self.y_coord, max(t_end - t_start, 0))],
+            route_start_time=t_start,
+        )
+
+        # Write the cells to the static layer the first time this entity is planned
+        if len(self.__blocked_grid_cells__) == 0:
+            blocks = ShapeMoverUtils.moving_shape_overlap_intervals(
+                x_coord=self.x_coord,
+                y_coord=self.y_coord,
+                x_shift=0,
+                y_shift=0,
+                t_start=t_start,
+                t_end=t_end,
+                shape=self.__shape_current__,
+                cell_density=self.__grid__.__cell_density__,
+                exact=self.__grid__.__exact_rasterization__,
+                tolerance=self.__rasterization_tolerance__,
+            )
+            for x_cell, y_cell in blocks.keys():
+                # Skip cells outside of the grid bounds
+                if (
+                    x_cell < 0
+                    or y_cell < 0
+                    or x_cell >= static_layer.x_cells
+                    or y_cell >= static_layer.y_cells
+                ):
+                    continue
+                static_layer.add(x_cell, y_cell, t_start, self.id)
+                self.__grid__.__safe_intervals__.add(
+                    x_cell, y_cell, t_start, static_layer.max_time
+                )
+                self.__blocked_grid_cells__[(x_cell, y_cell)] = None
+
+        # Check for collisions with reservations and parked entities in the blocked cells
+        # Note: Other static entities share the static layer with parked entities, but never collide with static entities
+        entities = self.__grid__.__entities__
+        collisions = {}
+        for x_cell, y_cell in self.__blocked_grid_cells__:
+            overlaps = [
+                overlap
+                for overlap in static_layer.get_overlaps(
+                    x_cell, y_cell, t_start, t_end
+                )
+                if not isinstance(entities[overlap[2]], StaticEntity)
+            ]
+            overlaps += cells.get_overlaps(x_cell, y_cell, t_start, t_end)
+            for (
+                other_t_start,
+                other_t_end,
+                other_entity_id,
+            ) in overlaps:
+                collision_time = max(t_start, other_t_start)
+                previous_collision_time = collisions.get(other_entity_id)
+                if (
+                    previous_collision_time is None
+                    or collision_time < previous_collision_time
+                ):
+                    collisions[other_entity_id] = collision_time
+        if raise_on_future_collision and len(collisions) > 0:
+            raise Exception(
+                f"{self.__repr__()} collides with other entities now or in the future. "
+            )
+        self.__add_collision_events__(collisions)
+        output = {
+            "has_collision": len(collisions) > 0,
+        }
+        if return_collisions:
+            output["collisions"] = collisions
+        return output
+
+    def __clear_blocked_grid_cells__(self) -> None:
+        """
+        Clears the cells blocked by this static entity from the grid's static layer.
+        """
+        static_layer = self.__grid__.__static_layer__
+        safe_intervals = self.__grid__.__safe_intervals__
+        for x_cell, y_cell in self.__blocked_grid_cells__:
+            static_layer.remove(x_cell, y_cell, self.id)
+            safe_intervals.remove(x_cell, y_cell)
+        self.__blocked_grid_cells__ = {}
+
     def add_route(self, *arts, **kwargs) -> None:
         """
         Static entities cannot have routes. They are static and do not move. This method raises an exception if called.
@@ -945,7 +1644,9 @@ class GhostEntity(Entity):
             )
 
         # Store the route waypoints and start time for later use to determine the entity's position at a given time
-        self.__planned_waypoints__ = waypoints
+        self.__set_planned_route__(
+            waypoints=waypoints, route_start_time=self.__route_start_time__
+        )
         route_end_time = min(
             self.__grid__.__max_time__,
             self.__route_start_time__ + total_route_time_shift,
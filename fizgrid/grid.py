@@ -1,9 +1,70 @@
-import type_enforced
+import type_enforced, time
+from array import array
 from fizgrid.entities import Entity, StaticEntity
 from fizgrid.queue import TimeQueue
+from fizgrid.cells import cell_stores, StaticLayer, SafeIntervalIndex
+from fizgrid.utils import (
+    FootprintCache,
+    IDAllocator,
+    Shape,
+    UncheckedShape,
+    keep_unchecked,
+    bind_unchecked_methods,
+    unbind_unchecked_methods,
+    get_fast_mode_default,
+)
+
+
+class GridEvent:
+    """
+    A scheduled method call on an object.
+
+    The method is looked up when the event is dispatched, so methods that are rebound after the event is scheduled
+    (eg: by fast mode or monkeypatching) are used.
+    Events can still be read like the dictionaries that were used before, eg: `event["method"]`.
+    """
+
+    __slots__ = ("object", "method", "kwargs")
+
+    def __init__(self, object, method: str, kwargs: dict):
+        # Fail when the event is scheduled rather than when it is processed
+        if not hasattr(object, method):
+            raise AttributeError(
+                f"{object!r} has no method {method!r} to schedule"
+            )
+        self.object = object
+        self.method = method
+        self.kwargs = kwargs
+
+    def __getitem__(self, key: str):
+        if key not in ("object", "method", "kwargs"):
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        if key not in ("object", "method", "kwargs"):
+            return default
+        return getattr(self, key)
+
+    def __eq__(self, other):
+        if isinstance(other, GridEvent):
+            other = {
+                "object": other.object,
+                "method": other.method,
+                "kwargs": other.kwargs,
+            }
+        return {
+            "object": self.object,
+            "method": self.method,
+            "kwargs": self.kwargs,
+        } == other
+
+    def __repr__(self):
+        return f"GridEvent(object={self.object!r}, method={self.method!r}, kwargs={self.kwargs!r})"
 
 
 @type_enforced.Enforcer(enabled=True)
+@keep_unchecked("__resolve_collision__", "add_event")
 class Grid:
     def __init__(
         self,
@@ -13,6 +74,12 @@ class Grid:
         max_time: int = 1000,
         add_exterior_walls: bool = True,
         cell_density: int = 1,
+        cell_store: str = "dict",
+        queue_backend: str = "heap",
+        rasterization: str = "bounding_box",
+        footprint_cache_size: int = 1024,
+        fast_mode: bool | None = None,
+        recycle_block_ids: bool = True,
     ):
         """
         Initializes a grid with the specified parameters.
@@ -27,8 +94,47 @@ class Grid:
             - Default: True
         - cell_density (int): The number of cells per unit of length.
             - Default: 1
+        - cell_store (str): The type of reservation store to use for the grid cells.
+            - Default: "dict"
+            - Options:
+                - "dict": A dictionary of reservations per cell.
+                - "array": A struct of arrays with per cell slot indexes and a free list.
+                    - This uses substantially less memory for large grids.
+        - queue_backend (str): The priority queue backend used by the grid's TimeQueue.
+            - Default: "heap"
+            - Options:
+                - "heap": A binary min-heap.
+                - "calendar": A calendar queue with amortized O(1) enqueue and dequeue.
+                    - See `fizgrid.queue.TimeQueue` for details.
+        - rasterization (str): How entity shapes are converted into cell reservations as they move.
+            - Default: "bounding_box"
+            - Options:
+                - "bounding_box": Reserve every cell the moving bounding box of the shape passes through.
+                - "exact": Reserve only the cells (and times) that the shape itself overlaps.
+                    - This assumes entity shapes are convex.
+                    - This reduces reservations and false collisions for rotated and circular shapes.
+        - footprint_cache_size (int): The number of stationary entity footprints to cache for placements, waits and parking.
+            - Default: 1024
+            - See `fizgrid.utils.FootprintCache` for details.
+        - fast_mode (bool|None): Whether to skip runtime type checking on the internal simulation path.
+            - Default: None
+            - If None, fast mode is turned on when the `FIZGRID_FAST_MODE` environment variable is set to "1", "true", "yes" or "on".
+            - Public methods like `add_entity`, `add_route` and `simulate` are always type checked.
+            - Internal methods (eg: route planning, collision handling and queue operations) are not type checked in fast mode.
+            - This is intended for production runs of models that have already been tested without fast mode.
+        - recycle_block_ids (bool): Whether the ids of removed cell reservations are reused for new reservations.
+            - Default: True
+            - This keeps reservation ids bounded by the peak number of live reservations.
+            - Only used by the "dict" cell store as the "array" cell store always reuses its slots.
         """
         assert cell_density > 0, "cell_density must be greater than 0"
+        assert (
+            cell_store in cell_stores
+        ), f"cell_store must be one of {list(cell_stores.keys())}"
+        assert rasterization in (
+            "bounding_box",
+            "exact",
+        ), "rasterization must be one of ['bounding_box', 'exact']"
         # Passed Attributes
         self.name: str = name
         """The name of the grid."""
@@ -36,14 +142,42 @@ class Grid:
         self.__y_size__ = y_size
         self.__max_time__ = max_time
         self.__cell_density__ = cell_density
+        self.__exact_rasterization__ = rasterization == "exact"
+        self.__fast_mode__ = (
+            get_fast_mode_default() if fast_mode is None else fast_mode
+        )
 
         # Calculated Attributes
         self.__entities__ = {}
-        self.__queue__ = TimeQueue()
-        self.__cells__ = [
-            [{} for _ in range(x_size * cell_density)]
-            for _ in range(y_size * cell_density)
-        ]
+        # Entity ids are allocated per grid so they do not depend on other grids in the process
+        self.__id_allocator__ = IDAllocator()
+        self.__queue__ = TimeQueue(backend=queue_backend)
+        self.__cells__ = cell_stores[cell_store](
+            x_cells=x_size * cell_density,
+            y_cells=y_size * cell_density,
+            recycle_block_ids=recycle_block_ids,
+        )
+        self.__footprint_cache__ = FootprintCache(max_size=footprint_cache_size)
+        self.__reservation_stats__ = {"kept": 0, "added": 0, "removed": 0}
+        self.__simulation_stats__ = {
+            "events": 0,
+            "batches": 0,
+            "sim_time": 0,
+            "wall_time": 0.0,
+        }
+        self.__static_layer__ = StaticLayer(
+            x_cells=x_size * cell_density,
+            y_cells=y_size * cell_density,
+            max_time=max_time,
+        )
+        self.__safe_intervals__ = SafeIntervalIndex(
+            cells=self.__cells__, static_layer=self.__static_layer__
+        )
+        self.__shape_utils__ = Shape
+        if self.__fast_mode__:
+            bind_unchecked_methods(self)
+            bind_unchecked_methods(self.__queue__)
+            self.__shape_utils__ = UncheckedShape
 
         if add_exterior_walls:
             self.add_exterior_walls()
@@ -73,11 +207,15 @@ class Grid:
             - If None, the entity is added immediately.
         - safe_create: A boolean indicating whether to attempt safe creation of the obstruction.
             - If True, the method will attempt to create the obstruction without overlapping existing obstructions.
+                - If there is an overlap, placement is retried at the earliest time all cells of the footprint are free
+                  based on the reservations on the grid.
             - If False, it may raise an error if there is an overlap between obstructions / other entities.
             - Default is False.
-        - safe_create_increment: The incremental time to wait to use when attempting safe creation if an overlap is detected.
+        - safe_create_increment: The time to wait before retrying safe creation if the footprint is blocked until the end of the simulation.
+            - This happens when a parked or static entity blocks the footprint, since it is not known when (or if) it will move.
             - Default is 5 time units.
         - safe_create_attempts: The maximum number of attempts to try creating the obstruction safely before logging an error.
+            - Retries are only needed again if new reservations block the footprint before the computed time.
             - Default is 10 attempts.
         - safe_create_on_error: The action to take if safe creation fails after the maximum attempts.
             - Options are "print_error" to log an error message, or "raise_exception" to raise an exception.
@@ -141,6 +279,107 @@ class Grid:
             entity.__dissoc_grid__()
             self.__entities__.pop(entity.id, None)
 
+    def get_entity(self, entity_id: int) -> Entity:
+        """
+        Returns an entity on this grid by its id.
+        This is useful to find the copy of an entity in a fork of this grid.
+
+        Args:
+
+        - entity_id (int): The id of the entity.
+
+        Returns:
+
+        - Entity: The entity with this id.
+        """
+        return self.__entities__[entity_id]
+
+    def fork(self):
+        """
+        Returns an independent copy of this grid that can be simulated without changing this grid.
+        This is intended for what-if rollouts, eg: fork the grid, try an assignment, simulate ahead, compare and discard the fork.
+
+        The fork uses copy-on-write so its cost grows with the number of entities and queued events rather than with the
+        number of cell reservations:
+
+        - Cell reservations, the static layer and entity histories are shared until either grid changes them.
+            - Shared cells are copied per 16x16 tile with the "dict" cell store and as a whole with the "array" cell store.
+        - Entities are copied with their mutable state. Use `get_entity` to find the copy of an entity by its id.
+        - Queued events on this grid or its entities are copied to call the forked grid and entities instead.
+
+        Notes:
+
+        - Queued events on other objects (eg: a dispatcher) and objects referenced by attributes of entity subclasses are shared with this grid.
+            - If these objects schedule events or routes, they will still do so on this grid and its entities.
+        - The footprint cache is shared as it only depends on the grid settings.
+
+        Returns:
+
+        - Grid: The forked grid.
+        """
+        forked = Grid.__new__(Grid)
+        forked.__dict__.update(self.__dict__)
+        # Methods bound to this grid in fast mode must be bound to the fork instead
+        unbind_unchecked_methods(forked)
+        if self.__fast_mode__:
+            bind_unchecked_methods(forked)
+        forked.__id_allocator__ = self.__id_allocator__.copy()
+        forked.__reservation_stats__ = self.__reservation_stats__.copy()
+        forked.__simulation_stats__ = self.__simulation_stats__.copy()
+        forked.__cells__ = self.__cells__.fork()
+        forked.__static_layer__ = self.__static_layer__.fork()
+        forked.__safe_intervals__ = self.__safe_intervals__.fork(
+            cells=forked.__cells__, static_layer=forked.__static_layer__
+        )
+        forked.__entities__ = {}
+        # Objects of this grid (keyed by their python id) and their copies in the fork
+        forked_objects = {id(self): forked}
+        for entity_id, entity in self.__entities__.items():
+            forked_entity = entity.__fork__(forked)
+            forked.__entities__[entity_id] = forked_entity
+            forked_objects[id(entity)] = forked_entity
+
+        def fork_event(event):
+            kwargs = event.kwargs
+            for value in kwargs.values():
+                if id(value) in forked_objects:
+                    kwargs = {
+                        key: forked_objects.get(id(value), value)
+                        for key, value in kwargs.items()
+                    }
+                    break
+            return GridEvent(
+                forked_objects.get(id(event.object), event.object),
+                event.method,
+                kwargs,
+            )
+
+        forked.__queue__ = self.__queue__.fork(map_event=fork_event)
+        if self.__fast_mode__:
+            bind_unchecked_methods(forked.__queue__)
+        return forked
+
+    def __resolve_collision__(
+        self, entity: Entity, other_entity: Entity
+    ) -> None:
+        """
+        Resolves a collision between two entities in a single event.
+        Both entities have their routes realized as the result of a collision, first `entity` and then `other_entity`.
+
+        Args:
+
+        - entity (Entity): The entity that planned the route that caused the collision.
+        - other_entity (Entity): The entity that it collides with.
+        """
+        entity.__realize_route__(
+            is_result_of_collision=True,
+            clear_event_types=["system", "user"],
+        )
+        other_entity.__realize_route__(
+            is_result_of_collision=True,
+            clear_event_types=["system", "user"],
+        )
+
     def add_event(
         self,
         time: int | float,
@@ -181,10 +420,106 @@ class Grid:
         """
         return self.__queue__.add_event(
             time=time,
-            event={"object": object, "method": method, "kwargs": kwargs},
+            event=GridEvent(object, method, kwargs),
             priority=priority,
         )
 
+    def get_entity_locations(self, include_static: bool = False) -> dict:
+        """
+        Returns the current location of every entity on the grid.
+        This is intended for dashboards and controllers that poll all entity positions at once.
+
+        Args:
+
+        - include_static (bool): Whether to include static entities (eg: walls) in the output.
+            - Default: False
+
+        Returns:
+
+        - dict: A dictionary containing the following keys:
+            - ids (list[int]): The id of each entity.
+            - x (array.array[float]): The current x coordinate of each entity.
+            - y (array.array[float]): The current y coordinate of each entity.
+            - The i-th value of each key refers to the same entity.
+        """
+        ids = []
+        x_coords = array("d")
+        y_coords = array("d")
+        time = self.get_time()
+        for entity_id, entity in self.__entities__.items():
+            if not entity.__on_grid__:
+                continue
+            if not include_static and isinstance(entity, StaticEntity):
+                continue
+            x_coord, y_coord = entity.__get_planned_location__(time)
+            ids.append(entity_id)
+            x_coords.append(x_coord)
+            y_coords.append(y_coord)
+        return {"ids": ids, "x": x_coords, "y": y_coords}
+
+    def get_reservation_stats(self) -> dict:
+        """
+        Returns how many cell reservations were kept or rewritten when entities planned routes.
+
+        When an entity replans, reservations that are the same in the old and new plan (same cell and same remaining interval)
+        are kept in place and only the changed reservations are removed and added.
+        The cells an entity blocks while parked at the end of its route are counted as reservations too.
+
+        Returns:
+
+        - dict: A dictionary containing the following keys:
+            - kept (int): The number of reservations kept from a previous plan.
+            - added (int): The number of reservations added to the grid cells.
+            - removed (int): The number of reservations from a previous plan that were removed.
+        """
+        return dict(self.__reservation_stats__)
+
+    def get_safe_intervals(self, x_cell: int, y_cell: int) -> list[tuple]:
+        """
+        Returns the free (safe) time intervals of a grid cell.
+        This is intended for planners (eg: Safe Interval Path Planning) that need to know when a cell is free.
+
+        The safe intervals are the gaps between all reservations of moving, parked and static entities in the cell.
+        They are cached per cell and kept up to date as routes are planned and cleared.
+
+        Args:
+
+        - x_cell (int): The x index of the cell.
+            - Note: Cell indexes are coordinates multiplied by the cell density and rounded down.
+        - y_cell (int): The y index of the cell.
+
+        Returns:
+
+        - list[tuple]: A sorted list of (t_start, t_end) tuples where the cell is free for t_start <= t < t_end.
+            - The returned list must not be changed.
+        """
+        return self.__safe_intervals__.get_safe_intervals(x_cell, y_cell)
+
+    def get_simulation_stats(self) -> dict:
+        """
+        Returns counters for the events processed by `simulate`, `simulate_steps` and `resolve_next_state`.
+
+        Returns:
+
+        - dict: A dictionary with the following keys:
+            - events (int): The number of events processed.
+            - batches (int): The number of event batches (distinct event times) processed.
+            - sim_time (int|float): The simulated time advanced while processing events.
+            - wall_time (float): The wall clock time in seconds spent processing events.
+                - For `simulate_steps`, time spent by the caller between batches is not included.
+            - events_per_second (float): Events processed per wall clock second.
+            - sim_time_per_second (float): Simulated time advanced per wall clock second.
+        """
+        stats = dict(self.__simulation_stats__)
+        wall_time = stats["wall_time"]
+        stats["events_per_second"] = (
+            stats["events"] / wall_time if wall_time > 0 else 0.0
+        )
+        stats["sim_time_per_second"] = (
+            stats["sim_time"] / wall_time if wall_time > 0 else 0.0
+        )
+        return stats
+
     def get_time(self) -> int | float:
         """
         Returns the current time of the grid.
@@ -208,18 +543,24 @@ class Grid:
             - The event dictionary contains the object, method and kwargs.
                 - id (int): The ID of the event as generated by the queue.
                 - time (int|float): The time at which the event occurred.
-                - event (dict): The event that was processed.
+                - event (GridEvent): The event that was processed.
+                    - This can be read like a dictionary, eg: `event["method"]`.
                     - object: The object on which the event occurred.
                     - method (str): The name of the method that was called.
                     - kwargs (dict): The keyword arguments that were passed to the method.
         """
+        start_time = self.get_time()
+        start_wall_time = time.perf_counter()
         event_items = self.__queue__.get_next_events()
         for event_item in event_items:
-            event = event_item.get("event")
-            object = event.get("object")
-            method = event.get("method")
-            kwargs = event.get("kwargs")
-            getattr(object, method)(**kwargs)
+            event = event_item["event"]
+            getattr(event.object, event.method)(**event.kwargs)
+        stats = self.__simulation_stats__
+        stats["wall_time"] += time.perf_counter() - start_wall_time
+        if event_items:
+            stats["events"] += len(event_items)
+            stats["batches"] += 1
+            stats["sim_time"] += self.get_time() - start_time
         return event_items
 
     def add_exterior_walls(self) -> None:
@@ -283,11 +624,83 @@ class Grid:
             )
         )
 
-    def simulate(self) -> None:
+    def simulate_steps(
+        self,
+        until: int | float | None = None,
+        max_events: int | None = None,
+    ):
+        """
+        A generator that processes the queue one batch of events at a time.
+        Each batch holds all of the events that occur at the next event time and is yielded after it has been processed.
+
+        This allows the simulation to be run in slices and interleaved with other work, eg:
+            ```
+            for events in grid.simulate_steps(until=100):
+                # Inspect the grid or add new events here
+                pass
+            ```
+
+        Args:
+
+        - until (int|float|None): The last event time to process.
+            - Default: None
+            - If None, events are processed until the queue is empty.
+            - Otherwise, events after this time are left in the queue and the grid time is advanced to `until` once
+              every earlier event has been processed.
+        - max_events (int|None): The maximum number of events to process.
+            - Default: None
+            - If None, there is no limit.
+            - Batches are always processed in full, so the batch that reaches this limit may exceed it.
+
+        Yields:
+
+        - list[dict]: The events in the processed batch as returned by `resolve_next_state`.
+        """
+        queue = self.__queue__
+        stats = self.__simulation_stats__
+        events_processed = 0
+        while max_events is None or events_processed < max_events:
+            if until is not None:
+                next_time = queue.get_next_time()
+                if next_time is None or next_time > until:
+                    start_time = queue.__time__
+                    if until > start_time:
+                        queue.advance_time(until)
+                        stats["sim_time"] += until - start_time
+                    return
+            # Dispatch through resolve_next_state so that subclasses that override it are also used here
+            event_items = self.resolve_next_state()
+            if not event_items:
+                return
+            events_processed += len(event_items)
+            yield event_items
+
+    def simulate(
+        self,
+        until: int | float | None = None,
+        max_events: int | None = None,
+    ) -> int:
         """
         Runs the simulation for the grid.
-        This method processes events in the queue until all events are resolved or the maximum time is reached.
+        This method processes events in the queue until all events are resolved or one of the limits is reached.
+
+        Args:
+
+        - until (int|float|None): The last event time to process.
+            - Default: None
+            - If None, events are processed until the queue is empty.
+            - Otherwise, events after this time are left in the queue and the grid time is advanced to `until`.
+            - EG: Use `until=grid.__max_time__` to stop at the end of the simulation horizon even if later events are queued.
+        - max_events (int|None): The maximum number of events to process.
+            - Default: None
+            - If None, there is no limit.
+            - Batches of events at the same time are always processed in full, so this may be slightly exceeded.
+
+        Returns:
+
+        - int: The number of events processed.
         """
-        next_state_events = True
-        while next_state_events:
-            next_state_events = self.resolve_next_state()
+        events_processed = 0
+        for events in self.simulate_steps(until=until, max_events=max_events):
+            events_processed += len(events)
+        return events_processed
@@ -0,0 +1,320 @@
+"""
+Route planners that read the reservations of a grid to find collision free routes.
+
+Example:
+
+```
+from fizgrid.helpers.planning import space_time_astar
+
+waypoints = space_time_astar(entity=amr, x_coord=40, y_coord=25, speed=1)
+if waypoints is not None:
+    amr.add_route(waypoints=waypoints)
+    # Plan the route now so that other entities can plan around it
+    grid.simulate(until=grid.get_time())
+```
+
+Routes are planned against the reservations on the grid when the planner is called. Entities that plan their routes
+one after another with a planner avoid each other (cooperative planning), while entities that plan routes in other
+ways may still collide with them.
+
+Note: `Entity.add_route` only queues a route, so its reservations are not on the grid until the grid processes the
+events at the current time (eg: with `grid.simulate(until=grid.get_time())`).
+"""
+
+import heapq
+
+
+def compress_waypoints(
+    start_x: int | float, start_y: int | float, waypoints: list[tuple]
+) -> list[tuple]:
+    """
+    Merges consecutive waypoints that continue in the same direction at the same speed (or keep waiting in place).
+
+    Args:
+
+    - start_x (int|float): The x coordinate of the starting point.
+    - start_y (int|float): The y coordinate of the starting point.
+    - waypoints (list[tuple]): A list of (x_coord, y_coord, time_shift) waypoints.
+
+    Returns:
+
+    - list[tuple]: The merged waypoints.
+    """
+    output = []
+    velocity = None
+    x_tmp, y_tmp = start_x, start_y
+    for x_coord, y_coord, time_shift in waypoints:
+        new_velocity = (
+            round((x_coord - x_tmp) / time_shift, 9),
+            round((y_coord - y_tmp) / time_shift, 9),
+        )
+        if new_velocity == velocity:
+            output[-1] = (x_coord, y_coord, output[-1][2] + time_shift)
+        else:
+            output.append((x_coord, y_coord, time_shift))
+        velocity = new_velocity
+        x_tmp, y_tmp = x_coord, y_coord
+    return output
+
+
+def space_time_astar(
+    entity,
+    x_coord: int | float,
+    y_coord: int | float,
+    speed: int | float,
+    step: int | float | None = None,
+    allow_diagonal: bool = False,
+    horizon: int | float | None = None,
+    max_expansions: int = 100000,
+    compress: bool = True,
+) -> list[tuple] | None:
+    """
+    Finds the earliest arriving collision free route for an entity from its current location to a goal with a space-time A* search.
+
+    The search moves the entity over a lattice of points `step` apart starting at its current location. At each point it
+    can move to a neighboring point or wait in place for the time it takes to move one step. Each move is checked against
+    the reservations of the grid with the same swept footprint that is used when the route is planned, and the entity
+    must be able to park at the goal until the end of the simulation.
+
+    The goal does not have to be on the lattice. It is reached with a direct move from any lattice point within one step of it.
+
+    Notes:
+
+    - The entity must be on a grid and available (not in a route).
+    - The returned route is collision free for the reservations at the current time. Routes added afterwards by other
+      entities can still collide with it.
+    - The search time grows with the number of lattice points between the entity and its goal, so use a larger `step`
+      for long routes.
+
+    Args:
+
+    - entity (Entity): The entity to plan a route for.
+    - x_coord (int|float): The x-coordinate of the goal.
+    - y_coord (int|float): The y-coordinate of the goal.
+    - speed (int|float): The speed of the entity while moving.
+    - step (int|float|None): The distance between lattice points.
+        - Default: None (the size of a grid cell)
+    - allow_diagonal (bool): Whether the entity can move diagonally between lattice points.
+        - Default: False
+    - horizon (int|float|None): The latest time the entity can arrive at its goal.
+        - Default: None (the max_time of the grid)
+    - max_expansions (int): The maximum number of lattice states to expand before giving up.
+        - Default: 100000
+    - compress (bool): Whether to merge consecutive waypoints that continue in the same direction.
+        - Default: True
+
+    Returns:
+
+    - list[tuple]|None: A list of (x_coord, y_coord, time_shift) waypoints to pass to `Entity.add_route`.
+        - None if no route was found within the horizon and max_expansions.
+    """
+    grid = entity.__grid__
+    if grid is None or not entity.__on_grid__:
+        raise Exception("Entity is not on a grid. Cannot plan a route.")
+    if not entity.__is_available__:
+        raise Exception("Only available entities can plan routes.")
+    assert speed > 0, "speed must be greater than 0"
+    if step is None:
+        step = 1 / grid.__cell_density__
+    assert step > 0, "step must be greater than 0"
+    if horizon is None:
+        horizon = grid.__max_time__
+    x_size, y_size = grid.__x_size__, grid.__y_size__
+    x_start, y_start = entity.x_coord, entity.y_coord
+    t_start = entity.get_time()
+    step_time = step / speed
+    moves = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+    if allow_diagonal:
+        moves += [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+    moves = [
+        (x_step, y_step, step_time * (x_step**2 + y_step**2) ** 0.5)
+        for x_step, y_step in moves
+    ]
+    auto_rotate = entity.__auto_rotate__
+
+    def get_heuristic(x_tmp, y_tmp):
+        x_distance = abs(x_coord - x_tmp)
+        y_distance = abs(y_coord - y_tmp)
+        if allow_diagonal:
+            lattice_distance = (
+                max(x_distance, y_distance)
+                + (2**0.5 - 1) * min(x_distance, y_distance)
+                - 2**0.5 * step
+            )
+        else:
+            lattice_distance = x_distance + y_distance - 2 * step
+        # The last move to the goal can be a direct move from a lattice point within one step of it
+        # so the lattice distance is reduced by the longest such move to stay admissible
+        return (
+            max((x_distance**2 + y_distance**2) ** 0.5, lattice_distance)
+            / speed
+        )
+
+    def is_free(x_tmp, y_tmp, x_end, y_end, t_tmp, t_end, shape):
+        return (
+            len(
+                entity.__get_segment_collisions__(
+                    x_tmp, y_tmp, x_end, y_end, t_tmp, t_end, shape
+                )
+            )
+            == 0
+        )
+
+    # Each node is stored as (x_idx, y_idx, x_coord, y_coord, time, time_shift, shape, parent_node_idx, is_goal, move, turns)
+    # Times are accumulated from the time shifts in the same order as when the route is planned
+    nodes = [
+        (
+            0,
+            0,
+            x_start,
+            y_start,
+            t_start,
+            0,
+            entity.__shape_current__,
+            None,
+            False,
+            None,
+            0,
+        )
+    ]
+    # Ties are broken towards later times (deeper nodes) and then fewer turns which keeps routes straight
+    open_heap = [(t_start + get_heuristic(x_start, y_start), 0, 0, 0, 0)]
+    closed = set()
+    counter = 0
+    expansions = 0
+    goal_node_idx = None
+    while open_heap:
+        node_idx = heapq.heappop(open_heap)[-1]
+        (
+            x_idx,
+            y_idx,
+            x_tmp,
+            y_tmp,
+            t_tmp,
+            time_shift,
+            shape,
+            parent_node_idx,
+            is_goal,
+            move,
+            turns,
+        ) = nodes[node_idx]
+        shape_key = tuple(map(tuple, shape)) if auto_rotate else None
+        key = (is_goal, x_idx, y_idx, round(t_tmp, 9), shape_key)
+        if key in closed:
+            continue
+        # Moves are only checked against the reservations once they are popped, since most pushed moves never are
+        if time_shift > 0:
+            parent = nodes[parent_node_idx]
+            if not is_free(
+                parent[2], parent[3], x_tmp, y_tmp, parent[4], t_tmp, shape
+            ):
+                continue
+        if is_goal:
+            # The entity must be able to park at the goal until the end of the simulation
+            if is_free(x_tmp, y_tmp, x_tmp, y_tmp, t_tmp, None, shape):
+                goal_node_idx = node_idx
+                break
+            continue
+        closed.add(key)
+        expansions += 1
+        if expansions > max_expansions:
+            break
+        successors = []
+        goal_distance = max(abs(x_coord - x_tmp), abs(y_coord - y_tmp))
+        if goal_distance == 0:
+            successors.append((x_idx, y_idx, x_tmp, y_tmp, 0, True, move))
+        elif goal_distance <= step:
+            successors.append(
+                (
+                    x_idx,
+                    y_idx,
+                    x_coord,
+                    y_coord,
+                    ((x_coord - x_tmp) ** 2 + (y_coord - y_tmp) ** 2) ** 0.5
+                    / speed,
+                    True,
+                    "goal",
+                )
+            )
+        # Waiting in place
+        successors.append(
+            (x_idx, y_idx, x_tmp, y_tmp, step_time, False, (0, 0))
+        )
+        for x_step, y_step, move_time_shift in moves:
+            x_end = x_start + (x_idx + x_step) * step
+            y_end = y_start + (y_idx + y_step) * step
+            if 0 <= x_end <= x_size and 0 <= y_end <= y_size:
+                successors.append(
+                    (
+                        x_idx + x_step,
+                        y_idx + y_step,
+                        x_end,
+                        y_end,
+                        move_time_shift,
+                        False,
+                        (x_step, y_step),
+                    )
+                )
+        for (
+            next_x_idx,
+            next_y_idx,
+            x_end,
+            y_end,
+            next_time_shift,
+            goal,
+            next_move,
+        ) in successors:
+            t_end = t_tmp + next_time_shift
+            if t_end > horizon:
+                continue
+            next_turns = turns + (move is not None and next_move != move)
+            nodes.append(
+                (
+                    next_x_idx,
+                    next_y_idx,
+                    x_end,
+                    y_end,
+                    t_end,
+                    next_time_shift,
+                    entity.__get_waypoint_shape__(
+                        waypoint=(x_end, y_end, next_time_shift),
+                        x_shift=x_end - x_tmp,
+                        y_shift=y_end - y_tmp,
+                        shape=shape,
+                    ),
+                    node_idx,
+                    goal,
+                    next_move,
+                    next_turns,
+                )
+            )
+            counter += 1
+            heapq.heappush(
+                open_heap,
+                (
+                    round(t_end + get_heuristic(x_end, y_end), 9),
+                    -t_end,
+                    next_turns,
+                    counter,
+                    len(nodes) - 1,
+                ),
+            )
+
+    if goal_node_idx is None:
+        return None
+    waypoints = []
+    node_idx = goal_node_idx
+    while nodes[node_idx][7] is not None:
+        node = nodes[node_idx]
+        if node[5] > 0:
+            waypoints.append((node[2], node[3], node[5]))
+        node_idx = node[7]
+    waypoints.reverse()
+    if compress and len(waypoints) > 1:
+        compressed = compress_waypoints(
+            start_x=x_start, start_y=y_start, waypoints=waypoints
+        )
+        # Merged moves are rasterized as a single segment, so only use them if they are still collision free
+        if not entity.check_route(waypoints=compressed)["has_collision"]:
+            return compressed
+    return waypoints
@@ -0,0 +1,303 @@
+"""
+Runs independent replications of a simulation scenario in parallel over a process pool.
+
+Each replication builds its own grid from a scenario factory, simulates it and returns a compact summary (plain
+dictionaries of numbers) so that full `Grid` objects are never sent back between processes.
+
+Example:
+
+```
+from fizgrid.grid import Grid
+from fizgrid.helpers.replication import run_replications
+
+def scenario():
+    grid = Grid(name="warehouse", x_size=100, y_size=100, max_time=1000)
+    # Add entities, routes and events using the `random` module for any randomness
+    return grid
+
+if __name__ == "__main__":
+    results = run_replications(scenario=scenario, replications=100, seed=42)
+    print(results["summary"]["grid"]["collisions"]["mean"])
+```
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from fizgrid.entities import StaticEntity
+import random, statistics
+
+
+def get_replication_seeds(seed: int, replications: int) -> list[int]:
+    """
+    Returns a deterministic seed for each replication.
+
+    The seeds only depend on `seed` and the replication index, so results do not depend on the number of workers
+    or on the order in which replications finish.
+
+    Args:
+
+    - seed (int): The base seed.
+    - replications (int): The number of replications.
+
+    Returns:
+
+    - list[int]: The seed of each replication.
+    """
+    seed_generator = random.Random(seed)
+    return [seed_generator.getrandbits(64) for _ in range(replications)]
+
+
+def summarize_entity(entity) -> dict:
+    """
+    Returns summary statistics for an entity from its history.
+
+    Args:
+
+    - entity (Entity): The entity to summarize.
+
+    Returns:
+
+    - dict: A dictionary with the following keys:
+        - name (str): The name of the entity.
+        - distance (float): The distance between consecutive history entries summed over the history.
+        - collisions (int): The number of history entries marked as a collision.
+        - records (int): The number of history entries.
+        - x (float): The x coordinate of the last history entry or None if the history is empty.
+        - y (float): The y coordinate of the last history entry or None if the history is empty.
+    """
+    history = entity.history
+    x_coords, y_coords = history.x, history.y
+    distance = 0.0
+    for idx in range(1, len(x_coords)):
+        distance += (
+            (x_coords[idx] - x_coords[idx - 1]) ** 2
+            + (y_coords[idx] - y_coords[idx - 1]) ** 2
+        ) ** 0.5
+    return {
+        "name": entity.name,
+        "distance": distance,
+        "collisions": sum(history.c),
+        "records": len(history),
+        "x": x_coords[-1] if len(x_coords) > 0 else None,
+        "y": y_coords[-1] if len(y_coords) > 0 else None,
+    }
+
+
+def summarize_grid(grid, include_static: bool = False) -> dict:
+    """
+    Returns summary statistics for a grid and its entities.
+
+    Args:
+
+    - grid (Grid): The grid to summarize.
+    - include_static (bool): Whether to include static entities (eg: walls) in the entity statistics.
+        - Default: False
+
+    Returns:
+
+    - dict: A dictionary with the following keys:
+        - grid (dict): The grid statistics.
+            - time (int|float): The current time of the grid.
+            - events (int): The number of events processed.
+            - batches (int): The number of event batches processed.
+            - entities (int): The number of summarized entities.
+            - distance (float): The total distance of the summarized entities.
+            - collisions (int): The total collisions of the summarized entities.
+        - entities (dict): The statistics of each summarized entity keyed by entity id (see `summarize_entity`).
+    """
+    entities = {}
+    for entity_id, entity in grid.__entities__.items():
+        if not include_static and isinstance(entity, StaticEntity):
+            continue
+        entities[entity_id] = summarize_entity(entity)
+    simulation_stats = grid.get_simulation_stats()
+    return {
+        "grid": {
+            "time": grid.get_time(),
+            "events": simulation_stats["events"],
+            "batches": simulation_stats["batches"],
+            "entities": len(entities),
+            "distance": sum(stats["distance"] for stats in entities.values()),
+            "collisions": sum(
+                stats["collisions"] for stats in entities.values()
+            ),
+        },
+        "entities": entities,
+    }
+
+
+def run_replication(
+    scenario,
+    seed: int,
+    until: int | float | None = None,
+    max_events: int | None = None,
+    summarize=None,
+    include_static: bool = False,
+) -> dict:
+    """
+    Runs a single replication in the current process.
+
+    The `random` module is seeded with `seed` before `scenario` is called.
+
+    Args:
+
+    - scenario (callable): A function without arguments that returns a `Grid` ready to be simulated.
+    - seed (int): The seed for the `random` module.
+    - until (int|float|None): Passed to `Grid.simulate`.
+        - Default: None
+    - max_events (int|None): Passed to `Grid.simulate`.
+        - Default: None
+    - summarize (callable|None): An optional function that takes the simulated grid and returns a dictionary of numbers.
+        - These are added to the grid statistics.
+        - Default: None
+    - include_static (bool): Whether to include static entities in the entity statistics.
+        - Default: False
+
+    Returns:
+
+    - dict: The output of `summarize_grid` with the replication seed added to the grid statistics.
+    """
+    random.seed(seed)
+    grid = scenario()
+    grid.simulate(until=until, max_events=max_events)
+    summary = summarize_grid(grid, include_static=include_static)
+    summary["grid"]["seed"] = seed
+    if summarize is not None:
+        summary["grid"].update(summarize(grid))
+    return summary
+
+
+def aggregate(values: list) -> dict:
+    """
+    Returns the mean, standard deviation, minimum and maximum of a list of numbers.
+
+    Args:
+
+    - values (list[int|float]): The values to aggregate.
+
+    Returns:
+
+    - dict: A dictionary with the keys mean, stdev, min and max.
+        - stdev is 0.0 for fewer than two values.
+    """
+    return {
+        "mean": statistics.fmean(values),
+        "stdev": statistics.stdev(values) if len(values) > 1 else 0.0,
+        "min": min(values),
+        "max": max(values),
+    }
+
+
+def aggregate_replications(replications: list[dict]) -> dict:
+    """
+    Aggregates the summaries of several replications.
+
+    Only numeric statistics are aggregated. Entity statistics are aggregated per entity id over the replications that
+    include the entity.
+
+    Args:
+
+    - replications (list[dict]): The outputs of `run_replication`.
+
+    Returns:
+
+    - dict: A dictionary with the following keys:
+        - grid (dict): The output of `aggregate` for each grid statistic.
+        - entities (dict): For each entity id, its name and the output of `aggregate` for each entity statistic.
+    """
+    grid_values = {}
+    entity_values = {}
+    for replication in replications:
+        for key, value in replication["grid"].items():
+            if key == "seed" or not isinstance(value, (int, float)):
+                continue
+            grid_values.setdefault(key, []).append(value)
+        for entity_id, stats in replication["entities"].items():
+            values = entity_values.setdefault(
+                entity_id, {"name": stats["name"]}
+            )
+            for key, value in stats.items():
+                if not isinstance(value, (int, float)):
+                    continue
+                values.setdefault(key, []).append(value)
+    return {
+        "grid": {key: aggregate(values) for key, values in grid_values.items()},
+        "entities": {
+            entity_id: {
+                key: value if key == "name" else aggregate(value)
+                for key, value in values.items()
+            }
+            for entity_id, values in entity_values.items()
+        },
+    }
+
+
+def run_replications(
+    scenario,
+    replications: int,
+    seed: int = 0,
+    until: int | float | None = None,
+    max_events: int | None = None,
+    summarize=None,
+    include_static: bool = False,
+    max_workers: int | None = None,
+) -> dict:
+    """
+    Runs replications of a scenario over a `concurrent.futures.ProcessPoolExecutor` and aggregates their statistics.
+
+    Each replication seeds the `random` module with a seed from `get_replication_seeds`, builds a grid with `scenario`,
+    simulates it and sends back only its summary. Results are deterministic for a given `seed` regardless of `max_workers`.
+
+    Notes:
+
+    - `scenario` and `summarize` are sent to the worker processes, so they must be picklable (eg: functions defined at
+      the top level of a module).
+    - Scenarios should only use the `random` module for randomness to be reproducible.
+    - On platforms that start worker processes by importing the main module (Windows and MacOS), call this from within
+      an `if __name__ == "__main__":` block.
+
+    Args:
+
+    - scenario (callable): A function without arguments that returns a `Grid` ready to be simulated.
+    - replications (int): The number of replications to run.
+    - seed (int): The base seed used to derive the seed of each replication.
+        - Default: 0
+    - until (int|float|None): Passed to `Grid.simulate` for each replication.
+        - Default: None
+    - max_events (int|None): Passed to `Grid.simulate` for each replication.
+        - Default: None
+    - summarize (callable|None): An optional function that takes a simulated grid and returns a dictionary of numbers.
+        - These are added to the grid statistics of each replication and aggregated.
+        - Default: None
+    - include_static (bool): Whether to include static entities in the entity statistics.
+        - Default: False
+    - max_workers (int|None): The number of worker processes.
+        - Default: None (the number of processors)
+        - If 1, the replications are run in the current process without a pool.
+
+    Returns:
+
+    - dict: A dictionary with the following keys:
+        - replications (list[dict]): The output of `run_replication` for each replication in order.
+        - summary (dict): The output of `aggregate_replications`.
+    """
+    assert replications > 0, "replications must be greater than 0"
+    tasks = [
+        (
+            scenario,
+            replication_seed,
+            until,
+            max_events,
+            summarize,
+            include_static,
+        )
+        for replication_seed in get_replication_seeds(seed, replications)
+    ]
+    if max_workers == 1:
+        results = [run_replication(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(run_replication, *zip(*tasks)))
+    return {
+        "replications": results,
+        "summary": aggregate_replications(results),
+    }
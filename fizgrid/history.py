@@ -0,0 +1,165 @@
+from array import array
+
+history_modes = ("full", "endpoints", "off")
+
+
+class EntityHistory:
+    """
+    A columnar store of an entity's location and collision history.
+
+    Each entry is stored across four typed arrays (x, y, t and c) instead of as a dictionary,
+    which takes roughly a tenth of the memory for long simulations.
+
+    For compatibility, the history can still be used like the list of dictionaries it replaces:
+
+    - `history[-1]` returns a dictionary like `{"x": 5.0, "y": 4.5, "t": 5.0, "c": True}`
+    - `len(history)`, iteration, slicing and comparison with a list of dictionaries are supported
+
+    Note: Values are stored as floats, so an entry recorded at x=5 is returned as x=5.0.
+    Note: Entries returned from indexing are copies, so changes to them are not written back to the history.
+    Note: A history created with `fork` shares its columns with the original until either one records a change.
+    """
+
+    def __init__(self, mode: str = "full"):
+        """
+        Initializes an EntityHistory instance.
+
+        Args:
+
+        - mode (str): Which locations to record.
+            - Default: "full"
+            - Options:
+                - "full": Record the start of each route and every waypoint reached along it.
+                - "endpoints": Record only the start of each route and the location where it was realized.
+                - "off": Do not record any history.
+        """
+        assert (
+            mode in history_modes
+        ), f"mode must be one of {list(history_modes)}"
+        self.mode = mode
+        self.x = array("d")
+        self.y = array("d")
+        self.t = array("d")
+        self.c = array("b")
+        # Whether the columns are shared with a fork of this history and must be copied before they are changed
+        self.__shared__ = False
+
+    def fork(self):
+        """
+        Returns a copy of this history that shares its columns with this history until either one changes them (copy-on-write).
+
+        Returns:
+
+        - EntityHistory: The forked history.
+        """
+        forked = EntityHistory(mode=self.mode)
+        forked.x = self.x
+        forked.y = self.y
+        forked.t = self.t
+        forked.c = self.c
+        self.__shared__ = True
+        forked.__shared__ = True
+        return forked
+
+    def __unshare__(self) -> None:
+        self.x = self.x[:]
+        self.y = self.y[:]
+        self.t = self.t[:]
+        self.c = self.c[:]
+        self.__shared__ = False
+
+    def record(
+        self, x: int | float, y: int | float, t: int | float, c: bool = False
+    ) -> None:
+        """
+        Adds an entry to the history.
+        This is a no-op when the mode is "off".
+
+        Args:
+
+        - x (int|float): The x-coordinate of the entity.
+        - y (int|float): The y-coordinate of the entity.
+        - t (int|float): The time at which the entity was at this location.
+        - c (bool): Whether the entity was in a collision at this time.
+            - Default: False
+        """
+        if self.mode == "off":
+            return
+        if self.__shared__:
+            self.__unshare__()
+        self.x.append(x)
+        self.y.append(y)
+        self.t.append(t)
+        self.c.append(c)
+
+    def set_collision(self) -> None:
+        """
+        Marks the most recent entry as a collision.
+        This is a no-op if the history is empty.
+        """
+        if len(self.c) > 0:
+            if self.__shared__:
+                self.__unshare__()
+            self.c[-1] = True
+
+    def to_numpy(self) -> dict:
+        """
+        Returns the history columns as NumPy arrays without copying them.
+
+        Requires NumPy to be installed.
+
+        Note: The returned arrays share memory with this history. Python arrays can not be resized while their memory is shared,
+        so recording new entries raises a BufferError until the returned arrays are deleted. Copy the arrays if the simulation
+        will continue.
+
+        Returns:
+
+        - dict: A dictionary with the keys x, y, t (float64 arrays) and c (a bool array).
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError(
+                "NumPy is required to export entity history. Install it with `pip install numpy`."
+            )
+        return {
+            "x": numpy.frombuffer(self.x, dtype=numpy.float64),
+            "y": numpy.frombuffer(self.y, dtype=numpy.float64),
+            "t": numpy.frombuffer(self.t, dtype=numpy.float64),
+            "c": numpy.frombuffer(self.c, dtype=numpy.bool_),
+        }
+
+    def __entry__(self, idx: int) -> dict:
+        return {
+            "x": self.x[idx],
+            "y": self.y[idx],
+            "t": self.t[idx],
+            "c": bool(self.c[idx]),
+        }
+
+    def __len__(self):
+        return len(self.t)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self.__entry__(i) for i in range(*idx.indices(len(self)))]
+        return self.__entry__(idx)
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self.__entry__(idx)
+
+    def __eq__(self, other):
+        if isinstance(other, EntityHistory):
+            return (
+                self.x == other.x
+                and self.y == other.y
+                and self.t == other.t
+                and self.c == other.c
+            )
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
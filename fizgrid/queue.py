@@ -1,21 +1,214 @@
-import type_enforced, heapq
+import type_enforced, heapq, copy
+from fizgrid.utils import keep_unchecked, unbind_unchecked_methods
+
+
+class HeapBackend:
+    """
+    A binary min-heap of (time, -priority, id) entries.
+    """
+
+    def __init__(self):
+        self.__heap__ = []
+
+    def __len__(self):
+        return len(self.__heap__)
+
+    def push(self, entry: tuple) -> None:
+        heapq.heappush(self.__heap__, entry)
+
+    def peek(self) -> tuple | None:
+        if self.__heap__:
+            return self.__heap__[0]
+        return None
+
+    def pop(self) -> tuple:
+        return heapq.heappop(self.__heap__)
+
+    def compact(self, live_ids: dict) -> None:
+        self.__heap__ = [
+            entry for entry in self.__heap__ if entry[2] in live_ids
+        ]
+        heapq.heapify(self.__heap__)
+
+    def copy(self):
+        backend = HeapBackend()
+        backend.__heap__ = self.__heap__.copy()
+        return backend
+
+
+class CalendarBackend:
+    """
+    A calendar queue of (time, -priority, id) entries.
+
+    Entries are hashed into a ring of buckets by `int(time // bucket_width)` where each bucket covers
+    one `bucket_width` slice of time and the ring wraps around every `len(buckets) * bucket_width`
+    time units (a "year"). Each bucket is a small heap so entries with the same time keep the exact
+    (time, -priority, id) ordering of the heap backend.
+
+    Dequeuing walks forward from the current bucket and takes the first bucket whose smallest entry
+    falls in the current slice of time. The ring is resized to keep roughly one to two entries per
+    bucket, which gives amortized O(1) enqueue and dequeue when event times are spread over a tick grid
+    that matches the bucket width.
+    """
+
+    def __init__(self, bucket_width: int | float = 1, min_buckets: int = 16):
+        assert bucket_width > 0, "bucket_width must be greater than 0"
+        self.bucket_width = bucket_width
+        self.__min_buckets__ = min_buckets
+        self.__buckets__ = [[] for _ in range(min_buckets)]
+        self.__size__ = 0
+        # The time slice key of the last dequeued (or peeked) entry
+        self.__current_key__ = 0
+
+    def __len__(self):
+        return self.__size__
+
+    def __resize__(self, num_buckets: int) -> None:
+        entries = [entry for bucket in self.__buckets__ for entry in bucket]
+        self.__buckets__ = [[] for _ in range(num_buckets)]
+        for entry in entries:
+            self.__buckets__[
+                int(entry[0] // self.bucket_width) % num_buckets
+            ].append(entry)
+        for bucket in self.__buckets__:
+            heapq.heapify(bucket)
+
+    def __find_next_bucket__(self) -> list | None:
+        """
+        Returns the bucket holding the next entry and updates the current key to match it.
+        """
+        if self.__size__ == 0:
+            return None
+        buckets = self.__buckets__
+        num_buckets = len(buckets)
+        bucket_width = self.bucket_width
+        key = self.__current_key__
+        # Scan at most one year forward from the current bucket
+        for _ in range(num_buckets):
+            bucket = buckets[key % num_buckets]
+            if bucket and int(bucket[0][0] // bucket_width) <= key:
+                self.__current_key__ = key
+                return bucket
+            key += 1
+        # Nothing in the next year, so jump directly to the smallest entry
+        bucket = min(
+            (bucket for bucket in buckets if bucket), key=lambda b: b[0]
+        )
+        self.__current_key__ = int(bucket[0][0] // bucket_width)
+        return bucket
+
+    def push(self, entry: tuple) -> None:
+        buckets = self.__buckets__
+        key = int(entry[0] // self.bucket_width)
+        if self.__size__ == 0 or key < self.__current_key__:
+            self.__current_key__ = key
+        heapq.heappush(buckets[key % len(buckets)], entry)
+        self.__size__ += 1
+        if self.__size__ > 2 * len(buckets):
+            self.__resize__(2 * len(buckets))
+
+    def peek(self) -> tuple | None:
+        bucket = self.__find_next_bucket__()
+        if bucket is None:
+            return None
+        return bucket[0]
+
+    def pop(self) -> tuple:
+        bucket = self.__find_next_bucket__()
+        if bucket is None:
+            raise IndexError("pop from an empty queue")
+        entry = heapq.heappop(bucket)
+        self.__size__ -= 1
+        num_buckets = len(self.__buckets__)
+        if (
+            num_buckets > self.__min_buckets__
+            and self.__size__ < num_buckets // 2
+        ):
+            self.__resize__(num_buckets // 2)
+        return entry
+
+    def compact(self, live_ids: dict) -> None:
+        for idx, bucket in enumerate(self.__buckets__):
+            live_bucket = [entry for entry in bucket if entry[2] in live_ids]
+            if len(live_bucket) != len(bucket):
+                heapq.heapify(live_bucket)
+                self.__buckets__[idx] = live_bucket
+        self.__size__ = sum(len(bucket) for bucket in self.__buckets__)
+        num_buckets = len(self.__buckets__)
+        while (
+            num_buckets > self.__min_buckets__
+            and self.__size__ < num_buckets // 2
+        ):
+            num_buckets //= 2
+        if num_buckets != len(self.__buckets__):
+            self.__resize__(num_buckets)
+
+    def copy(self):
+        backend = copy.copy(self)
+        backend.__buckets__ = [bucket.copy() for bucket in self.__buckets__]
+        return backend
 
 
 @type_enforced.Enforcer(enabled=True)
+@keep_unchecked(
+    "add_event",
+    "remove_event",
+    "remove_next_event",
+    "get_next_event",
+    "get_next_events",
+    "pop_next_events",
+    "get_next_time",
+)
 class TimeQueue:
-    def __init__(self):
+    def __init__(
+        self,
+        backend: str = "heap",
+        bucket_width: int | float = 1,
+        compact_ratio: int | float = 0.5,
+        compact_min_stale: int = 1000,
+    ):
         """
         Initializes a TimeQueue instance.
         This class is used to manage a queue of events that occur at specific times.
         It uses a min-heap to efficiently manage the events based on their scheduled times.
+
+        Args:
+
+        - backend (str): The priority queue used to order events.
+            - Default: "heap"
+            - Options:
+                - "heap": A binary min-heap.
+                - "calendar": A calendar queue with amortized O(1) enqueue and dequeue.
+                    - This works best when event times are clustered on a tick grid.
+            - Both backends process events in exactly the same (time, priority, id) order.
+        - bucket_width (int|float): The width of each time bucket when using the calendar backend.
+            - Default: 1
+            - This should roughly match the spacing between distinct event times.
+        - compact_ratio (int|float): The share of stale (removed but not yet popped) entries in the queue that triggers a compaction.
+            - Default: 0.5
+            - Removed events are left in the heap until they reach the top (lazy deletion).
+            - When stale entries make up more than this share of the heap, it is rebuilt without them.
+        - compact_min_stale (int): The minimum number of stale entries before a compaction is considered.
+            - Default: 1000
+            - This avoids frequent rebuilds of small queues.
         """
-        self.__heap__ = []
+        assert backend in (
+            "heap",
+            "calendar",
+        ), "backend must be one of ['heap', 'calendar']"
+        if backend == "calendar":
+            self.__heap__ = CalendarBackend(bucket_width=bucket_width)
+        else:
+            self.__heap__ = HeapBackend()
         self.__data__ = {}
         self.__time__ = 0
         self.__next_id__ = 0
+        self.__stale__ = 0
+        self.__compact_ratio__ = compact_ratio
+        self.__compact_min_stale__ = compact_min_stale
 
     def add_event(
-        self, time: int | float, event: dict = dict(), priority: int = 0
+        self, time: int | float, event: object = dict(), priority: int = 0
     ) -> int:
         """
         Adds an event to the queue.
@@ -23,9 +216,9 @@ class TimeQueue:
         Args:
 
         - time (int|float): The time at which the event should occur.
-        - event (dict): The event to be added to the queue.
+        - event (dict|object): The event to be added to the queue.
             - Default: {}
-            - This have any dictionary strucutre, depending on your queue needs
+            - This have any dictionary strucutre (or be any object), depending on your queue needs
         - priority (int): The priority of the event.
             - Default: 0
             - Higher values indicate higher priority.
@@ -44,10 +237,10 @@ class TimeQueue:
         id = self.__next_id__
         self.__next_id__ += 1
         self.__data__[id] = event
-        heapq.heappush(self.__heap__, (time, -priority, id))
+        self.__heap__.push((time, -priority, id))
         return id
 
-    def remove_event(self, id: int) -> dict | None:
+    def remove_event(self, id: int) -> object | None:
         """
         Removes an event from the queue using its ID.
 
@@ -59,9 +252,110 @@ class TimeQueue:
             - dict: The removed event.
                 - If the event is not found, None is returned.
         """
-        return self.__data__.pop(id, None)
+        event = self.__data__.pop(id, None)
+        if event is not None:
+            # The entry stays in the heap until it is popped or compacted away
+            self.__stale__ += 1
+            if (
+                self.__stale__ >= self.__compact_min_stale__
+                and self.__stale__ > self.__compact_ratio__ * len(self.__heap__)
+            ):
+                self.compact()
+        return event
 
-    def remove_next_event(self) -> dict | None:
+    def fork(self, map_event=None):
+        """
+        Returns a copy of this queue that can be changed independently.
+        The copy keeps the current time, the next event id and the (time, priority, id) order of every event.
+
+        Args:
+
+        - map_event (callable|None): A function that takes an event and returns the event to store in the copy.
+            - Default: None
+            - If None, both queues share the same event objects.
+
+        Returns:
+
+        - TimeQueue: The copied queue.
+        """
+        forked = TimeQueue.__new__(TimeQueue)
+        forked.__dict__.update(self.__dict__)
+        # Methods bound to this queue in fast mode must not be carried over
+        unbind_unchecked_methods(forked)
+        forked.__heap__ = self.__heap__.copy()
+        if map_event is None:
+            forked.__data__ = self.__data__.copy()
+        else:
+            forked.__data__ = {
+                id: map_event(event) for id, event in self.__data__.items()
+            }
+        return forked
+
+    def compact(self) -> None:
+        """
+        Rebuilds the heap without the entries of removed events.
+        This is called automatically when stale entries make up more than `compact_ratio` of the heap.
+        """
+        self.__heap__.compact(self.__data__)
+        self.__stale__ = 0
+
+    def get_live_count(self) -> int:
+        """
+        Returns the number of events in the queue that have not been removed or processed.
+
+        Returns:
+
+        - int: The number of live events.
+        """
+        return len(self.__data__)
+
+    def get_stale_count(self) -> int:
+        """
+        Returns the number of removed events that are still held in the heap.
+
+        Returns:
+
+        - int: The number of stale heap entries.
+        """
+        return self.__stale__
+
+    def get_next_time(self) -> int | float | None:
+        """
+        Returns the time of the next event in the queue without removing it.
+        Removed events at the front of the queue are discarded along the way.
+
+        Returns:
+
+        - int|float|None: The time of the next event.
+            - If the queue is empty, None is returned.
+        """
+        heap = self.__heap__
+        data = self.__data__
+        while len(heap) > 0:
+            entry = heap.peek()
+            if entry[2] in data:
+                return entry[0]
+            heap.pop()
+            self.__stale__ -= 1
+        return None
+
+    def advance_time(self, time: int | float) -> None:
+        """
+        Advances the current time of the queue without processing any events.
+
+        Args:
+
+        - time (int|float): The new current time.
+            - This must not be earlier than the current time or later than the next event in the queue.
+        """
+        next_time = self.get_next_time()
+        assert time >= self.__time__, "Time must not move backwards"
+        assert (
+            next_time is None or time <= next_time
+        ), "Time can not be advanced past the next event in the queue"
+        self.__time__ = time
+
+    def remove_next_event(self) -> object | None:
         """
         Removes the next event from the queue.
         This method is used to get the next event in the queue and remove it from the heap.
@@ -71,7 +365,10 @@ class TimeQueue:
         - dict: The removed event.
             - If the queue is empty, None is returned.
         """
-        self.remove_event(heapq.heappop(self.__heap__)[2])
+        event = self.__data__.pop(self.__heap__.pop()[2], None)
+        if event is None:
+            self.__stale__ -= 1
+        return event
 
     def get_next_event(self, peek: bool = False):
         """
@@ -89,18 +386,20 @@ class TimeQueue:
         - dict: The next event in the queue.
             - If the queue is empty, None is returned.
         """
-        while self.__heap__:
+        while len(self.__heap__) > 0:
             if peek:
-                time, priority, id = self.__heap__[0]
+                time, priority, id = self.__heap__.peek()
                 event = self.__data__.get(id, None)
                 if event is None:
                     # Remove the event from the heap to avoid stale references
-                    heapq.heappop(self.__heap__)
+                    self.__heap__.pop()
+                    self.__stale__ -= 1
                     continue
             else:
-                time, priority, id = heapq.heappop(self.__heap__)
-                event = self.remove_event(id)
+                time, priority, id = self.__heap__.pop()
+                event = self.__data__.pop(id, None)
                 if event is None:
+                    self.__stale__ -= 1
                     continue
                 self.__time__ = time
             return {
@@ -125,14 +424,36 @@ class TimeQueue:
         - list: A list of events that occur at the same time as the next event.
             - If the queue is empty, an empty list is returned.
         """
+        return [
+            {"id": id, "time": time, "event": event}
+            for time, id, event in self.pop_next_events()
+        ]
+
+    def pop_next_events(self) -> list[tuple]:
+        """
+        Removes and returns all events that occur at the same time as the next event.
+        This is a lower overhead version of `get_next_events` that avoids building a dictionary for each event.
+
+        Returns:
+
+        - list[tuple]: A list of (time, id, event) tuples in processing order.
+            - If the queue is empty, an empty list is returned.
+        """
+        heap = self.__heap__
+        data = self.__data__
         events = []
-        event = self.get_next_event(peek=True)
-        if event["time"] != None:
-            self.__time__ = event["time"]
-            next_event = event
-            while next_event["time"] == self.__time__:
-                event = next_event
-                self.remove_next_event()
-                events.append(event)
-                next_event = self.get_next_event(peek=True)
+        time = None
+        while len(heap) > 0:
+            entry = heap.peek()
+            if time is not None and entry[0] != time:
+                break
+            heap.pop()
+            event = data.pop(entry[2], None)
+            if event is None:
+                self.__stale__ -= 1
+                continue
+            time = entry[0]
+            events.append((time, entry[2], event))
+        if time is not None:
+            self.__time__ = time
         return events
@@ -1,26 +1,182 @@
-import math, type_enforced
+import math, os, type_enforced
+from collections import OrderedDict
+from types import FunctionType, MethodType
 
 
-class IDGenerator:
+class IDAllocator:
     """
-    A class to generate unique identifiers.
+    Allocates integer ids.
+
+    Each grid owns its own allocators, so the ids handed out only depend on what happened on that grid and
+    not on how many other grids were built earlier in the process. Ids start at 0 and are dense, so they can
+    be used directly as indexes into arrays.
     """
 
-    def __init__(self):
-        self.__id__ = 0
+    def __init__(self, recycle: bool = False):
+        """
+        Initializes an IDAllocator instance.
+
+        Args:
+
+        - recycle (bool): Whether released ids are handed out again.
+            - Default: False
+            - If True, ids passed to `release` are reused (most recently released first) before new ids are allocated.
+            - This keeps the ids in use bounded by the peak number of live ids.
+        """
+        self.recycle = recycle
+        self.__next_id__ = 0
+        self.__free_ids__ = []
+
+    def __call__(self) -> int:
+        """
+        Allocates the next id.
+
+        Returns:
+
+        - int: The allocated id.
+        """
+        if self.__free_ids__:
+            return self.__free_ids__.pop()
+        id = self.__next_id__
+        self.__next_id__ += 1
+        return id
+
+    def release(self, id: int) -> None:
+        """
+        Releases an id so it can be reused.
+        This is a no-op unless recycling is turned on.
+
+        Args:
 
-    def __call__(self):
+        - id (int): The id to release.
         """
-        Generates the next unique identifier.
+        if self.recycle:
+            self.__free_ids__.append(id)
+
+    def copy(self):
         """
-        self.__id__ += 1
-        return str(self.__id__)
+        Returns a copy of this allocator that continues from the same state.
 
+        Returns:
+
+        - IDAllocator: The copied allocator.
+        """
+        allocator = IDAllocator(recycle=self.recycle)
+        allocator.__next_id__ = self.__next_id__
+        allocator.__free_ids__ = self.__free_ids__.copy()
+        return allocator
+
+    def get_capacity(self) -> int:
+        """
+        Returns the number of distinct ids that have been allocated.
+        This is the size an array indexed by these ids would need.
+
+        Returns:
+
+        - int: The number of distinct ids.
+        """
+        return self.__next_id__
 
-unique_id = IDGenerator()
+
+fast_mode_env_var = "FIZGRID_FAST_MODE"
+
+
+def get_fast_mode_default() -> bool:
+    """
+    Returns whether fast mode is turned on by the `FIZGRID_FAST_MODE` environment variable.
+
+    Returns:
+
+    - bool: True if `FIZGRID_FAST_MODE` is set to one of "1", "true", "yes" or "on" (case insensitive).
+    """
+    return os.environ.get(fast_mode_env_var, "").strip().lower() in (
+        "1",
+        "true",
+        "yes",
+        "on",
+    )
+
+
+def keep_unchecked(*method_names):
+    """
+    A class decorator that keeps copies of the listed methods without runtime type checking.
+
+    This must be placed below `@type_enforced.Enforcer` so the copies are taken before the checks are added.
+    The copies are stored on the class as `__unchecked_methods__` and are used by `bind_unchecked_methods`.
+
+    Args:
+
+    - *method_names (str): The names of the methods (or static methods) defined directly on the class to copy.
+    """
+
+    def decorator(cls):
+        unchecked_methods = {}
+        for method_name in method_names:
+            method = cls.__dict__[method_name]
+            is_static = isinstance(method, staticmethod)
+            fn = method.__func__ if is_static else method
+            fn_copy = FunctionType(
+                fn.__code__,
+                fn.__globals__,
+                fn.__name__,
+                fn.__defaults__,
+                fn.__closure__,
+            )
+            fn_copy.__kwdefaults__ = fn.__kwdefaults__
+            fn_copy.__qualname__ = fn.__qualname__
+            fn_copy.__doc__ = fn.__doc__
+            unchecked_methods[method_name] = (
+                staticmethod(fn_copy) if is_static else fn_copy
+            )
+        cls.__unchecked_methods__ = unchecked_methods
+        return cls
+
+    return decorator
+
+
+def bind_unchecked_methods(obj) -> None:
+    """
+    Binds the unchecked copies of methods kept with `keep_unchecked` directly to an instance.
+
+    A method is only replaced if the class that defines it (following the method resolution order) kept an unchecked copy.
+    This means that methods overridden by a subclass are never replaced.
+
+    Args:
+
+    - obj: The instance to bind the unchecked methods to.
+    """
+    mro = type(obj).__mro__
+    for cls in mro:
+        for method_name, fn in cls.__dict__.get(
+            "__unchecked_methods__", {}
+        ).items():
+            if method_name in obj.__dict__:
+                continue
+            # Find the class that defines this method for the instance
+            defining_cls = next(c for c in mro if method_name in c.__dict__)
+            if defining_cls is not cls:
+                continue
+            if isinstance(fn, staticmethod):
+                obj.__dict__[method_name] = fn.__func__
+            else:
+                obj.__dict__[method_name] = MethodType(fn, obj)
+
+
+def unbind_unchecked_methods(obj) -> None:
+    """
+    Removes the unchecked methods bound to an instance with `bind_unchecked_methods`.
+
+    Args:
+
+    - obj: The instance to remove the unchecked methods from.
+    """
+    for cls in type(obj).__mro__:
+        for method_name in cls.__dict__.get("__unchecked_methods__", {}):
+            obj.__dict__.pop(method_name, None)
 
 
 @type_enforced.Enforcer(enabled=True)
+@keep_unchecked("rotate", "get_rotated_shape")
 class Shape:
     @staticmethod
     def circle(
@@ -142,6 +298,11 @@ class Shape:
         return Shape.rotate(radians=radians, shape=shape)
 
 
+# Shape with the unchecked copies of its methods that grids use in fast mode
+# This is built once here rather than for each grid
+UncheckedShape = type("UncheckedShape", (Shape,), Shape.__unchecked_methods__)
+
+
 class ShapeMoverUtils:
     @staticmethod
     def moving_segment_overlap_intervals(
@@ -390,6 +551,179 @@ class ShapeMoverUtils:
             del intervals[key]
         return intervals
 
+    @staticmethod
+    def moving_band_overlap_intervals(
+        x_intervals: dict[int, tuple[int | float, int | float]],
+        y_intervals: dict[int, tuple[int | float, int | float]],
+        slope: float | int,
+        absolute_shape: list[tuple[int | float, int | float]],
+    ):
+        """
+        Combines the x and y overlap intervals of a diagonally moving shape into cell overlap intervals.
+
+        This returns the same intervals as `moving_rectangle_overlap_intervals` followed by `remove_untouched_intervals`,
+        but only visits the cells in each column that fall inside the band swept by the shape instead of
+        every cell in the bounding box of the move.
+
+        Args:
+
+        - x_intervals (dict[int,tuple(int|float,int|float)]): The x axis overlap intervals from `moving_segment_overlap_intervals`.
+        - y_intervals (dict[int,tuple(int|float,int|float)]): The y axis overlap intervals from `moving_segment_overlap_intervals`.
+        - slope (float|int): The slope of the move.
+            - Note: This should never be 0 or infinite for this function.
+        - absolute_shape (list(tuple[int|float, int|float])): A list of coordinates representing the shape's vertices in cell space.
+
+        Returns:
+
+        - dict[tuple(int,int),tuple(int|float,int|float)]: A dictionary mapping each integer (i,j) to the time interval [t_in, t_out]
+            during which any part of the shape overlaps the range [i, i+1) x [j, j+1).
+        """
+        result = {}
+        if not x_intervals or not y_intervals:
+            return result
+        min_vertex, max_vertex = (
+            ShapeMoverUtils.find_extreme_orthogonal_vertices_simplified(
+                points=absolute_shape, slope=slope
+            )
+        )
+        shape_min_intercept = min_vertex[1] - slope * min_vertex[0]
+        shape_max_intercept = max_vertex[1] - slope * max_vertex[0]
+        ltx_increment = 1 if slope < 0 else 0
+        gtx_increment = 0 if slope < 0 else 1
+        y_first = min(y_intervals)
+        y_last = max(y_intervals)
+
+        for x_cell, x_interval in x_intervals.items():
+            # A cell is in the swept band when its intercept range overlaps the shape intercept range
+            # This is the same check as remove_untouched_intervals, solved for the range of y cells
+            min_offset = slope * (x_cell + gtx_increment)
+            max_offset = slope * (x_cell + ltx_increment)
+            y_lo = max(
+                math.floor(shape_min_intercept - 1 + max_offset), y_first
+            )
+            y_hi = min(math.ceil(shape_max_intercept + min_offset), y_last)
+            # Step over any edge cells that only passed due to floating point rounding
+            while y_lo <= y_hi and not (
+                shape_min_intercept < (y_lo + 1) - max_offset
+            ):
+                y_lo += 1
+            while y_hi >= y_lo and not (
+                y_hi - min_offset < shape_max_intercept
+            ):
+                y_hi -= 1
+            x_in, x_out = x_interval
+            for y_cell in range(y_lo, y_hi + 1):
+                y_interval = y_intervals.get(y_cell)
+                # Only add intervals with time overlap
+                if (
+                    y_interval is not None
+                    and x_out > y_interval[0]
+                    and y_interval[1] > x_in
+                ):
+                    result[(x_cell, y_cell)] = (
+                        max(x_in, y_interval[0]),
+                        min(x_out, y_interval[1]),
+                    )
+        return result
+
+    @staticmethod
+    def moving_polygon_overlap_intervals(
+        intervals: dict[tuple[int, int], tuple[int | float, int | float]],
+        absolute_shape: list[tuple[int | float, int | float]],
+        x_shift: float | int,
+        y_shift: float | int,
+        t_start: float | int,
+        t_end: float | int,
+        tolerance: float | int = 0,
+    ):
+        """
+        Trims bounding box overlap intervals down to the exact time windows in which a moving convex polygon overlaps each cell.
+
+        This uses the separating axis theorem. A convex polygon and a cell overlap only if their projections overlap on
+        every edge normal of the polygon and the cell. While the polygon moves linearly, each projection overlaps for a
+        single window of time, so the exact window for a cell is the intersection of the windows for every axis.
+        The x and y axes (the cell edge normals) are already covered by the bounding box intervals, so only the
+        polygon edge normals that are not axis aligned need to be checked.
+
+        Args:
+
+        - intervals (dict[tuple(int,int),tuple(int|float,int|float)]): The bounding box overlap intervals of the move.
+            - These must be a superset of the cells the polygon overlaps, eg: from `moving_rectangle_overlap_intervals`.
+        - absolute_shape (list(tuple[int|float, int|float])): The convex polygon's vertices in cell space at `t_start`.
+        - x_shift (float|int): Total distance (in cells) the polygon moves along the x-axis during [t_start, t_end].
+        - y_shift (float|int): Total distance (in cells) the polygon moves along the y-axis during [t_start, t_end].
+        - t_start (float|int): Start time of the motion.
+        - t_end (float|int): End time of the motion.
+        - tolerance (float|int): The distance (in cells) that the polygon must overlap a cell by along each edge normal to count as overlapping.
+            - Default: 0
+
+        Returns:
+
+        - dict[tuple(int,int),tuple(int|float,int|float)]: A dictionary mapping each integer (i,j) to the time interval [t_in, t_out]
+            during which any part of the polygon overlaps the range [i, i+1) x [j, j+1).
+            Only includes ranges with non-zero overlap duration.
+        """
+        duration = t_end - t_start
+        x_velocity = x_shift / duration if duration != 0 else 0
+        y_velocity = y_shift / duration if duration != 0 else 0
+        axes = []
+        for idx in range(len(absolute_shape)):
+            x_1, y_1 = absolute_shape[idx - 1]
+            x_2, y_2 = absolute_shape[idx]
+            # Axis aligned (or degenerate) edges are already handled by the bounding box intervals
+            if x_1 == x_2 or y_1 == y_2:
+                continue
+            x_normal = y_1 - y_2
+            y_normal = x_2 - x_1
+            projections = [
+                x * x_normal + y * y_normal for x, y in absolute_shape
+            ]
+            margin = tolerance * (x_normal**2 + y_normal**2) ** 0.5
+            axes.append(
+                (
+                    x_normal,
+                    y_normal,
+                    min(projections),
+                    max(projections),
+                    x_velocity * x_normal + y_velocity * y_normal,
+                    # Offsets from the cell origin to its min and max projections
+                    min(x_normal, 0) + min(y_normal, 0) + margin,
+                    max(x_normal, 0) + max(y_normal, 0) - margin,
+                )
+            )
+        if not axes:
+            return intervals
+
+        result = {}
+        for (x_cell, y_cell), (entry_time, exit_time) in intervals.items():
+            for (
+                x_normal,
+                y_normal,
+                shape_min,
+                shape_max,
+                speed,
+                cell_min_offset,
+                cell_max_offset,
+            ) in axes:
+                cell_origin = x_cell * x_normal + y_cell * y_normal
+                cell_min = cell_origin + cell_min_offset
+                cell_max = cell_origin + cell_max_offset
+                if speed == 0:
+                    if not (shape_max > cell_min and shape_min < cell_max):
+                        exit_time = entry_time
+                        break
+                    continue
+                # Solve for times when the projections start and stop overlapping on this axis
+                t1 = (cell_min - shape_max) / speed + t_start
+                t2 = (cell_max - shape_min) / speed + t_start
+                entry_time = max(entry_time, min(t1, t2))
+                exit_time = min(exit_time, max(t1, t2))
+                if exit_time <= entry_time:
+                    break
+            if exit_time > entry_time:
+                result[(x_cell, y_cell)] = (entry_time, exit_time)
+        return result
+
     @staticmethod
     def moving_shape_overlap_intervals(
         x_coord: float | int,
@@ -400,12 +734,15 @@ class ShapeMoverUtils:
         t_end: float | int,
         shape: list[list[float | int]],
         cell_density: int = 1,
+        exact: bool = False,
+        tolerance: float | int = 0,
     ):
         """
         Calculates the time intervals during which a moving shape overlaps with each unit-length
         integer-aligned range along the x and y axes.
 
         Note: This converts each shape into a full bounding box rectangle and then uses the rectangle overlap function to calculate the intervals.
+        For diagonal moves, only cells in the band swept by the bounding box are returned (see `moving_band_overlap_intervals`).
 
         Args:
 
@@ -417,6 +754,14 @@ class ShapeMoverUtils:
         - t_end (float|int): End time of the motion.
         - shape (list[list[float|int]]): List of coordinates representing the shape's vertices relative to its center.
         - cell_density (int): The number of cells per unit of length.
+        - exact (bool): Whether to trim the bounding box intervals to the exact time windows in which the shape overlaps each cell.
+            - Default: False
+            - This assumes the shape is convex. See `moving_polygon_overlap_intervals`.
+            - This avoids reserving cells in the corners of the bounding box that rotated or rounded shapes never touch.
+        - tolerance (float|int): The distance (in cells) that a stationary shape must overlap a cell by to count when exact is True.
+            - Default: 0
+            - Moving shapes are not affected, so a shape that stops at the moment it touches a cell does not go on to reserve that cell
+              when its (rounded) stopping location is within this distance of the cell.
 
 
         Returns:
@@ -433,25 +778,251 @@ class ShapeMoverUtils:
             ]
             for coord in shape
         ]
-        # Calculate the rectangle overlap intervals in cell space
-        rectangle_overlap_intervals = (
-            ShapeMoverUtils.moving_rectangle_overlap_intervals(
-                x_start=min([coord[0] for coord in absolute_shape]),
-                x_end=max([coord[0] for coord in absolute_shape]),
-                y_start=min([coord[1] for coord in absolute_shape]),
-                y_end=max([coord[1] for coord in absolute_shape]),
+        x_start = min([coord[0] for coord in absolute_shape])
+        x_end = max([coord[0] for coord in absolute_shape])
+        y_start = min([coord[1] for coord in absolute_shape])
+        y_end = max([coord[1] for coord in absolute_shape])
+        # If the shape is only moving vertically or horizontally, the bounding box of the move is fully swept
+        if x_shift == 0 or y_shift == 0:
+            intervals = ShapeMoverUtils.moving_rectangle_overlap_intervals(
+                x_start=x_start,
+                x_end=x_end,
+                y_start=y_start,
+                y_end=y_end,
                 x_shift=x_shift * cell_density,
                 y_shift=y_shift * cell_density,
                 t_start=t_start,
                 t_end=t_end,
             )
-        )
-        # If the shape is only moving vertically or horizontally, we can just return the rectangle overlap intervals
-        if x_shift == 0 or y_shift == 0:
-            return rectangle_overlap_intervals
-        # If the shape is moving diagonally, we should remove intervals that are never passed through by the shape
-        return ShapeMoverUtils.remove_untouched_intervals(
-            intervals=rectangle_overlap_intervals,
-            slope=y_shift / x_shift,
+        # If the shape is moving diagonally, only visit the cells in the band swept by the shape
+        else:
+            intervals = ShapeMoverUtils.moving_band_overlap_intervals(
+                x_intervals=ShapeMoverUtils.moving_segment_overlap_intervals(
+                    seg_start=x_start,
+                    seg_end=x_end,
+                    t_start=t_start,
+                    t_end=t_end,
+                    shift=x_shift * cell_density,
+                ),
+                y_intervals=ShapeMoverUtils.moving_segment_overlap_intervals(
+                    seg_start=y_start,
+                    seg_end=y_end,
+                    t_start=t_start,
+                    t_end=t_end,
+                    shift=y_shift * cell_density,
+                ),
+                slope=y_shift / x_shift,
+                absolute_shape=absolute_shape,
+            )
+        if not exact:
+            return intervals
+        return ShapeMoverUtils.moving_polygon_overlap_intervals(
+            intervals=intervals,
             absolute_shape=absolute_shape,
+            x_shift=x_shift * cell_density,
+            y_shift=y_shift * cell_density,
+            t_start=t_start,
+            t_end=t_end,
+            tolerance=tolerance if x_shift == 0 and y_shift == 0 else 0,
+        )
+
+
+class FootprintCache:
+    """
+    An LRU cache of the cells covered by stationary shapes.
+
+    A stationary shape covers the same cells (relative to the cell it sits in) wherever it is placed,
+    as long as it has the same vertices (including rotation), the same offset within its cell and the same cell density.
+    Cached footprints are stored as a list of (x_cell, y_cell) offsets from the cell that holds the shape's center.
+
+    Footprints always match `ShapeMoverUtils.moving_shape_overlap_intervals`:
+
+    - Cached footprints are calculated from the offset within the cell, which rounds differently than the absolute
+      position. This only changes the covered cells if an edge of the shape's bounding box lies on a cell boundary, so
+      such shapes are rasterized from their absolute position instead of using the cache.
+    - Exact rasterization can also depend on where the shape's diagonal edges pass cell corners, so exact footprints
+      are always rasterized from their absolute position.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        """
+        Initializes a FootprintCache instance.
+
+        Args:
+
+        - max_size (int): The maximum number of footprints to keep.
+            - Default: 1024
+            - The least recently used footprint is evicted when the cache is full.
+        """
+        assert max_size > 0, "max_size must be greater than 0"
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.__footprints__ = OrderedDict()
+
+    def __len__(self):
+        return len(self.__footprints__)
+
+    @staticmethod
+    def __is_on_cell_boundary__(
+        x_coord: float | int,
+        y_coord: float | int,
+        shape: list[list[float | int]],
+        cell_density: int,
+    ) -> bool:
+        """
+        Returns True if an edge of the shape's bounding box is within floating point error of a cell boundary.
+
+        The bounding box is calculated in the same way as in `ShapeMoverUtils.moving_shape_overlap_intervals`.
+        """
+        x_edges = [(x_coord + coord[0]) * cell_density for coord in shape]
+        y_edges = [(y_coord + coord[1]) * cell_density for coord in shape]
+        for edge in (min(x_edges), max(x_edges), min(y_edges), max(y_edges)):
+            if abs(edge - round(edge)) <= 1e-9 * max(1, abs(edge)):
+                return True
+        return False
+
+    def get_footprint(
+        self,
+        x_coord: float | int,
+        y_coord: float | int,
+        shape: list[list[float | int]],
+        cell_density: int = 1,
+        exact: bool = False,
+        tolerance: float | int = 0,
+    ) -> list[tuple[int, int]]:
+        """
+        Returns the cells that a stationary shape overlaps.
+
+        Args:
+
+        - x_coord (float|int): The x-coordinate of the shape's center.
+        - y_coord (float|int): The y-coordinate of the shape's center.
+        - shape (list[list[float|int]]): List of coordinates representing the shape's vertices relative to its center.
+        - cell_density (int): The number of cells per unit of length.
+            - Default: 1
+        - exact (bool): Whether to use exact rasterization. See `ShapeMoverUtils.moving_shape_overlap_intervals`.
+            - Default: False
+        - tolerance (float|int): The exact rasterization tolerance. See `ShapeMoverUtils.moving_shape_overlap_intervals`.
+            - Default: 0
+
+        Returns:
+
+        - list[tuple(int,int)]: The (x_cell, y_cell) coordinates of each overlapped cell.
+        """
+        if exact or self.__is_on_cell_boundary__(
+            x_coord, y_coord, shape, cell_density
+        ):
+            self.misses += 1
+            return list(
+                ShapeMoverUtils.moving_shape_overlap_intervals(
+                    x_coord=x_coord,
+                    y_coord=y_coord,
+                    x_shift=0,
+                    y_shift=0,
+                    t_start=0,
+                    t_end=1,
+                    shape=shape,
+                    cell_density=cell_density,
+                    exact=exact,
+                    tolerance=tolerance,
+                ).keys()
+            )
+        x_scaled = x_coord * cell_density
+        y_scaled = y_coord * cell_density
+        x_base = math.floor(x_scaled)
+        y_base = math.floor(y_scaled)
+        x_offset = x_scaled - x_base
+        y_offset = y_scaled - y_base
+        key = (
+            tuple(tuple(coord) for coord in shape),
+            x_offset,
+            y_offset,
+            cell_density,
+            exact,
+            tolerance,
         )
+        footprint = self.__footprints__.get(key)
+        if footprint is None:
+            self.misses += 1
+            footprint = list(
+                ShapeMoverUtils.moving_shape_overlap_intervals(
+                    x_coord=x_offset / cell_density,
+                    y_coord=y_offset / cell_density,
+                    x_shift=0,
+                    y_shift=0,
+                    t_start=0,
+                    t_end=1,
+                    shape=shape,
+                    cell_density=cell_density,
+                    exact=exact,
+                    tolerance=tolerance,
+                ).keys()
+            )
+            self.__footprints__[key] = footprint
+            if len(self.__footprints__) > self.max_size:
+                self.__footprints__.popitem(last=False)
+        else:
+            self.hits += 1
+            self.__footprints__.move_to_end(key)
+        return [
+            (x_base + x_cell, y_base + y_cell) for x_cell, y_cell in footprint
+        ]
+
+    def get_overlap_intervals(
+        self,
+        x_coord: float | int,
+        y_coord: float | int,
+        t_start: float | int,
+        t_end: float | int,
+        shape: list[list[float | int]],
+        cell_density: int = 1,
+        exact: bool = False,
+        tolerance: float | int = 0,
+    ) -> dict[tuple[int, int], tuple[int | float, int | float]]:
+        """
+        A cached version of `ShapeMoverUtils.moving_shape_overlap_intervals` for shapes that do not move.
+
+        Args:
+
+        - x_coord (float|int): The x-coordinate of the shape's center.
+        - y_coord (float|int): The y-coordinate of the shape's center.
+        - t_start (float|int): Start time of the interval.
+        - t_end (float|int): End time of the interval.
+        - shape (list[list[float|int]]): List of coordinates representing the shape's vertices relative to its center.
+        - cell_density (int): The number of cells per unit of length.
+            - Default: 1
+        - exact (bool): Whether to use exact rasterization.
+            - Default: False
+        - tolerance (float|int): The exact rasterization tolerance.
+            - Default: 0
+
+        Returns:
+
+        - dict[tuple(int,int),tuple(int|float,int|float)]: A dictionary mapping each overlapped cell to (t_start, t_end).
+            - This is empty if t_end is not greater than t_start.
+        """
+        if t_end <= t_start:
+            return {}
+        interval = (t_start, t_end)
+        return {
+            cell: interval
+            for cell in self.get_footprint(
+                x_coord=x_coord,
+                y_coord=y_coord,
+                shape=shape,
+                cell_density=cell_density,
+                exact=exact,
+                tolerance=tolerance,
+            )
+        }
+
+    def get_stats(self) -> dict:
+        """
+        Returns the cache statistics.
+
+        Returns:
+
+        - dict: A dictionary with the number of cache hits, misses and the current number of cached footprints.
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self)}
@@ -0,0 +1,100 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity, StaticEntity
+from fizgrid.cells import ArrayCellStore
+from fizgrid.utils import Shape
+
+success = True
+
+# Test the array backed store directly
+try:
+    store = ArrayCellStore(x_cells=4, y_cells=4)
+    block_1 = store.add(1, 1, 0, 5, 1)
+    block_2 = store.add(1, 1, 5, 10, 2)
+    block_3 = store.add(2, 1, 0, 10, 3)
+    if sorted(store.get_reservations(1, 1)) != [(0, 5, 1), (5, 10, 2)]:
+        success = False
+    if store.get_overlaps(1, 1, 4, 6) != [(0, 5, 1), (5, 10, 2)]:
+        success = False
+    if not store.is_occupied(2, 1, 0) or store.is_occupied(2, 1, 10):
+        success = False
+    store.remove(1, 1, block_2)
+    if store.get_reservations(1, 1) != [(0, 5, 1)]:
+        success = False
+    # Removed slots should be recycled
+    if store.add(3, 3, 1, 2, 4) != block_2:
+        success = False
+    store.remove(1, 1, block_1)
+    store.remove(2, 1, block_3)
+    if store.get_reservations(1, 1) != [] or store.get_reservations(2, 1) != []:
+        success = False
+    # Removing a block twice (or from the wrong cell) should be ignored as in the dict store
+    store = ArrayCellStore(x_cells=4, y_cells=4)
+    block_1 = store.add(0, 0, 0, 5, 1)
+    block_2 = store.add(0, 0, 0, 5, 2)
+    store.remove(0, 0, block_2)
+    store.remove(0, 0, block_2)
+    store.remove(1, 0, block_1)
+    block_3 = store.add(2, 2, 0, 5, 3)
+    block_4 = store.add(0, 1, 0, 5, 4)
+    if block_3 == block_4:
+        success = False
+    if store.get_reservations(0, 0) != [(0, 5, 1)]:
+        success = False
+    if store.get_reservations(2, 2) != [(0, 5, 3)]:
+        success = False
+    if store.get_reservations(0, 1) != [(0, 5, 4)]:
+        success = False
+except:
+    success = False
+
+
+# Test that both cell stores produce the same simulation results
+def run_sim(cell_store):
+    grid = Grid(
+        name="test_grid",
+        x_size=10,
+        y_size=10,
+        add_exterior_walls=True,
+        cell_density=2,
+        cell_store=cell_store,
+    )
+    grid.add_entity(
+        StaticEntity(
+            name="sofa",
+            shape=Shape.rectangle(x_len=2, y_len=1),
+            x_coord=5,
+            y_coord=5.5,
+        )
+    )
+    amr1 = grid.add_entity(
+        Entity(
+            name="AMR1",
+            shape=Shape.rectangle(x_len=1, y_len=1, round_to=2),
+            x_coord=5,
+            y_coord=2,
+        )
+    )
+    amr2 = grid.add_entity(
+        Entity(
+            name="AMR2",
+            shape=Shape.rectangle(x_len=1, y_len=1, round_to=2),
+            x_coord=2,
+            y_coord=8,
+        )
+    )
+    amr1.add_route(waypoints=[(5, 8, 6)])
+    amr2.add_route(waypoints=[(8, 8, 3), (8, 2, 6)])
+    grid.simulate()
+    return amr1.history, amr2.history
+
+
+try:
+    if run_sim("dict") != run_sim("array"):
+        success = False
+except:
+    success = False
+
+if success:
+    print("test_18.py: passed")
+else:
+    print("test_18.py: failed")
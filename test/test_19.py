@@ -0,0 +1,41 @@
+from fizgrid.cells import IntervalIndex
+import random
+
+random.seed(42)
+
+# Compare the sorted interval index against a brute force scan of the same reservations
+success = True
+try:
+    index = IntervalIndex()
+    reservations = {}
+    for block_id in range(200):
+        t_start = random.randint(0, 100)
+        t_end = t_start + random.choice([1, 5, 20, 1000])
+        index.add(block_id, t_start, t_end, f"entity_{block_id % 7}")
+        reservations[block_id] = (t_start, t_end, f"entity_{block_id % 7}")
+    for block_id in random.sample(list(reservations), 100):
+        index.remove(block_id)
+        reservations.pop(block_id)
+    if len(index) != len(reservations):
+        success = False
+    for _ in range(500):
+        t_start = random.uniform(0, 150)
+        t_end = t_start + random.choice([0.5, 3, 50])
+        expected = sorted(
+            r for r in reservations.values() if t_start < r[1] and t_end > r[0]
+        )
+        if sorted(index.get_overlaps(t_start, t_end)) != expected:
+            success = False
+        point = random.randint(0, 150)
+        expected_occupied = any(
+            r[0] <= point < r[1] for r in reservations.values()
+        )
+        if index.is_occupied(point) != expected_occupied:
+            success = False
+except:
+    success = False
+
+if success:
+    print("test_19.py: passed")
+else:
+    print("test_19.py: failed")
@@ -0,0 +1,104 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity, StaticEntity
+from fizgrid.utils import Shape
+
+grid = Grid(
+    name="living_room",
+    x_size=10,
+    y_size=10,
+    add_exterior_walls=True,
+    cell_density=2,
+)
+
+sofa = grid.add_entity(
+    StaticEntity(
+        name="sofa",
+        shape=Shape.rectangle(x_len=2, y_len=1),
+        x_coord=5,
+        y_coord=5.5,
+    )
+)
+
+shelf = grid.add_entity(
+    StaticEntity(
+        name="shelf",
+        shape=Shape.rectangle(x_len=1, y_len=1),
+        x_coord=8,
+        y_coord=5,
+    )
+)
+
+robot = grid.add_entity(
+    Entity(
+        name="robot",
+        shape=Shape.rectangle(x_len=1, y_len=1),
+        x_coord=5,
+        y_coord=2,
+    )
+)
+
+rover = grid.add_entity(
+    Entity(
+        name="rover",
+        shape=Shape.rectangle(x_len=1, y_len=1),
+        x_coord=8,
+        y_coord=2,
+    )
+)
+
+success = True
+
+# Static entities should be written to the static layer instead of the cell reservations
+for x_cell in range(20):
+    for y_cell in range(20):
+        for reservation in grid.__cells__.get_reservations(x_cell, y_cell):
+            if reservation[2] not in (robot.id, rover.id):
+                success = False
+if not grid.__static_layer__.is_blocked(0, 5):
+    success = False
+if not grid.__static_layer__.is_blocked(10, 10):
+    success = False
+
+# The robot should bump into the sofa and the rover should pass through the removed shelf
+robot.add_route(waypoints=[(5, 8, 6)])
+rover.add_route(waypoints=[(8, 8, 6)], time=1)
+grid.remove_entity(shelf, time=1)
+
+# A wall placed on robot_2's planned path should cause a collision
+robot_2 = grid.add_entity(
+    Entity(
+        name="robot_2",
+        shape=Shape.rectangle(x_len=1, y_len=1),
+        x_coord=2,
+        y_coord=8,
+    )
+)
+robot_2.add_route(waypoints=[(2, 3, 5)])
+wall = grid.add_entity(
+    StaticEntity(
+        name="wall",
+        shape=Shape.rectangle(x_len=1, y_len=1),
+        x_coord=2,
+        y_coord=4,
+    ),
+    time=1,
+)
+
+grid.simulate()
+
+try:
+    if robot.history[-1]["y"] != 4.5 or robot.history[-1]["c"] != True:
+        success = False
+    if rover.history[-1]["y"] != 8 or rover.history[-1]["c"] != False:
+        success = False
+    if grid.__static_layer__.is_blocked(16, 10):
+        success = False
+    if robot_2.history[-1]["y"] != 5 or robot_2.history[-1]["c"] != True:
+        success = False
+except:
+    success = False
+
+if success:
+    print("test_20.py: passed")
+else:
+    print("test_20.py: failed")
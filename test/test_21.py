@@ -0,0 +1,65 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity, StaticEntity
+from fizgrid.utils import Shape
+
+# A very large grid should only allocate the tiles that are in use
+grid = Grid(
+    name="yard",
+    x_size=2000,
+    y_size=2000,
+    max_time=1000,
+    add_exterior_walls=False,
+    cell_density=2,
+)
+
+success = True
+try:
+    if len(grid.__cells__.__tiles__) != 0:
+        success = False
+
+    amr = grid.add_entity(
+        Entity(
+            name="AMR",
+            shape=Shape.rectangle(x_len=1, y_len=1),
+            x_coord=1004,
+            y_coord=1004,
+        )
+    )
+    rack = grid.add_entity(
+        StaticEntity(
+            name="rack",
+            shape=Shape.rectangle(x_len=4, y_len=1),
+            x_coord=1010,
+            y_coord=1050,
+        )
+    )
+    # A parked AMR is stored in the static layer, so no cell store tiles are used
+    if len(grid.__cells__.__tiles__) != 0:
+        success = False
+    # A parked 1x1 AMR at density 2 and the rack each touch a single tile
+    if len(grid.__static_layer__.__raster_tiles__) != 2:
+        success = False
+
+    amr.add_route(waypoints=[(1004, 1103, 10)])
+    grid.simulate()
+    if amr.history[-1]["y"] != 1103:
+        success = False
+    # Tiles along the old route should be freed once the AMR parks
+    if len(grid.__cells__.__tiles__) != 0:
+        success = False
+    if len(grid.__static_layer__.__raster_tiles__) != 2:
+        success = False
+
+    grid.remove_entity(amr)
+    grid.remove_entity(rack)
+    if len(grid.__cells__.__tiles__) != 0:
+        success = False
+    if len(grid.__static_layer__.__raster_tiles__) != 0:
+        success = False
+except:
+    success = False
+
+if success:
+    print("test_21.py: passed")
+else:
+    print("test_21.py: failed")
@@ -0,0 +1,52 @@
+from fizgrid.queue import TimeQueue
+import random
+
+random.seed(42)
+
+# The calendar backend should process events in exactly the same order as the heap backend
+success = True
+try:
+    heap_queue = TimeQueue(backend="heap")
+    calendar_queue = TimeQueue(backend="calendar", bucket_width=0.5)
+    heap_order = []
+    calendar_order = []
+    for step in range(2000):
+        # Interleave adding, removing and processing events
+        action = random.random()
+        if action < 0.6:
+            time = heap_queue.__time__ + random.choice(
+                [0, 0.5, 1, 1.5, 10, 250, random.uniform(0, 1000)]
+            )
+            priority = random.randint(0, 5)
+            event = {"step": step}
+            heap_id = heap_queue.add_event(
+                time=time, event=event, priority=priority
+            )
+            calendar_id = calendar_queue.add_event(
+                time=time, event=event, priority=priority
+            )
+            if heap_id != calendar_id:
+                success = False
+        elif action < 0.7:
+            remove_id = random.randint(0, heap_queue.__next_id__)
+            heap_queue.remove_event(remove_id)
+            calendar_queue.remove_event(remove_id)
+        else:
+            heap_order.append(heap_queue.get_next_events())
+            calendar_order.append(calendar_queue.get_next_events())
+    while True:
+        heap_events = heap_queue.get_next_events()
+        calendar_events = calendar_queue.get_next_events()
+        heap_order.append(heap_events)
+        calendar_order.append(calendar_events)
+        if len(heap_events) == 0 and len(calendar_events) == 0:
+            break
+    if heap_order != calendar_order:
+        success = False
+except:
+    success = False
+
+if success:
+    print("test_22.py: passed")
+else:
+    print("test_22.py: failed")
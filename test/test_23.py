@@ -0,0 +1,52 @@
+from fizgrid.queue import TimeQueue
+
+# Removed events should be compacted out of the heap once they make up most of it
+success = True
+try:
+    for backend in ["heap", "calendar"]:
+        queue = TimeQueue(
+            backend=backend, compact_ratio=0.5, compact_min_stale=100
+        )
+        ids = [
+            queue.add_event(time=idx % 50, event={"idx": idx})
+            for idx in range(1000)
+        ]
+        for id in ids[:400]:
+            queue.remove_event(id)
+        if queue.get_live_count() != 600 or queue.get_stale_count() != 400:
+            success = False
+        if len(queue.__heap__) != 1000:
+            success = False
+        # Crossing the threshold rebuilds the heap with only the live events
+        for id in ids[400:510]:
+            queue.remove_event(id)
+        # The 501st removal crosses the threshold, leaving 9 stale entries after it
+        if queue.get_stale_count() != 9 or len(queue.__heap__) != 499:
+            success = False
+        queue.compact()
+        if queue.get_stale_count() != 0 or len(queue.__heap__) != 490:
+            success = False
+        # Removing an event twice or removing a processed event does not count as stale
+        queue.remove_event(ids[0])
+        first = queue.get_next_event()
+        queue.remove_event(first["id"])
+        if queue.get_stale_count() != 0 or queue.get_live_count() != 489:
+            success = False
+        # The remaining events are still processed in order
+        times = [first["time"]]
+        while True:
+            event = queue.get_next_event()
+            if event["id"] is None:
+                break
+            times.append(event["time"])
+        if len(times) != 490 or times != sorted(times):
+            success = False
+        if queue.get_stale_count() != 0 or len(queue.__heap__) != 0:
+            success = False
+except:
+    success = False
+
+if success:
+    print("test_23.py: passed")
+else:
+    print("test_23.py: failed")
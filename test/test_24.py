@@ -0,0 +1,71 @@
+from fizgrid.grid import Grid, GridEvent
+from fizgrid.queue import TimeQueue
+
+
+class Counter:
+    def __init__(self):
+        self.calls = []
+
+    def bump(self, amount=1):
+        self.calls.append(amount)
+
+
+grid = Grid(name="events", x_size=5, y_size=5, add_exterior_walls=False)
+counter = Counter()
+
+success = True
+try:
+    # Events are still scheduled with a method name and can be read like dicts
+    grid.add_event(time=1, object=counter, method="bump", kwargs={"amount": 2})
+    grid.add_event(time=1, object=counter, method="bump", priority=1)
+    grid.add_event(time=3, object=counter, method="bump", kwargs={"amount": 5})
+    event_items = grid.resolve_next_state()
+    if [item["event"]["kwargs"] for item in event_items] != [{}, {"amount": 2}]:
+        success = False
+    if event_items[0]["event"].get("method") != "bump":
+        success = False
+    if event_items[0]["event"] != {
+        "object": counter,
+        "method": "bump",
+        "kwargs": {},
+    }:
+        success = False
+    if counter.calls != [1, 2]:
+        success = False
+    grid.simulate()
+    if counter.calls != [1, 2, 5] or grid.get_time() != 3:
+        success = False
+
+    # Unknown methods fail when the event is scheduled rather than when it is processed
+    try:
+        grid.add_event(time=4, object=counter, method="missing")
+        success = False
+    except AttributeError:
+        pass
+
+    # Methods are looked up when the event is processed, so a method rebound after scheduling is used
+    grid.add_event(time=5, object=counter, method="bump")
+    counter.bump = lambda: counter.calls.append("patched")
+    grid.simulate()
+    if counter.calls[-1] != "patched":
+        success = False
+
+    # The queue can pop all events at the next time as tuples
+    queue = TimeQueue()
+    first = queue.add_event(time=2, event=GridEvent(counter, "bump", {}))
+    removed = queue.add_event(time=2, event={"a": 1})
+    last = queue.add_event(time=2, event={"b": 2}, priority=-1)
+    queue.add_event(time=4, event={"c": 3})
+    queue.remove_event(removed)
+    times_ids = [(time, id) for time, id, _ in queue.pop_next_events()]
+    if times_ids != [(2, first), (2, last)]:
+        success = False
+    if queue.get_stale_count() != 0 or queue.__time__ != 2:
+        success = False
+except:
+    success = False
+
+if success:
+    print("test_24.py: passed")
+else:
+    print("test_24.py: failed")
@@ -0,0 +1,59 @@
+from fizgrid.utils import ShapeMoverUtils, Shape
+import random
+
+random.seed(7)
+
+# The swept band rasterization should match the full bounding box followed by remove_untouched_intervals
+success = True
+try:
+    shapes = [
+        Shape.rectangle(x_len=1, y_len=1),
+        Shape.rectangle(x_len=2.3, y_len=0.7),
+        Shape.circle(radius=1.2, num_points=8),
+    ]
+    for _ in range(300):
+        shape = random.choice(shapes)
+        x_coord = random.uniform(0, 50)
+        y_coord = random.uniform(0, 50)
+        x_shift = random.choice([-1, 1]) * random.uniform(0.01, 40)
+        y_shift = random.choice([-1, 1]) * random.uniform(0.01, 40)
+        cell_density = random.choice([1, 2, 4])
+        t_start = random.uniform(0, 10)
+        t_end = t_start + random.uniform(0.5, 30)
+        absolute_shape = [
+            [(x_coord + x) * cell_density, (y_coord + y) * cell_density]
+            for x, y in shape
+        ]
+        expected = ShapeMoverUtils.remove_untouched_intervals(
+            intervals=ShapeMoverUtils.moving_rectangle_overlap_intervals(
+                x_start=min(x for x, y in absolute_shape),
+                x_end=max(x for x, y in absolute_shape),
+                y_start=min(y for x, y in absolute_shape),
+                y_end=max(y for x, y in absolute_shape),
+                x_shift=x_shift * cell_density,
+                y_shift=y_shift * cell_density,
+                t_start=t_start,
+                t_end=t_end,
+            ),
+            slope=y_shift / x_shift,
+            absolute_shape=absolute_shape,
+        )
+        result = ShapeMoverUtils.moving_shape_overlap_intervals(
+            x_coord=x_coord,
+            y_coord=y_coord,
+            x_shift=x_shift,
+            y_shift=y_shift,
+            t_start=t_start,
+            t_end=t_end,
+            shape=shape,
+            cell_density=cell_density,
+        )
+        if result != expected or list(result) != list(expected):
+            success = False
+except:
+    success = False
+
+if success:
+    print("test_25.py: passed")
+else:
+    print("test_25.py: failed")
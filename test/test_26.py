@@ -0,0 +1,115 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity
+from fizgrid.utils import ShapeMoverUtils, Shape
+import random
+
+random.seed(11)
+diamond = [[1, 0], [0, 1], [-1, 0], [0, -1]]
+
+success = True
+try:
+    # A parked diamond only overlaps the center cell and its four neighbors
+    result = ShapeMoverUtils.moving_shape_overlap_intervals(
+        x_coord=5.5,
+        y_coord=5.5,
+        x_shift=0,
+        y_shift=0,
+        t_start=0,
+        t_end=10,
+        shape=diamond,
+        exact=True,
+    )
+    if sorted(result) != [(4, 5), (5, 4), (5, 5), (5, 6), (6, 5)]:
+        success = False
+
+    # Axis aligned rectangles are unchanged by exact rasterization
+    results = [
+        ShapeMoverUtils.moving_shape_overlap_intervals(
+            x_coord=2,
+            y_coord=3,
+            x_shift=7,
+            y_shift=4,
+            t_start=1,
+            t_end=5,
+            shape=Shape.rectangle(x_len=1, y_len=2),
+            exact=exact,
+        )
+        for exact in [True, False]
+    ]
+    if results[0] != results[1]:
+        success = False
+
+    # Every sampled point of a moving shape should fall in a reserved cell during its reserved window
+    for _ in range(50):
+        shape = Shape.rotate(
+            radians=random.uniform(0, 3.14), shape=Shape.circle(radius=1.5)
+        )
+        x_shift = random.uniform(-10, 10)
+        y_shift = random.uniform(-10, 10)
+        cell_density = random.choice([1, 2])
+        result = ShapeMoverUtils.moving_shape_overlap_intervals(
+            x_coord=20,
+            y_coord=20,
+            x_shift=x_shift,
+            y_shift=y_shift,
+            t_start=0,
+            t_end=10,
+            shape=shape,
+            cell_density=cell_density,
+            exact=True,
+        )
+        bounding_box = ShapeMoverUtils.moving_shape_overlap_intervals(
+            x_coord=20,
+            y_coord=20,
+            x_shift=x_shift,
+            y_shift=y_shift,
+            t_start=0,
+            t_end=10,
+            shape=shape,
+            cell_density=cell_density,
+        )
+        if not set(result).issubset(bounding_box):
+            success = False
+        for _ in range(200):
+            # Sample a point inside the shape as a convex combination of its vertices
+            weights = [random.random() for _ in shape]
+            total = sum(weights)
+            x = sum(w * coord[0] for w, coord in zip(weights, shape)) / total
+            y = sum(w * coord[1] for w, coord in zip(weights, shape)) / total
+            time = random.uniform(0.01, 9.99)
+            x_cell = int((20 + x + x_shift * time / 10) * cell_density)
+            y_cell = int((20 + y + y_shift * time / 10) * cell_density)
+            window = result.get((x_cell, y_cell))
+            if window is None or not (
+                window[0] - 1e-9 <= time <= window[1] + 1e-9
+            ):
+                success = False
+
+    # Exact rasterization should let a diamond park next to another without a corner collision
+    for rasterization, expected_collision in [
+        ("bounding_box", True),
+        ("exact", False),
+    ]:
+        grid = Grid(
+            name="diamonds",
+            x_size=20,
+            y_size=20,
+            rasterization=rasterization,
+        )
+        grid.add_entity(
+            Entity(name="parked", shape=diamond, x_coord=5.5, y_coord=5.5)
+        )
+        mover = grid.add_entity(
+            Entity(name="mover", shape=diamond, x_coord=15.5, y_coord=7.5)
+        )
+        mover.add_route(waypoints=[(7.5, 7.5, 8)])
+        grid.simulate()
+        if mover.history[-1]["c"] != expected_collision:
+            success = False
+except:
+    success = False
+
+if success:
+    print("test_26.py: passed")
+else:
+    print("test_26.py: failed")
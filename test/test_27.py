@@ -0,0 +1,130 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity
+from fizgrid.utils import FootprintCache, ShapeMoverUtils, Shape
+import random
+
+success = True
+try:
+    cache = FootprintCache(max_size=2)
+    square = Shape.rectangle(x_len=1, y_len=1)
+    hexagon = Shape.circle(radius=0.9, num_points=6)
+    # Footprints should match the uncached calculation wherever the shape is placed
+    for x_coord, y_coord, shape in [
+        (5.25, 7.75, square),
+        (105.25, 3.75, square),
+        (12.75, 2.25, hexagon),
+        (2.75, 40.25, hexagon),
+    ]:
+        for cell_density in [1, 2]:
+            expected = ShapeMoverUtils.moving_shape_overlap_intervals(
+                x_coord=x_coord,
+                y_coord=y_coord,
+                x_shift=0,
+                y_shift=0,
+                t_start=3,
+                t_end=9,
+                shape=shape,
+                cell_density=cell_density,
+            )
+            result = cache.get_overlap_intervals(
+                x_coord=x_coord,
+                y_coord=y_coord,
+                t_start=3,
+                t_end=9,
+                shape=shape,
+                cell_density=cell_density,
+            )
+            if result != expected:
+                success = False
+    # The second placement of each shape at the same sub-cell offset is a hit
+    if cache.get_stats() != {"hits": 4, "misses": 4, "size": 2}:
+        success = False
+    # The least recently used footprint is evicted
+    cache.get_footprint(x_coord=1.75, y_coord=1.25, shape=hexagon)
+    cache.get_footprint(x_coord=1.25, y_coord=1.75, shape=square)
+    cache.get_footprint(x_coord=1.75, y_coord=1.25, shape=hexagon)
+    if cache.hits != 6 or cache.misses != 5:
+        success = False
+    cache.get_footprint(
+        x_coord=12.75, y_coord=2.25, shape=hexagon, cell_density=2
+    )
+    if cache.hits != 6 or cache.misses != 6:
+        success = False
+    if cache.get_overlap_intervals(
+        x_coord=1, y_coord=1, t_start=2, t_end=2, shape=square
+    ):
+        success = False
+
+    # Shapes with an edge on a cell boundary are rasterized from their absolute position and not cached
+    cache = FootprintCache()
+    strip = Shape.rectangle(x_len=1, y_len=0.6)
+    if cache.get_footprint(x_coord=26.27, y_coord=2.7, shape=strip) != [
+        (25, 2),
+        (26, 2),
+    ]:
+        success = False
+    if cache.get_stats() != {"hits": 0, "misses": 1, "size": 0}:
+        success = False
+
+    # Randomized placements should match the uncached calculation, including shapes with edges on cell boundaries
+    random.seed(10)
+    shapes = [
+        Shape.rectangle(x_len=1, y_len=0.6),
+        Shape.rectangle(x_len=1, y_len=1),
+        Shape.rectangle(x_len=1.5, y_len=0.5),
+        Shape.circle(radius=0.9, num_points=8),
+        Shape.rotate(radians=0.5, shape=Shape.rectangle(x_len=2, y_len=1)),
+    ]
+    cache = FootprintCache(max_size=64)
+    for _ in range(5000):
+        shape = random.choice(shapes)
+        x_coord = round(random.uniform(0, 100), random.choice([1, 2, 6]))
+        y_coord = round(random.uniform(0, 100), random.choice([1, 2, 6]))
+        cell_density = random.choice([1, 2, 4])
+        exact = random.random() < 0.25
+        expected = ShapeMoverUtils.moving_shape_overlap_intervals(
+            x_coord=x_coord,
+            y_coord=y_coord,
+            x_shift=0,
+            y_shift=0,
+            t_start=0,
+            t_end=1,
+            shape=shape,
+            cell_density=cell_density,
+            exact=exact,
+        )
+        result = cache.get_footprint(
+            x_coord=x_coord,
+            y_coord=y_coord,
+            shape=shape,
+            cell_density=cell_density,
+            exact=exact,
+        )
+        if sorted(result) != sorted(expected.keys()):
+            success = False
+    if cache.hits == 0:
+        success = False
+
+    # Parking AMRs with the same shape on the same sub-cell offsets share footprints
+    grid = Grid(name="depot", x_size=40, y_size=10, add_exterior_walls=False)
+    for idx in range(10):
+        amr = grid.add_entity(
+            Entity(
+                name=f"AMR{idx}",
+                shape=Shape.rectangle(x_len=1, y_len=1),
+                x_coord=3 + idx * 3,
+                y_coord=2,
+            )
+        )
+        amr.add_route(waypoints=[(3 + idx * 3, 7, 5)])
+    grid.simulate()
+    stats = grid.__footprint_cache__.get_stats()
+    if stats["misses"] != 1 or stats["hits"] < 30:
+        success = False
+except:
+    success = False
+
+if success:
+    print("test_27.py: passed")
+else:
+    print("test_27.py: failed")
@@ -0,0 +1,84 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity, GhostEntity
+from fizgrid.utils import Shape
+import random
+
+random.seed(3)
+
+
+def walk_waypoints(entity, time):
+    # Reference location from walking every planned waypoint in order
+    x_loc = entity.x_coord
+    y_loc = entity.y_coord
+    t_loc = entity.__route_start_time__
+    for waypoint in entity.__planned_waypoints__:
+        if t_loc >= time:
+            break
+        elif t_loc + waypoint[2] > time:
+            pct_complete = (time - t_loc) / waypoint[2]
+            x_loc = (waypoint[0] - x_loc) * pct_complete + x_loc
+            y_loc = (waypoint[1] - y_loc) * pct_complete + y_loc
+            t_loc = time
+        else:
+            x_loc = waypoint[0]
+            y_loc = waypoint[1]
+            t_loc = t_loc + waypoint[2]
+        x_loc = round(x_loc, 4)
+        y_loc = round(y_loc, 4)
+    return (x_loc, y_loc)
+
+
+grid = Grid(name="floor", x_size=50, y_size=50, max_time=500)
+entities = []
+for idx in range(6):
+    entity_class = GhostEntity if idx == 5 else Entity
+    entity = grid.add_entity(
+        entity_class(
+            name=f"AMR{idx}",
+            shape=Shape.rectangle(x_len=1, y_len=1),
+            x_coord=5 + idx * 8,
+            y_coord=5,
+        )
+    )
+    entity.add_route(
+        waypoints=[
+            (5 + idx * 8 + random.uniform(-3, 3), 5 + step * 6, 1 + step)
+            for step in range(1, 6)
+        ]
+    )
+    entities.append(entity)
+
+success = True
+try:
+    next_state_events = True
+    while next_state_events:
+        next_state_events = grid.resolve_next_state()
+        time = grid.get_time()
+        locations = grid.get_entity_locations()
+        if len(locations["ids"]) != len(entities):
+            success = False
+        for entity in entities:
+            expected = walk_waypoints(entity, time)
+            if entity.get_current_location() != expected:
+                success = False
+            idx = locations["ids"].index(entity.id)
+            if (locations["x"][idx], locations["y"][idx]) != expected:
+                success = False
+            # Check some times along the rest of the planned route too
+            for _ in range(10):
+                future_time = time + random.choice([0, 1, 2, 3, 6])
+                future_time += random.choice([0, random.random()])
+                if entity.__get_planned_location__(
+                    future_time
+                ) != walk_waypoints(entity, future_time):
+                    success = False
+    # Walls are only included on request
+    if len(grid.get_entity_locations(include_static=True)["ids"]) != 10:
+        success = False
+except:
+    success = False
+
+if success:
+    print("test_28.py: passed")
+else:
+    print("test_28.py: failed")
@@ -0,0 +1,79 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity
+from fizgrid.history import EntityHistory
+from fizgrid.utils import Shape
+
+grid = Grid(
+    name="living_room",
+    x_size=10,
+    y_size=10,
+    add_exterior_walls=True,
+)
+
+robots = {}
+for idx, history_mode in enumerate(["full", "endpoints", "off"]):
+    robots[history_mode] = grid.add_entity(
+        Entity(
+            name=f"robot_{history_mode}",
+            shape=Shape.rectangle(x_len=1, y_len=1),
+            x_coord=2 + idx * 3,
+            y_coord=2,
+            history_mode=history_mode,
+        )
+    )
+    # Each robot drives up and then bumps into the top wall
+    robots[history_mode].add_route(
+        waypoints=[
+            (2 + idx * 3, 4, 2),
+            (2 + idx * 3, 6, 2),
+            (2 + idx * 3, 10, 4),
+        ]
+    )
+
+grid.simulate()
+
+success = True
+try:
+    full = robots["full"].history
+    endpoints = robots["endpoints"].history
+    off = robots["off"].history
+    # Full history records every waypoint reached and the collision location
+    if full[-1] != {"x": 2.0, "y": 8.5, "t": 6.5, "c": True}:
+        success = False
+    if [entry["y"] for entry in full] != [2.0, 2.0, 4.0, 6.0, 8.5]:
+        success = False
+    # Endpoints history only records where routes started and were realized
+    if endpoints != [
+        {"x": 5.0, "y": 2.0, "t": 0.0, "c": False},
+        {"x": 5.0, "y": 2.0, "t": 0.0, "c": False},
+        {"x": 5.0, "y": 8.5, "t": 6.5, "c": True},
+    ]:
+        success = False
+    # No history is recorded when off, but the entity still moves
+    if len(off) != 0 or robots["off"].y_coord != 8.5:
+        success = False
+    # Slicing and iteration return dictionaries
+    if full[-2:] != list(full)[-2:]:
+        success = False
+    if len(full) != len(full.t) or full.c.tolist() != [0, 0, 0, 0, 1]:
+        success = False
+
+    # Standalone history behavior
+    history = EntityHistory()
+    history.set_collision()
+    history.record(x=1, y=2, t=3)
+    history.set_collision()
+    if history != [{"x": 1.0, "y": 2.0, "t": 3.0, "c": True}]:
+        success = False
+    try:
+        EntityHistory(mode="some")
+        success = False
+    except AssertionError:
+        pass
+except:
+    success = False
+
+if success:
+    print("test_29.py: passed")
+else:
+    print("test_29.py: failed")
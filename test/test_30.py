@@ -0,0 +1,83 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity
+from fizgrid.utils import Shape
+
+grid = Grid(
+    name="living_room",
+    x_size=10,
+    y_size=10,
+    add_exterior_walls=False,
+    cell_density=2,
+)
+
+robot = grid.add_entity(
+    Entity(
+        name="robot",
+        shape=Shape.rectangle(x_len=1, y_len=1),
+        x_coord=5,
+        y_coord=2,
+    )
+)
+
+rover = grid.add_entity(
+    Entity(
+        name="rover",
+        shape=Shape.rectangle(x_len=1, y_len=1),
+        x_coord=5,
+        y_coord=8,
+    )
+)
+
+
+def count_reservations(entity_id):
+    # Parked entities block their cells in the static layer
+    return sum(
+        1
+        for x_cell in range(20)
+        for y_cell in range(20)
+        for reservation in grid.__cells__.get_reservations(x_cell, y_cell)
+        + grid.__static_layer__.get_overlaps(x_cell, y_cell, 0, 1000)
+        if reservation[2] == entity_id
+    )
+
+
+success = True
+try:
+    # Placing each robot adds a parking reservation in each of its 4 cells
+    if grid.get_reservation_stats() != {"kept": 0, "added": 8, "removed": 0}:
+        success = False
+
+    # The robot moves up and stops when it bumps into the parked rover
+    robot.add_route(waypoints=[(5, 5, 3), (5, 8, 3)])
+    grid.simulate()
+    if robot.history[-1]["y"] != 7 or robot.history[-1]["c"] != True:
+        success = False
+    # The parked rover is realized by the collision, but its parking reservations do not change
+    stats = grid.get_reservation_stats()
+    if stats["kept"] < 4:
+        success = False
+    # Kept and rewritten reservations should leave exactly one reservation per blocked cell
+    for entity in [robot, rover]:
+        if count_reservations(entity.id) != len(
+            entity.__blocked_grid_cells__
+        ) + len(entity.__parking_cells__):
+            success = False
+    if count_reservations(rover.id) != 4:
+        success = False
+
+    # Checking a route restores the parking reservations of the robot
+    robot.check_route(waypoints=[(2, 6, 3)])
+    if count_reservations(robot.id) != 4:
+        success = False
+    new_stats = grid.get_reservation_stats()
+    if new_stats["kept"] - stats["kept"] != 0:
+        success = False
+    if new_stats["added"] - new_stats["removed"] != 8:
+        success = False
+except:
+    success = False
+
+if success:
+    print("test_30.py: passed")
+else:
+    print("test_30.py: failed")
@@ -0,0 +1,87 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity, StaticEntity
+from fizgrid.utils import Shape
+
+grid = Grid(
+    name="warehouse",
+    x_size=20,
+    y_size=20,
+    max_time=1000,
+    add_exterior_walls=True,
+    cell_density=2,
+)
+
+# An idle fleet parked in a row
+fleet = [
+    grid.add_entity(
+        Entity(
+            name=f"AMR{idx}",
+            shape=Shape.rectangle(x_len=1, y_len=1),
+            x_coord=3 + idx * 2,
+            y_coord=3,
+        )
+    )
+    for idx in range(5)
+]
+
+success = True
+try:
+    # Parked entities do not hold any reservations in the cell store
+    if len(grid.__cells__.__tiles__) != 0:
+        success = False
+    if not grid.__static_layer__.is_blocked(6, 6):
+        success = False
+    if grid.__static_layer__.get_overlaps(6, 6, 0, 1000) != [
+        (0, 1000, fleet[0].id)
+    ]:
+        success = False
+
+    # Moving a parked entity frees its parking cells and parks it again at the end of the route
+    fleet[0].add_route(waypoints=[(3, 10, 7)])
+    grid.simulate()
+    if fleet[0].history[-1] != {"x": 3.0, "y": 10.0, "t": 7.0, "c": False}:
+        success = False
+    if grid.__static_layer__.is_blocked(6, 6):
+        success = False
+    if grid.__static_layer__.get_overlaps(6, 20, 0, 1000) != [
+        (7, 1000, fleet[0].id)
+    ]:
+        success = False
+    if len(grid.__cells__.__tiles__) != 0:
+        success = False
+
+    # An entity driving into a parked entity collides with it
+    fleet[1].add_route(waypoints=[(5, 7, 4)])
+    fleet[2].add_route(waypoints=[(7, 10, 3), (3, 10, 4)])
+    grid.simulate()
+    if fleet[2].history[-1] != {"x": 4.0, "y": 10.0, "t": 13.0, "c": True}:
+        success = False
+    if fleet[0].history[-1]["c"] != True:
+        success = False
+    if fleet[1].history[-1]["c"] != False:
+        success = False
+
+    # Static entities share the static layer with parked entities, but do not collide with other static entities
+    corner = grid.add_entity(
+        StaticEntity(
+            name="corner",
+            shape=Shape.rectangle(x_len=1, y_len=1),
+            x_coord=0.5,
+            y_coord=0.5,
+        ),
+        raise_on_immediate_collision=False,
+    )
+    if grid.__queue__.get_live_count() != 0:
+        success = False
+
+    # Removing a parked entity clears its parking cells
+    grid.remove_entity(fleet[4])
+    if grid.__static_layer__.is_blocked(22, 6):
+        success = False
+except:
+    success = False
+
+if success:
+    print("test_31.py: passed")
+else:
+    print("test_31.py: failed")
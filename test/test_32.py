@@ -0,0 +1,101 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity
+from fizgrid.utils import Shape
+
+grid = Grid(
+    name="living_room",
+    x_size=10,
+    y_size=10,
+    add_exterior_walls=True,
+    cell_density=2,
+)
+
+robot = grid.add_entity(
+    Entity(
+        name="robot",
+        shape=Shape.rectangle(x_len=1, y_len=1),
+        x_coord=5,
+        y_coord=2,
+    )
+)
+
+rover = grid.add_entity(
+    Entity(
+        name="rover",
+        shape=Shape.rectangle(x_len=1, y_len=1),
+        x_coord=2,
+        y_coord=8,
+    )
+)
+
+# The rover drives across the room while the robot is checking its options
+rover.add_route(waypoints=[(8, 8, 6)])
+# A route for the robot is already scheduled for later
+robot.add_route(waypoints=[(8, 2, 3)], time=5)
+grid.resolve_next_state()
+
+
+def get_grid_state():
+    return (
+        [
+            grid.__cells__.get_reservations(x_cell, y_cell)
+            for x_cell in range(20)
+            for y_cell in range(20)
+        ],
+        [
+            grid.__static_layer__.get_overlaps(x_cell, y_cell, 0, 1000)
+            for x_cell in range(20)
+            for y_cell in range(20)
+        ],
+        grid.__queue__.__next_id__,
+        grid.__queue__.get_live_count(),
+        grid.get_reservation_stats(),
+        list(robot.history),
+        (robot.x_coord, robot.y_coord),
+    )
+
+
+success = True
+try:
+    state = get_grid_state()
+    candidates = [
+        # Drive up into the rover's path
+        [(5, 8, 4)],
+        # Drive up and wait before crossing the rover's path
+        [(5, 5, 2), (5, 5, 10), (5, 8, 2)],
+        # Drive right along the bottom wall
+        [(8, 2, 3)],
+        # Drive into the bottom wall
+        [(5, 0.5, 1)],
+    ]
+    results = robot.check_routes(waypoints_list=candidates)
+    # Checking routes should not change the grid, the queue or the robot
+    if get_grid_state() != state:
+        success = False
+    if [result["has_collision"] for result in results] != [
+        True,
+        False,
+        False,
+        True,
+    ]:
+        success = False
+    if list(results[0]["collisions"].keys()) != [rover.id]:
+        success = False
+    # A single route check should match the batch check
+    for waypoints, result in zip(candidates, results):
+        if robot.check_route(waypoints=waypoints) != result:
+            success = False
+    if get_grid_state() != state:
+        success = False
+
+    # The scheduled route should still be planned after the checks
+    grid.simulate()
+    if robot.history[-1] != {"x": 8.0, "y": 2.0, "t": 8.0, "c": False}:
+        success = False
+except:
+    success = False
+
+if success:
+    print("test_32.py: passed")
+else:
+    print("test_32.py: failed")
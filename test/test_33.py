@@ -0,0 +1,78 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity
+from fizgrid.utils import Shape
+
+
+def make_grid():
+    grid = Grid(
+        name="aisle",
+        x_size=10,
+        y_size=10,
+        add_exterior_walls=True,
+    )
+    left = grid.add_entity(
+        Entity(
+            name="left",
+            shape=Shape.rectangle(x_len=1, y_len=1),
+            x_coord=2,
+            y_coord=5,
+        )
+    )
+    right = grid.add_entity(
+        Entity(
+            name="right",
+            shape=Shape.rectangle(x_len=1, y_len=1),
+            x_coord=8,
+            y_coord=5,
+        )
+    )
+    return grid, left, right
+
+
+success = True
+try:
+    # A head on collision should be resolved by a single event for both entities
+    grid, left, right = make_grid()
+    left.add_route(waypoints=[(8, 5, 6)])
+    right.add_route(waypoints=[(2, 5, 6)])
+    grid.resolve_next_state()
+    collision_events = [
+        event
+        for event in grid.__queue__.__data__.values()
+        if event["method"] == "__resolve_collision__"
+    ]
+    if len(collision_events) != 1:
+        success = False
+    shared_ids = set(left.__future_event_ids__["system"]) & set(
+        right.__future_event_ids__["system"]
+    )
+    if len(shared_ids) != 1:
+        success = False
+    grid.simulate()
+    if left.history[-1]["c"] != True or right.history[-1]["c"] != True:
+        success = False
+    if left.history[-1]["x"] != 4.5 or right.history[-1]["x"] != 5.5:
+        success = False
+
+    # Removing either entity should cancel the collision for both
+    for removed in ["left", "right"]:
+        grid, left, right = make_grid()
+        left.add_route(waypoints=[(8, 5, 6)])
+        right.add_route(waypoints=[(2, 5, 6)])
+        grid.resolve_next_state()
+        remaining = right if removed == "left" else left
+        grid.remove_entity(left if removed == "left" else right)
+        if len(grid.__queue__.__data__) != 1:
+            success = False
+        grid.simulate()
+        if remaining.history[-1]["c"]:
+            success = False
+        if remaining.history[-1]["x"] != (2 if removed == "left" else 8):
+            success = False
+except:
+    success = False
+
+if success:
+    print("test_33.py: passed")
+else:
+    print("test_33.py: failed")
@@ -0,0 +1,95 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity, StaticEntity
+from fizgrid.utils import Shape
+import os
+
+
+def run(fast_mode):
+    grid = Grid(
+        name="warehouse",
+        x_size=20,
+        y_size=20,
+        fast_mode=fast_mode,
+    )
+    grid.add_entity(
+        StaticEntity(
+            name="rack",
+            shape=Shape.rectangle(x_len=4, y_len=1),
+            x_coord=10,
+            y_coord=10,
+        )
+    )
+    amrs = [
+        grid.add_entity(
+            Entity(
+                name=f"AMR{idx}",
+                shape=Shape.rectangle(x_len=1, y_len=1),
+                x_coord=3 + idx * 3,
+                y_coord=3,
+                auto_rotate=idx % 2 == 0,
+            )
+        )
+        for idx in range(5)
+    ]
+    for amr in amrs:
+        amr.add_route(waypoints=[(amr.x_coord, 15, 6), (10, 15, 4)])
+    grid.simulate()
+    return grid, amrs
+
+
+success = True
+try:
+    # Fast mode should not change the simulation results
+    grid, amrs = run(fast_mode=False)
+    fast_grid, fast_amrs = run(fast_mode=True)
+    if grid.__fast_mode__ or not fast_grid.__fast_mode__:
+        success = False
+    for amr, fast_amr in zip(amrs, fast_amrs):
+        if amr.history != fast_amr.history:
+            success = False
+
+    # Public methods should still be type checked in fast mode
+    try:
+        fast_amrs[0].add_route(waypoints="not a route")
+        success = False
+    except TypeError:
+        pass
+
+    # Internal methods should not be type checked in fast mode
+    try:
+        fast_grid.add_event(
+            time=50, object=fast_grid, method="get_time", priority=1.0
+        )
+    except TypeError:
+        success = False
+    try:
+        grid.add_event(time=50, object=grid, method="get_time", priority=1.0)
+        success = False
+    except TypeError:
+        pass
+
+    # All fast grids should share the unchecked Shape class
+    if fast_grid.__shape_utils__ is not run(fast_mode=True)[0].__shape_utils__:
+        success = False
+
+    # Unchecked methods should be removed when an entity leaves a fast grid
+    fast_grid.remove_entity(fast_amrs[0])
+    if "__plan_route__" in fast_amrs[0].__dict__:
+        success = False
+
+    # The environment variable should set the default
+    os.environ["FIZGRID_FAST_MODE"] = "1"
+    if not Grid(name="env", x_size=5, y_size=5).__fast_mode__:
+        success = False
+    if Grid(name="env", x_size=5, y_size=5, fast_mode=False).__fast_mode__:
+        success = False
+    os.environ.pop("FIZGRID_FAST_MODE")
+    if Grid(name="env", x_size=5, y_size=5).__fast_mode__:
+        success = False
+except:
+    success = False
+
+if success:
+    print("test_34.py: passed")
+else:
+    print("test_34.py: failed")
@@ -0,0 +1,88 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity
+from fizgrid.utils import Shape, IDAllocator
+
+
+def run(recycle_block_ids=True):
+    grid = Grid(
+        name="aisle",
+        x_size=20,
+        y_size=10,
+        recycle_block_ids=recycle_block_ids,
+    )
+    amrs = [
+        grid.add_entity(
+            Entity(
+                name=f"AMR{idx}",
+                shape=Shape.rectangle(x_len=1, y_len=1),
+                x_coord=3 + idx * 4,
+                y_coord=2,
+            )
+        )
+        for idx in range(3)
+    ]
+    for leg in range(5):
+        for amr in amrs:
+            amr.add_route(
+                waypoints=[(amr.x_coord, 8 if leg % 2 == 0 else 2, 3)]
+            )
+        grid.simulate()
+    return grid, amrs
+
+
+success = True
+try:
+    allocator = IDAllocator()
+    if [allocator(), allocator(), allocator()] != [0, 1, 2]:
+        success = False
+    allocator.release(1)
+    if allocator() != 3:
+        success = False
+    allocator = IDAllocator(recycle=True)
+    ids = [allocator(), allocator(), allocator()]
+    allocator.release(ids[0])
+    if allocator() != ids[0] or allocator() != 3:
+        success = False
+    if allocator.get_capacity() != 4:
+        success = False
+
+    # Entity ids should be integers allocated by each grid so they do not depend on earlier grids
+    if (
+        Entity(
+            name="free",
+            shape=Shape.rectangle(x_len=1, y_len=1),
+            x_coord=1,
+            y_coord=1,
+        ).id
+        is not None
+    ):
+        success = False
+    grid_1, amrs_1 = run()
+    grid_2, amrs_2 = run()
+    if [amr.id for amr in amrs_1] != [amr.id for amr in amrs_2]:
+        success = False
+    # The exterior walls are added first
+    if [amr.id for amr in amrs_1] != [4, 5, 6]:
+        success = False
+    if list(grid_1.__entities__.keys()) != list(range(7)):
+        success = False
+
+    # Recycled block ids should stay bounded by the live reservations
+    grid_3, amrs_3 = run(recycle_block_ids=False)
+    for amr_1, amr_3 in zip(amrs_1, amrs_3):
+        if amr_1.history != amr_3.history:
+            success = False
+    recycled_capacity = grid_1.__cells__.__block_ids__.get_capacity()
+    capacity = grid_3.__cells__.__block_ids__.get_capacity()
+    if recycled_capacity >= capacity:
+        success = False
+    # All reservations are released once the AMRs park
+    if sum(len(amr.__blocked_grid_cells__) for amr in amrs_1) != 0:
+        success = False
+except:
+    success = False
+
+if success:
+    print("test_35.py: passed")
+else:
+    print("test_35.py: failed")
@@ -0,0 +1,117 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity
+from fizgrid.utils import Shape
+
+
+def build():
+    grid = Grid(
+        name="floor",
+        x_size=20,
+        y_size=20,
+        max_time=1000,
+    )
+    amrs = [
+        grid.add_entity(
+            Entity(
+                name=f"AMR{idx}",
+                shape=Shape.rectangle(x_len=1, y_len=1),
+                x_coord=3 + idx * 3,
+                y_coord=3,
+            )
+        )
+        for idx in range(4)
+    ]
+    for idx, amr in enumerate(amrs):
+        amr.add_route(
+            waypoints=[(amr.x_coord, 15, 6), (10, 15, 4), (10, 3, 6)],
+            time=idx,
+        )
+    return grid, amrs
+
+
+success = True
+try:
+    grid, amrs = build()
+    total_events = grid.simulate()
+    full_histories = [list(amr.history) for amr in amrs]
+    stats = grid.get_simulation_stats()
+    if stats["events"] != total_events or stats["batches"] == 0:
+        success = False
+    if stats["sim_time"] != grid.get_time():
+        success = False
+    if stats["wall_time"] <= 0 or stats["events_per_second"] <= 0:
+        success = False
+
+    # Running in time slices should give the same results as a single run
+    grid, amrs = build()
+    for until in [2, 5.5, 8, 20]:
+        grid.simulate(until=until)
+        if grid.get_time() != until:
+            success = False
+        if grid.__queue__.get_next_time() is not None:
+            if grid.__queue__.get_next_time() <= until:
+                success = False
+    if [list(amr.history) for amr in amrs] != full_histories:
+        success = False
+    if grid.get_simulation_stats()["events"] != total_events:
+        success = False
+
+    # Running with an event budget should give the same results as a single run
+    grid, amrs = build()
+    processed = 0
+    while True:
+        events = grid.simulate(max_events=3)
+        if events == 0:
+            break
+        processed += events
+    if processed != total_events:
+        success = False
+    if [list(amr.history) for amr in amrs] != full_histories:
+        success = False
+
+    # The generator should process one batch at a time and allow new routes between batches
+    grid, amrs = build()
+    steps = grid.simulate_steps(until=10)
+    first_batch = next(steps)
+    if first_batch[0]["time"] != 0 or grid.get_time() != 0:
+        success = False
+    batch_times = [batch[0]["time"] for batch in steps]
+    if batch_times != sorted(set(batch_times)) or batch_times[-1] > 10:
+        success = False
+    if grid.get_time() != 10:
+        success = False
+    # Entities can be given new routes from the new current time
+    amrs[0].add_route(waypoints=[(3, 8, 5)])
+    grid.simulate()
+    if amrs[0].history[-1] != {"x": 3.0, "y": 8.0, "t": 15.0, "c": False}:
+        success = False
+
+    # Simulation should dispatch through an overridden resolve_next_state
+    class CountingGrid(Grid):
+        def resolve_next_state(self):
+            event_items = super().resolve_next_state()
+            self.resolved_events = getattr(self, "resolved_events", 0) + len(
+                event_items
+            )
+            return event_items
+
+    grid = CountingGrid(name="floor", x_size=20, y_size=20, max_time=1000)
+    amr = grid.add_entity(
+        Entity(
+            name="AMR",
+            shape=Shape.rectangle(x_len=1, y_len=1),
+            x_coord=3,
+            y_coord=3,
+        )
+    )
+    amr.add_route(waypoints=[(3, 15, 6)])
+    events = grid.simulate()
+    if events == 0 or grid.resolved_events != events:
+        success = False
+except:
+    success = False
+
+if success:
+    print("test_36.py: passed")
+else:
+    print("test_36.py: failed")
@@ -0,0 +1,101 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity, StaticEntity
+from fizgrid.utils import Shape
+
+
+def build(cell_store, fast_mode):
+    grid = Grid(
+        name="floor",
+        x_size=20,
+        y_size=20,
+        max_time=1000,
+        cell_store=cell_store,
+        fast_mode=fast_mode,
+    )
+    grid.add_entity(
+        StaticEntity(
+            name="rack",
+            shape=Shape.rectangle(x_len=4, y_len=1),
+            x_coord=10,
+            y_coord=10,
+        )
+    )
+    amrs = [
+        grid.add_entity(
+            Entity(
+                name=f"AMR{idx}",
+                shape=Shape.rectangle(x_len=1, y_len=1),
+                x_coord=3 + idx * 3,
+                y_coord=3,
+            )
+        )
+        for idx in range(4)
+    ]
+    for idx, amr in enumerate(amrs):
+        amr.add_route(
+            waypoints=[(amr.x_coord, 15, 6), (10, 15, 4), (10, 3, 6)],
+            time=idx,
+        )
+    return grid, amrs
+
+
+success = True
+try:
+    for cell_store in ["dict", "array"]:
+        for fast_mode in [False, True]:
+            grid, amrs = build(cell_store, fast_mode)
+            grid.simulate()
+            full_histories = [list(amr.history) for amr in amrs]
+
+            # A fork and its parent should both continue exactly like an unforked grid
+            grid, amrs = build(cell_store, fast_mode)
+            grid.simulate(until=5)
+            forked = grid.fork()
+            forked_amrs = [forked.get_entity(amr.id) for amr in amrs]
+            if any(a is b for a, b in zip(amrs, forked_amrs)):
+                success = False
+            if forked_amrs[0].__grid__ is not forked:
+                success = False
+            forked.simulate()
+            grid.simulate()
+            if [list(amr.history) for amr in amrs] != full_histories:
+                success = False
+            if [list(amr.history) for amr in forked_amrs] != full_histories:
+                success = False
+
+            # Changes to a fork should not affect its parent
+            grid, amrs = build(cell_store, fast_mode)
+            grid.simulate(until=5)
+            reservations = grid.get_reservation_stats()
+            forked = grid.fork()
+            forked_amr = forked.get_entity(amrs[0].id)
+            forked_amr.cancel_route()
+            forked.simulate(until=5)
+            forked_amr.add_route(waypoints=[(forked_amr.x_coord, 8, 2)])
+            forked.simulate()
+            if forked_amr.history[-1] != {
+                "x": 3.0,
+                "y": 8.0,
+                "t": 7.0,
+                "c": False,
+            }:
+                success = False
+            if grid.get_reservation_stats() != reservations:
+                success = False
+            # Forks of forks should also be independent
+            nested = grid.fork().fork()
+            nested.simulate()
+            grid.simulate()
+            if [list(amr.history) for amr in amrs] != full_histories:
+                success = False
+            if [
+                list(nested.get_entity(amr.id).history) for amr in amrs
+            ] != full_histories:
+                success = False
+except:
+    success = False
+
+if success:
+    print("test_37.py: passed")
+else:
+    print("test_37.py: failed")
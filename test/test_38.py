@@ -0,0 +1,134 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity
+from fizgrid.utils import Shape
+from fizgrid.helpers.replication import run_replications, run_replication
+import random
+
+
+class AMR(Entity):
+    def __init__(self, *args, legs, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.legs = legs
+        self.last_route_time = None
+
+    def on_realize(self, **kwargs):
+        # Collisions on both sides of a pair can realize an entity twice at the same time
+        if self.legs > 0 and self.last_route_time != self.get_time():
+            self.legs -= 1
+            self.last_route_time = self.get_time()
+            self.add_route(
+                waypoints=[
+                    (
+                        random.uniform(2, 18),
+                        random.uniform(2, 18),
+                        random.uniform(2, 6),
+                    )
+                ]
+            )
+
+
+def scenario():
+    grid = Grid(name="floor", x_size=20, y_size=20, max_time=1000)
+    for idx in range(4):
+        grid.add_entity(
+            AMR(
+                name=f"AMR{idx}",
+                shape=Shape.rectangle(x_len=1, y_len=1),
+                x_coord=4 + idx * 4,
+                y_coord=10,
+                legs=5,
+            )
+        ).on_realize()
+    return grid
+
+
+def summarize(grid):
+    return {
+        "legs_left": sum(
+            entity.legs
+            for entity in grid.__entities__.values()
+            if isinstance(entity, AMR)
+        )
+    }
+
+
+if __name__ == "__main__":
+    success = True
+    try:
+        results = run_replications(
+            scenario=scenario,
+            replications=6,
+            seed=3,
+            summarize=summarize,
+            max_workers=2,
+        )
+        serial_results = run_replications(
+            scenario=scenario,
+            replications=6,
+            seed=3,
+            summarize=summarize,
+            max_workers=1,
+        )
+        # Results should only depend on the seed and not on the number of workers
+        if results != serial_results:
+            success = False
+        replications = results["replications"]
+        if len(replications) != 6:
+            success = False
+        # Each replication gets its own seed
+        if (
+            len({replication["grid"]["seed"] for replication in replications})
+            != 6
+        ):
+            success = False
+        if (
+            len(
+                {
+                    replication["grid"]["distance"]
+                    for replication in replications
+                }
+            )
+            < 2
+        ):
+            success = False
+        # A replication can be repeated from its seed
+        repeated = run_replication(
+            scenario=scenario,
+            seed=replications[2]["grid"]["seed"],
+            summarize=summarize,
+        )
+        if repeated != replications[2]:
+            success = False
+        # Static walls are left out and entity statistics are keyed by id
+        if replications[0]["grid"]["entities"] != 4:
+            success = False
+        entity_stats = replications[0]["entities"]
+        if [stats["name"] for stats in entity_stats.values()] != [
+            f"AMR{idx}" for idx in range(4)
+        ]:
+            success = False
+        if replications[0]["grid"]["legs_left"] not in range(20):
+            success = False
+        # The summary aggregates numeric statistics over the replications
+        summary = results["summary"]
+        distances = [
+            replication["grid"]["distance"] for replication in replications
+        ]
+        if summary["grid"]["distance"]["max"] != max(distances):
+            success = False
+        if abs(summary["grid"]["distance"]["mean"] - sum(distances) / 6) > 1e-9:
+            success = False
+        if "seed" in summary["grid"] or "legs_left" not in summary["grid"]:
+            success = False
+        first_id = list(entity_stats.keys())[0]
+        if summary["entities"][first_id]["name"] != "AMR0":
+            success = False
+        if "x" not in summary["entities"][first_id]:
+            success = False
+    except:
+        success = False
+
+    if success:
+        print("test_38.py: passed")
+    else:
+        print("test_38.py: failed")
@@ -0,0 +1,112 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity, StaticEntity
+from fizgrid.utils import Shape
+from fizgrid.helpers.planning import space_time_astar, compress_waypoints
+
+success = True
+try:
+    if compress_waypoints(
+        start_x=0,
+        start_y=0,
+        waypoints=[(1, 0, 1), (2, 0, 1), (2, 0, 1), (2, 0, 2), (2, 1, 1)],
+    ) != [(2, 0, 2), (2, 0, 3), (2, 1, 1)]:
+        success = False
+
+    grid = Grid(name="floor", x_size=20, y_size=20, max_time=1000)
+    grid.add_entity(
+        StaticEntity(
+            name="rack",
+            shape=Shape.rectangle(x_len=1, y_len=12),
+            x_coord=10.5,
+            y_coord=8,
+        )
+    )
+    amr = grid.add_entity(
+        Entity(
+            name="AMR",
+            shape=Shape.rectangle(x_len=1, y_len=1),
+            x_coord=3,
+            y_coord=5,
+        )
+    )
+    crossing = grid.add_entity(
+        Entity(
+            name="crossing",
+            shape=Shape.rectangle(x_len=1, y_len=1),
+            x_coord=17,
+            y_coord=16,
+        )
+    )
+    crossing.add_route(waypoints=[(3, 16, 14)])
+    grid.simulate(until=0)
+    # The planned route should go around the rack and avoid the crossing AMR
+    waypoints = space_time_astar(entity=amr, x_coord=17, y_coord=5.5, speed=1)
+    if amr.check_route(waypoints=waypoints)["has_collision"]:
+        success = False
+    if waypoints[-1][:2] != (17, 5.5):
+        success = False
+    # Waypoints should be merged into straight moves
+    if len(waypoints) > 8:
+        success = False
+    amr.add_route(waypoints=waypoints)
+    grid.simulate()
+    if amr.history[-1]["x"] != 17 or amr.history[-1]["y"] != 5.5:
+        success = False
+    if any(entry["c"] for entry in amr.history) or any(
+        entry["c"] for entry in crossing.history
+    ):
+        success = False
+    # Routes are not planned for entities that are in a route
+    amr.add_route(waypoints=[(17, 8, 3)])
+    grid.simulate(until=grid.get_time())
+    try:
+        space_time_astar(entity=amr, x_coord=3, y_coord=3, speed=1)
+        success = False
+    except Exception:
+        pass
+
+    # AMRs that plan one after another should not collide when their routes cross
+    grid = Grid(name="crossing", x_size=20, y_size=20, max_time=1000)
+    amrs = [
+        grid.add_entity(
+            Entity(
+                name=f"AMR{idx}",
+                shape=Shape.rectangle(x_len=1, y_len=1),
+                x_coord=x_coord,
+                y_coord=y_coord,
+            )
+        )
+        for idx, (x_coord, y_coord) in enumerate(
+            [(3, 10), (17, 10), (10, 3), (10, 17)]
+        )
+    ]
+    goals = [(17, 12), (3, 8), (12, 17), (8, 3)]
+    for amr, (x_coord, y_coord) in zip(amrs, goals):
+        waypoints = space_time_astar(
+            entity=amr, x_coord=x_coord, y_coord=y_coord, speed=1
+        )
+        amr.add_route(waypoints=waypoints)
+        # Plan the route now so the next AMR sees its reservations
+        grid.simulate(until=grid.get_time())
+    grid.simulate()
+    for amr, (x_coord, y_coord) in zip(amrs, goals):
+        if (amr.x_coord, amr.y_coord) != (x_coord, y_coord):
+            success = False
+        if any(entry["c"] for entry in amr.history):
+            success = False
+
+    # Goals that are blocked until the end of the simulation are unreachable
+    if (
+        space_time_astar(
+            entity=amrs[0], x_coord=3, y_coord=8, speed=1, max_expansions=500
+        )
+        is not None
+    ):
+        success = False
+except:
+    success = False
+
+if success:
+    print("test_40.py: passed")
+else:
+    print("test_40.py: failed")
@@ -0,0 +1,125 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity, StaticEntity
+from fizgrid.cells import SafeIntervalIndex
+from fizgrid.utils import Shape
+
+
+class AMR(Entity):
+    def __init__(self, *args, legs, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.legs = legs
+        self.last_route_time = None
+
+    def on_realize(self, **kwargs):
+        # Collisions on both sides of a pair can realize an entity twice at the same time
+        if self.legs > 0 and self.last_route_time != self.get_time():
+            self.legs -= 1
+            self.last_route_time = self.get_time()
+            self.add_route(
+                waypoints=[(self.x_coord, 13 if self.y_coord < 8 else 3, 5)]
+            )
+
+
+def is_consistent(grid):
+    # Cached safe intervals should match safe intervals computed from scratch
+    fresh = SafeIntervalIndex(
+        cells=grid.__cells__, static_layer=grid.__static_layer__
+    )
+    for x_cell in range(grid.__x_size__):
+        for y_cell in range(grid.__y_size__):
+            if grid.get_safe_intervals(
+                x_cell, y_cell
+            ) != fresh.get_safe_intervals(x_cell, y_cell):
+                return False
+    return True
+
+
+success = True
+try:
+    for cell_store in ["dict", "array"]:
+        grid = Grid(
+            name="aisle",
+            x_size=12,
+            y_size=16,
+            max_time=200,
+            cell_store=cell_store,
+        )
+        rack = grid.add_entity(
+            StaticEntity(
+                name="rack",
+                shape=Shape.rectangle(x_len=1, y_len=2),
+                x_coord=10,
+                y_coord=8,
+            )
+        )
+        amr = grid.add_entity(
+            AMR(
+                name="AMR0",
+                shape=Shape.rectangle(x_len=1, y_len=1),
+                x_coord=3,
+                y_coord=3,
+                legs=0,
+            )
+        )
+        # Static and parked entities block their cells until the end of the simulation
+        if (
+            grid.get_safe_intervals(10, 8) != []
+            or grid.get_safe_intervals(3, 3) != [(0, 0)][:0]
+        ):
+            success = False
+        if grid.get_safe_intervals(5, 5) != [(0, 200)]:
+            success = False
+        amr.add_route(waypoints=[(3, 9, 6)])
+        grid.simulate(until=0)
+        # The route blocks the cells it passes through while the AMR is in them
+        intervals = grid.get_safe_intervals(3, 6)
+        if (
+            len(intervals) != 2
+            or intervals[0][0] != 0
+            or intervals[-1][1] != 200
+        ):
+            success = False
+        index = grid.__safe_intervals__
+        if index.get_safe_interval(3, 6, 0) != intervals[0]:
+            success = False
+        if index.get_safe_interval(3, 6, intervals[0][1]) is not None:
+            success = False
+        if index.get_safe_interval(3, 6, 100) != intervals[-1]:
+            success = False
+        # The AMR parks where its route ends
+        if grid.get_safe_intervals(3, 9) != [(0, 5.5)]:
+            success = False
+
+        # Cached safe intervals should stay consistent as AMRs replan, collide and park
+        for idx, (x_coord, y_coord) in enumerate(
+            [(5, 3), (5, 13), (7, 3), (7, 13), (9, 3)]
+        ):
+            grid.add_entity(
+                AMR(
+                    name=f"AMR{idx + 1}",
+                    shape=Shape.rectangle(x_len=1, y_len=1),
+                    x_coord=x_coord,
+                    y_coord=y_coord,
+                    legs=4,
+                )
+            ).on_realize()
+        for until in [0, 3, 7, 12, 20, 40, 200]:
+            grid.simulate(until=until)
+            if not is_consistent(grid):
+                success = False
+        # Forks should have their own safe intervals
+        forked = grid.fork()
+        forked.remove_entity(forked.get_entity(rack.id))
+        if forked.get_safe_intervals(10, 8) != [(0, 200)]:
+            success = False
+        if grid.get_safe_intervals(10, 8) != []:
+            success = False
+        if not is_consistent(forked) or not is_consistent(grid):
+            success = False
+except:
+    success = False
+
+if success:
+    print("test_41.py: passed")
+else:
+    print("test_41.py: failed")
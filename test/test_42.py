@@ -0,0 +1,83 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity
+from fizgrid.utils import Shape
+
+success = True
+try:
+    for cell_store in ["dict", "array"]:
+        grid = Grid(
+            name="induction",
+            x_size=10,
+            y_size=10,
+            max_time=1000,
+            cell_store=cell_store,
+        )
+        amr = grid.add_entity(
+            Entity(
+                name="AMR",
+                shape=Shape.rectangle(x_len=1, y_len=1),
+                x_coord=2,
+                y_coord=5,
+            )
+        )
+        amr.add_route(waypoints=[(8, 5, 6)])
+        grid.simulate(until=0)
+
+        # The footprint of the tote is free from the time the AMR has passed
+        footprint = [(2, 4), (2, 5), (3, 4), (3, 5)]
+        if grid.__safe_intervals__.get_earliest_safe_time(footprint, 0) != 2.5:
+            success = False
+        # All cells must be free at the same time
+        if (
+            grid.__safe_intervals__.get_earliest_safe_time([(2, 5), (3, 5)], 0)
+            != 2.5
+        ):
+            success = False
+        # The AMR parks at its goal until the end of the simulation
+        if (
+            grid.__safe_intervals__.get_earliest_safe_time([(8, 5)], 10)
+            is not None
+        ):
+            success = False
+
+        # Safe create places the tote as soon as the AMR has passed instead of after the increment
+        tote = grid.add_entity(
+            Entity(
+                name="tote",
+                shape=Shape.rectangle(x_len=1, y_len=1),
+                x_coord=3,
+                y_coord=5,
+            ),
+            safe_create=True,
+            safe_create_increment=10,
+        )
+        # Safe create on top of the parked AMR falls back to the increment until the AMR leaves at time 20
+        blocked_tote = grid.add_entity(
+            Entity(
+                name="blocked_tote",
+                shape=Shape.rectangle(x_len=1, y_len=1),
+                x_coord=8,
+                y_coord=5,
+            ),
+            time=7,
+            safe_create=True,
+            safe_create_increment=5,
+        )
+        amr.add_route(waypoints=[(8, 2, 3)], time=20)
+        grid.simulate()
+
+        if list(tote.history) != [{"x": 3.0, "y": 5.0, "t": 2.5, "c": False}]:
+            success = False
+        if list(blocked_tote.history) != [
+            {"x": 8.0, "y": 5.0, "t": 22.0, "c": False}
+        ]:
+            success = False
+        if any(record["c"] for record in amr.history):
+            success = False
+except:
+    success = False
+
+if success:
+    print("test_42.py: passed")
+else:
+    print("test_42.py: failed")
@@ -0,0 +1,56 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity
+from fizgrid.utils import Shape
+
+success = True
+try:
+    for cell_store in ["dict", "array"]:
+        grid = Grid(
+            name="edge",
+            x_size=10,
+            y_size=10,
+            max_time=1000,
+            add_exterior_walls=False,
+            cell_store=cell_store,
+        )
+        mover = grid.add_entity(
+            Entity(
+                name="mover",
+                shape=Shape.rectangle(x_len=1, y_len=1),
+                x_coord=9.5,
+                y_coord=0.5,
+            )
+        )
+        mover.add_route(waypoints=[(9.5, 9.5, 9)])
+        grid.simulate(until=2)
+
+        # The footprint of this entity hangs over the left edge of the grid at x=-1
+        # Cell (-1, 4) must not alias onto cell (9, 3) that the mover is passing through
+        edge = grid.add_entity(
+            Entity(
+                name="edge",
+                shape=Shape.rectangle(x_len=1.4, y_len=1.4),
+                x_coord=0.5,
+                y_coord=4.5,
+            ),
+            time=2,
+            raise_on_immediate_collision=True,
+        )
+        if grid.__cells__.get_overlaps(-1, 4, 0, 1000) != []:
+            success = False
+        if grid.__cells__.get_reservations(10, 3) != []:
+            success = False
+        if grid.__cells__.is_occupied(-1, 4, 2):
+            success = False
+        grid.simulate()
+        if any(
+            record["c"] for record in list(mover.history) + list(edge.history)
+        ):
+            success = False
+except:
+    success = False
+
+if success:
+    print("test_43.py: passed")
+else:
+    print("test_43.py: failed")
@@ -0,0 +1,108 @@
+from fizgrid.grid import Grid
+from fizgrid.entities import Entity, StaticEntity
+from fizgrid.utils import Shape
+import random, math
+
+# Many AMRs random walk around racks and collide with each other and the racks at the same times.
+# The order of same time collision events decides which entity is stopped first, so the history of each AMR is compared
+# with a reference from the previous implementation that stored the reservations of each cell in a dictionary.
+# Each reference entry is (records, collisions, x, y, t) where x, y and t are from the last record.
+REFERENCE = [
+    (4, 2, 3.5, 4.0282, 0.5008),
+    (4, 2, 5.4315, 4.4961, 0.5008),
+    (8, 3, 7.113, 5.5, 5.1532),
+    (4, 2, 10.9871, 4.1159, 0.5007),
+    (4, 2, 12.5, 4.0273, 0.5007),
+    (8, 4, 15.2752, 4.3544, 1.6558),
+    (6, 2, 16.5, 4.6874, 1.6558),
+    (6, 2, 18.7031, 4.5, 1.9902),
+    (5, 1, 5.5, 5.798, 5.1532),
+    (4, 2, 6.5, 8.5976, 1.8848),
+    (8, 2, 7.5298, 6.5261, 1.8502),
+    (5, 1, 10.0607, 6.762, 2.454),
+    (10, 6, 13.5, 6.1149, 1.0789),
+    (8, 3, 14.5, 6.8877, 1.0789),
+    (5, 0, 18.8637, 7.6216, 3.1408),
+    (6, 2, 19.3259, 5.7279, 1.9902),
+]
+
+
+class AMR(Entity):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.last_route_time = None
+
+    def on_realize(self, **kwargs):
+        # Both sides of a collision can realize an entity at the same time, so only route once per time
+        if self.get_time() >= 2 or self.last_route_time == self.get_time():
+            return
+        self.last_route_time = self.get_time()
+        goal_x = random.uniform(3, 19)
+        goal_y = random.uniform(3, 19)
+        goal_angle_rad = math.atan2(
+            goal_y - self.y_coord, goal_x - self.x_coord
+        )
+        random_angle = goal_angle_rad + random.normalvariate(0, 1)
+        distance = random.uniform(0.5, 4)
+        x_coord = min(
+            max(self.x_coord + distance * math.cos(random_angle), 2), 20
+        )
+        y_coord = min(
+            max(self.y_coord + distance * math.sin(random_angle), 2), 20
+        )
+        distance = (
+            (x_coord - self.x_coord) ** 2 + (y_coord - self.y_coord) ** 2
+        ) ** 0.5
+        if distance == 0:
+            return
+        self.add_route(waypoints=[(x_coord, y_coord, distance)])
+
+
+success = True
+try:
+    for cell_store in ["dict", "array"]:
+        random.seed(101)
+        grid = Grid(name="floor", x_size=22, y_size=22, cell_store=cell_store)
+        for idx in range(4):
+            grid.add_entity(
+                StaticEntity(
+                    name=f"Rack{idx}",
+                    shape=Shape.rectangle(x_len=1, y_len=4),
+                    x_coord=4 + idx * 4,
+                    y_coord=11,
+                )
+            )
+        amrs = []
+        for idx in range(16):
+            amrs.append(
+                grid.add_entity(
+                    AMR(
+                        name=f"AMR{idx}",
+                        shape=Shape.rectangle(x_len=1, y_len=1),
+                        x_coord=3 + (idx % 8) * 2.5,
+                        y_coord=4 + (idx // 8) * 3,
+                    )
+                )
+            )
+        grid.simulate()
+        summary = []
+        for amr in amrs:
+            history = list(amr.history)
+            summary.append(
+                (
+                    len(history),
+                    sum(record["c"] for record in history),
+                    round(history[-1]["x"], 4),
+                    round(history[-1]["y"], 4),
+                    round(history[-1]["t"], 4),
+                )
+            )
+        if summary != REFERENCE:
+            success = False
+except:
+    success = False
+
+if success:
+    print("test_44.py: passed")
+else:
+    print("test_44.py: failed")
@@ -0,0 +1,6 @@
+#!/bin/bash
+python --version
+for file in ./benchmarks/*.py; do
+    [ -e "$file" ] || continue  # Skip if no files match
+    python "$file"
+done